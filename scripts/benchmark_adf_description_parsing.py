@@ -0,0 +1,69 @@
+"""
+Compares the single-pass ADF walker used by JiraDescriptionMapper.to_domain with the former
+flatten-and-regex parsing on large generated descriptions.
+
+    python scripts/benchmark_adf_description_parsing.py [--blocks 2000] [--repeat 20]
+"""
+import argparse
+import logging
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_description_mapper import (  # noqa: E402
+    JiraDescriptionMapper,
+)
+
+
+def build_document(blocks: int, config_in_code_block: bool) -> dict:
+    content = []
+    for index in range(blocks):
+        content.append({"type": "paragraph", "content": [{"type": "text", "text": f"Requirement {index}: " + "lorem ipsum " * 8}]})
+        if index % 10 == 0:
+            content.append({"type": "bulletList", "content": [
+                {"type": "listItem", "content": [{"type": "paragraph", "content": [{"type": "text", "text": f"Detail {index}"}]}]}
+            ]})
+    yaml_text = "version: '1.0'\ntarget:\n  gitlab_project_id: 999\n"
+    if config_in_code_block:
+        content.append({"type": "codeBlock", "attrs": {"language": "yaml"}, "content": [{"type": "text", "text": yaml_text}]})
+    else:
+        content.append({"type": "paragraph", "content": [{"type": "text", "text": f"```yaml\n{yaml_text}```"}]})
+    return {"version": 1, "type": "doc", "content": content}
+
+
+def legacy_to_domain(mapper: JiraDescriptionMapper, document: dict) -> str:
+    """The former strategy: join the direct text of each top-level node, then regex the whole text."""
+    parts = []
+    for node in document.get("content", []):
+        if "content" in node:
+            text = "".join([chunk.get("text", "") for chunk in node.get("content", []) if chunk.get("type") == "text"])
+            if text:
+                parts.append(text)
+    text = "\n\n".join(parts)
+    match = mapper.CODE_BLOCK_PATTERN.search(text)
+    if match:
+        mapper._parse_config(match.group(1))
+        return text.replace(match.group(0), "").strip()
+    return text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    mapper = JiraDescriptionMapper()
+    for label, in_code_block in (("YAML codeBlock", True), ("plain-text fence", False)):
+        document = build_document(args.blocks, in_code_block)
+        # Best of five rounds: the least disturbed by the rest of the machine
+        legacy = min(timeit.repeat(lambda document=document: legacy_to_domain(mapper, document), number=args.repeat, repeat=5)) / args.repeat
+        walker = min(timeit.repeat(lambda document=document: mapper.to_domain(document), number=args.repeat, repeat=5)) / args.repeat
+        print(f"{label:<18} blocks={args.blocks:<6} legacy={legacy * 1000:8.2f} ms  walker={walker * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
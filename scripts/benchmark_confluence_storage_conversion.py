@@ -0,0 +1,78 @@
+"""
+Compares the single-pass ConfluenceStorageMapper.to_markdown with the former parse-then-sanitize
+text extraction on real-sized Confluence storage pages.
+
+    python scripts/benchmark_confluence_storage_conversion.py [--sections 400] [--repeat 5]
+"""
+import argparse
+import html
+import re
+import sys
+import timeit
+from html.parser import HTMLParser
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from software_factory_poc.infrastructure.providers.research.mappers.confluence_storage_mapper import (  # noqa: E402
+    ConfluenceStorageMapper,
+)
+
+
+def build_page(sections: int) -> str:
+    """A storage-format body shaped like our real architecture pages (~630 bytes per section)."""
+    return "".join(
+        f"<h2>Sección {i}</h2>"
+        f"<p>El servicio <strong>orders-{i}</strong> expone   una API REST &amp; publica eventos.\n"
+        f"Las capas siguen Clean Architecture.</p>"
+        "<ul><li>Dominio sin I/O</li><li>Infraestructura<ul><li>Adaptadores</li></ul></li></ul>"
+        "<table><tbody><tr><th>Capa</th><th>Regla</th></tr>"
+        "<tr><td><p>Dominio</p></td><td>Sin dependencias</td></tr></tbody></table>"
+        '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python</ac:parameter>'
+        f"<ac:plain-text-body><![CDATA[class Order{i}:\n    total = 1 < 2]]></ac:plain-text-body>"
+        "</ac:structured-macro>"
+        for i in range(sections)
+    )
+
+
+class LegacyHTMLParser(HTMLParser):
+    """The former extraction parser: raw text with newline and cell markers."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.text_parts: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ["br", "p", "div", "tr"]:
+            self.text_parts.append("\n")
+        elif tag in ["td", "th"]:
+            self.text_parts.append(" | ")
+
+    def handle_data(self, data):
+        self.text_parts.append(data)
+
+
+def legacy_extract_text(storage: str) -> str:
+    """The former strategy: parse, then regex-strip tags, unescape and collapse whitespace again."""
+    parser = LegacyHTMLParser()
+    parser.feed(storage)
+    text = re.sub(r"<[^>]+>", " ", "".join(parser.text_parts).strip())
+    return " ".join(html.unescape(text).split())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sections", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for sections in sorted({max(1, args.sections // 4), args.sections, args.sections * 4}):
+        storage = build_page(sections)
+        # Best of five rounds: the least disturbed by the rest of the machine
+        legacy = min(timeit.repeat(lambda storage=storage: legacy_extract_text(storage), number=args.repeat, repeat=5)) / args.repeat
+        single = min(timeit.repeat(lambda storage=storage: ConfluenceStorageMapper.to_markdown(storage), number=args.repeat, repeat=5)) / args.repeat
+        print(f"{len(storage) // 1024:>6} KB  legacy={legacy * 1000:8.2f} ms  single-pass={single * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import List, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any
 
 from software_factory_poc.application.core.agents.base_agent import BaseAgent
 from software_factory_poc.application.core.agents.code_reviewer.config.code_reviewer_agent_config import (
@@ -9,11 +9,16 @@ from software_factory_poc.application.core.agents.code_reviewer.tools.code_revie
     CodeReviewPromptBuilder,
 )
 from software_factory_poc.application.core.agents.code_reviewer.tools.review_result_parser import ReviewResultParser
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
 from software_factory_poc.application.core.agents.common.dtos.file_changes_dto import FileChangesDTO
 from software_factory_poc.application.core.agents.common.dtos.file_content_dto import FileContentDTO
+from software_factory_poc.application.core.agents.common.exceptions.flow_failed_error import FlowFailedError
+from software_factory_poc.application.core.agents.common.ports.run_phase_tracker import RunPhaseTracker
+from software_factory_poc.application.core.agents.common.tools.null_run_phase_tracker import NullRunPhaseTracker
 from software_factory_poc.application.core.agents.reasoner.reasoner_agent import ReasonerAgent
 from software_factory_poc.application.core.agents.reporter.reporter_agent import ReporterAgent
 from software_factory_poc.application.core.agents.research.research_agent import ResearchAgent
+from software_factory_poc.application.core.agents.research.value_objects.research_layer import ResearchLayer
 from software_factory_poc.application.core.agents.vcs.vcs_agent import VcsAgent
 from software_factory_poc.application.core.domain.entities.task import Task
 from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
@@ -34,6 +39,7 @@ class CodeReviewerAgent(BaseAgent):
         vcs: VcsAgent,
         researcher: ResearchAgent,
         reasoner: ReasonerAgent,
+        phase_tracker: Optional[RunPhaseTracker] = None,
     ):
         super().__init__(name="CodeReviewerAgent", role="Reviewer", goal="Perform automated code reviews")
         
@@ -43,6 +49,7 @@ class CodeReviewerAgent(BaseAgent):
         self.vcs = vcs
         self.researcher = researcher
         self.reasoner = reasoner
+        self.phase_tracker = phase_tracker or NullRunPhaseTracker()
 
         # Internal Tools
         self.prompt_builder = CodeReviewPromptBuilder()
@@ -53,6 +60,7 @@ class CodeReviewerAgent(BaseAgent):
     def execute_flow(self, task: Task) -> None:
         """
         Main orchestration flow for Code Review using Task Entity.
+        A failure is reported on the task and then raised as FlowFailedError.
         """
         logger.info(f"Starting code review for Task {task.key}")
         
@@ -82,27 +90,33 @@ class CodeReviewerAgent(BaseAgent):
                     logger.warning(f"Could not extract MR ID from URL: {review_url}")
             # -----------------------------------------------------
             
-            # Phase 1: Validation
-            if not self._validate_preconditions(task, cr_params):
-                return
-
-            # Phase 2: Data Gathering
-            original_code, changes, continue_flow = self._fetch_and_validate_artifacts(task, cr_params)
+            # Phase 1: Validation & Data Gathering
+            with self.phase_tracker.phase(RunPhase.VALIDATE):
+                if not self._validate_preconditions(task, cr_params):
+                    return
+                original_code, changes, continue_flow = self._fetch_and_validate_artifacts(task, cr_params)
             if not continue_flow:
                 return
 
             # Execute Layered Research Strategy
-            technical_context = self._gather_technical_context(task, cr_params)
+            with self.phase_tracker.phase(RunPhase.RESEARCH):
+                technical_context = self._gather_technical_context(task, cr_params)
 
             # Phase 3: Analysis (Reasoning)
-            review_result = self._perform_review_reasoning(task, original_code, changes, technical_context)
+            with self.phase_tracker.phase(RunPhase.REASON):
+                review_result = self._perform_review_reasoning(task, original_code, changes, technical_context)
 
             # Phase 4: Submission & Reporting
-            self._submit_review_comments(task, cr_params, review_result)
-            self._report_completion(task, cr_params, review_result)
+            with self.phase_tracker.phase(RunPhase.MERGE_REQUEST):
+                self._submit_review_comments(task, cr_params, review_result)
+            with self.phase_tracker.phase(RunPhase.REPORT), self.reporter.batch():
+                self._report_completion(task, cr_params, review_result)
 
         except Exception as e:
             self._handle_critical_failure(task, e)
+            raise FlowFailedError.from_error(e) from e
+        finally:
+            self.reporter.flush(task.key)
 
     # --- Phase 1: Validation Methods ---
 
@@ -171,42 +185,47 @@ class CodeReviewerAgent(BaseAgent):
         """
         Layered Research Strategy.
         """
-        context_parts = []
-        
         service_name = params.get("service_name")
         technical_doc_id = params.get("technical_doc_id") or params.get("confluence_page_id")
-        
+        layers = []
+
         # 1. Project Context
         if service_name:
-            logger.info(f"🔎 Researching Project Context for: '{service_name}'")
-            try:
-                project_ctx = self.researcher.research_project_technical_context(service_name)
-                if project_ctx and "ERROR" not in project_ctx:
-                    context_parts.append(f"=== REGLAS DEL PROYECTO ({service_name}) ===\n{project_ctx}")
-            except Exception as e:
-                logger.warning(f"Failed to retrieve project context: {e}")
+            layers.append(ResearchLayer("project_context", lambda: self._research_project_rules(service_name)))
 
         # 2. Specific Technical Doc
         if technical_doc_id:
-            logger.info(f"🔎 Researching Specific Doc ID: {technical_doc_id}")
-            try:
-                doc_ctx = self.researcher.investigate(query="", specific_page_id=technical_doc_id)
-                if doc_ctx:
-                    context_parts.append(f"=== DOCUMENTACIÓN VINCULADA ===\n{doc_ctx}")
-            except Exception as e:
-                logger.warning(f"Failed to retrieve specific doc: {e}")
-
-        # 3. Global/General Standards
-        logger.info(f"🔎 Researching General Standards for: {task.summary}")
-        query = f"Best practices, security, and clean code standards for {task.summary}"
-        global_ctx = self.researcher.investigate(query=query)
-        context_parts.append(f"=== ESTÁNDARES GENERALES Y BUENAS PRÁCTICAS ===\n{global_ctx}")
+            layers.append(ResearchLayer("linked_doc", lambda: self._research_linked_doc(technical_doc_id)))
+
+        # 3. Global/General Standards (failures here abort the review, as before)
+        layers.append(ResearchLayer("general_standards", lambda: self._research_general_standards(task), required=True))
+
+        # Independent layers run concurrently; results keep the order above
+        context_parts = [r.content for r in self.researcher.fan_out(layers) if r.content]
 
         full_context = "\n\n".join(context_parts)
         logger.info(f"Research complete. Total context size: {len(full_context)} chars")
         
         return full_context
 
+    def _research_project_rules(self, service_name: str) -> Optional[str]:
+        logger.info(f"🔎 Researching Project Context for: '{service_name}'")
+        project_ctx = self.researcher.research_project_technical_context(service_name)
+        if project_ctx and "ERROR" not in project_ctx:
+            return f"=== REGLAS DEL PROYECTO ({service_name}) ===\n{project_ctx}"
+        return None
+
+    def _research_linked_doc(self, technical_doc_id: str) -> Optional[str]:
+        logger.info(f"🔎 Researching Specific Doc ID: {technical_doc_id}")
+        doc_ctx = self.researcher.investigate(query="", specific_page_id=technical_doc_id)
+        return f"=== DOCUMENTACIÓN VINCULADA ===\n{doc_ctx}" if doc_ctx else None
+
+    def _research_general_standards(self, task: Task) -> str:
+        logger.info(f"🔎 Researching General Standards for: {task.summary}")
+        query = f"Best practices, security, and clean code standards for {task.summary}"
+        global_ctx = self.researcher.investigate(query=query)
+        return f"=== ESTÁNDARES GENERALES Y BUENAS PRÁCTICAS ===\n{global_ctx}"
+
     # --- Phase 3: Analysis Methods ---
 
     def _perform_review_reasoning(
@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class RunPhase(StrEnum):
+    VALIDATE = "validate"
+    RESEARCH = "research"
+    REASON = "reason"
+    BRANCH = "branch"
+    COMMIT = "commit"
+    MERGE_REQUEST = "merge_request"
+    REPORT = "report"
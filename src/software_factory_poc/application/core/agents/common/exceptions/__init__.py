@@ -1,6 +1,7 @@
 from .configuration_error import ConfigurationError
 from .dependency_error import DependencyError
 from .domain_error import DomainError
+from .flow_failed_error import FlowFailedError
 from .infra_error import InfraError
 from .provider_error import ProviderError
 from .retryable_error import RetryableError
@@ -9,6 +10,7 @@ __all__ = [
     "ConfigurationError",
     "DependencyError",
     "DomainError",
+    "FlowFailedError",
     "InfraError",
     "ProviderError",
     "RetryableError",
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from software_factory_poc.application.core.agents.common.exceptions.domain_error import DomainError
+from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+
+
+@dataclass(frozen=False)
+class FlowFailedError(DomainError):
+    """
+    Raised by an agent flow once its failure has been reported on the task, so the caller
+    records the run as failed (and retries it when `retryable`) without reporting it again.
+    """
+    message: str
+    retryable: bool = True
+
+    def __str__(self) -> str:
+        return self.message
+
+    @classmethod
+    def from_error(cls, error: Exception) -> FlowFailedError:
+        # Invalid requests (config, permissions) and rejected provider calls fail the same way again
+        if isinstance(error, ProviderError):
+            retryable = error.retryable
+        else:
+            retryable = not isinstance(error, (ValueError, PermissionError))
+        return cls(message=f"{type(error).__name__}: {error}", retryable=retryable)
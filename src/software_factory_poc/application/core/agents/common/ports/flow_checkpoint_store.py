@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.domain.entities.task import Task
+
+
+class FlowCheckpointStore(ABC):
+    """
+    Port through which orchestrator agents persist the output of completed phases,
+    so that a re-run of the same request resumes after the last successful phase.
+    Checkpoints belong to the task's issue key and its configuration: editing the
+    YAML config of the ticket starts over from scratch.
+    """
+
+    @abstractmethod
+    def load(self, flow: str, task: Task) -> dict[str, Any]:
+        """Returns the saved outputs of the flow for this task, keyed by phase name."""
+        pass
+
+    @abstractmethod
+    def save(self, flow: str, task: Task, phase: RunPhase, output: Any) -> None:
+        """Stores the (JSON-serializable) output of a completed phase."""
+        pass
+
+    @abstractmethod
+    def clear(self, flow: str, task: Task) -> None:
+        """Forgets every checkpoint of the flow for this task (called once the flow succeeds)."""
+        pass
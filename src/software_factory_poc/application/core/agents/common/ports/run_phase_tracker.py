@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import ContextManager
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+
+
+class RunPhaseTracker(ABC):
+    """Port through which orchestrator agents publish the phases of the run they execute."""
+
+    @abstractmethod
+    def phase(self, phase: RunPhase) -> ContextManager[None]:
+        """
+        Wraps one phase of the flow. Records start, end and elapsed time;
+        an exception leaving the block marks the phase as failed and is re-raised.
+        """
+        pass
@@ -0,0 +1,18 @@
+from typing import Any
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.agents.common.ports.flow_checkpoint_store import FlowCheckpointStore
+from software_factory_poc.application.core.domain.entities.task import Task
+
+
+class NullFlowCheckpointStore(FlowCheckpointStore):
+    """Default store when no checkpoint persistence is wired: every run starts from scratch."""
+
+    def load(self, flow: str, task: Task) -> dict[str, Any]:
+        return {}
+
+    def save(self, flow: str, task: Task, phase: RunPhase, output: Any) -> None:
+        pass
+
+    def clear(self, flow: str, task: Task) -> None:
+        pass
@@ -0,0 +1,12 @@
+from contextlib import nullcontext
+from typing import ContextManager
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.agents.common.ports.run_phase_tracker import RunPhaseTracker
+
+
+class NullRunPhaseTracker(RunPhaseTracker):
+    """Default tracker when no run registry is wired (tests, scripts)."""
+
+    def phase(self, phase: RunPhase) -> ContextManager[None]:
+        return nullcontext()
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class TrackerOperationKind(StrEnum):
+    COMMENT = "comment"
+    DESCRIPTION = "description"
+    TRANSITION = "transition"
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class TrackerItemResultDTO:
+    """Outcome of one task in a bulk tracker operation; `error` is set when it failed."""
+    task_id: str
+    succeeded: bool
+    error: Optional[str] = None
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Any
+
+from software_factory_poc.application.core.agents.reporter.config.tracker_operation_kind import TrackerOperationKind
+
+
+@dataclass(frozen=True)
+class TrackerOperationDTO:
+    """
+    One write to the task tracker, buffered by the reporter outbox.
+    `payload` is the comment body, the TaskDescription or the target TaskStatus.
+    """
+    kind: TrackerOperationKind
+    task_id: str
+    payload: Any
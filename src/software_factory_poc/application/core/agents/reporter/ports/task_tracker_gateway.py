@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from software_factory_poc.application.core.agents.common.config.task_status import TaskStatus
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_item_result_dto import TrackerItemResultDTO
 from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
 
 
@@ -34,3 +35,42 @@ class TaskTrackerGateway(ABC):
     def get_task(self, task_id: str) -> Task:
         """Retrieves the Task domain entity."""
         pass
+
+    def get_tasks(self, task_ids: list[str]) -> list[Task]:
+        """
+        Retrieves several Task entities; ids that do not exist are left out.
+        Adapters override it with a bulk query.
+        """
+        return [self.get_task(task_id) for task_id in task_ids]
+
+    def add_comments(self, comments: dict[str, Any]) -> list[TrackerItemResultDTO]:
+        """
+        Adds one comment per task ({task id: body}). A failure is reported in the task's
+        result instead of aborting the others. Adapters override it to run concurrently.
+        """
+        return [self._bulk_item(task_id, self.add_comment, task_id, body) for task_id, body in comments.items()]
+
+    def transition_statuses(self, statuses: dict[str, TaskStatus]) -> list[TrackerItemResultDTO]:
+        """Moves each task to its target status ({task id: status}), with one result per task."""
+        return [
+            self._bulk_item(task_id, self.transition_status, task_id, status) for task_id, status in statuses.items()
+        ]
+
+    @staticmethod
+    def _bulk_item(task_id: str, operation, *args) -> TrackerItemResultDTO:
+        try:
+            operation(*args)
+            return TrackerItemResultDTO(task_id=task_id, succeeded=True)
+        except Exception as e:
+            return TrackerItemResultDTO(task_id=task_id, succeeded=False, error=f"{type(e).__name__}: {e}")
+
+    def search_task_ids(self, query: str, limit: int = 100) -> list[str]:
+        """Returns the ids of the tasks matching a tracker query (JQL for Jira)."""
+        raise NotImplementedError(f"{type(self).__name__} does not support task search")
+
+    def search_task_versions(self, query: str, limit: int = 100, page_size: int = 100) -> dict[str, str]:
+        """
+        Returns the ids of the tasks matching a tracker query with their last-update marker,
+        so a poller can tell new or changed tasks apart without fetching them.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support task search")
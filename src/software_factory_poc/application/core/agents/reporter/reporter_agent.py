@@ -1,29 +1,68 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator, Optional
 
 from software_factory_poc.application.core.agents.base_agent import BaseAgent
 from software_factory_poc.application.core.agents.common.dtos.automation_context_dto import AutomationContextDTO
+from software_factory_poc.application.core.agents.reporter.config.tracker_operation_kind import TrackerOperationKind
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_operation_dto import TrackerOperationDTO
 from software_factory_poc.application.core.agents.reporter.ports.task_tracker_gateway import TaskTrackerGateway, \
     TaskStatus
+from software_factory_poc.application.core.agents.reporter.tracker_channel import TrackerChannel
+from software_factory_poc.application.core.agents.reporter.tracker_outbox import TrackerOutbox
 from .config.reporter_constants import ReporterMessages
 from ...domain.entities.task import TaskDescription
 
+# Operations buffered by the `batch()` block of the current run (one per worker thread)
+_BATCH: ContextVar[Optional[list[TrackerOperationDTO]]] = ContextVar("_BATCH", default=None)
+
 
 @dataclass
 class ReporterAgent(BaseAgent):
     """
     Agent responsible for reporting progress and status to the Task Tracker (Jira).
+    With an `outbox`, the writes made inside a `batch()` block are buffered and sent
+    together when the block ends. With a `channel` (which delivers through the outbox), writes
+    are posted in the background and the run only waits for them in `flush()`.
     """
     tracker: TaskTrackerGateway
+    outbox: Optional[TrackerOutbox] = None
+    channel: Optional[TrackerChannel] = None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Buffers the tracker writes of the block and flushes them in one go on exit.
+        If the block raises, the buffer is dropped: the run reports its failure instead.
+        """
+        if self.outbox is None or _BATCH.get() is not None:
+            yield
+            return
+        operations: list[TrackerOperationDTO] = []
+        token = _BATCH.set(operations)
+        try:
+            yield
+        finally:
+            _BATCH.reset(token)
+        if self.channel is not None:
+            self.channel.post(operations)
+        else:
+            self.outbox.flush(operations)
+
+    def flush(self, task_id: str) -> None:
+        """Completion barrier: waits until the writes posted for the task are delivered."""
+        if self.channel is not None:
+            self.channel.flush(task_id)
 
     def report_start(self, task_id: str, message: str = "🤖 Iniciando tarea...") -> None:
-        self.tracker.add_comment(task_id, message)
+        self._write(TrackerOperationKind.COMMENT, task_id, message)
 
     def report_success(self, task_id: str, message: Any) -> None:
         if isinstance(message, dict):
-            self.tracker.add_comment(task_id, message)
+            self._write(TrackerOperationKind.COMMENT, task_id, message)
         else:
-            self.tracker.add_comment(task_id, f"{ReporterMessages.SUCCESS_PREFIX}{message}")
+            self._write(TrackerOperationKind.COMMENT, task_id, f"{ReporterMessages.SUCCESS_PREFIX}{message}")
 
     def report_failure(self, task_id: str, error_msg: str) -> None:
         # Note: Previous code accessed self.gateway which did not exist in dataclass definition (which had `tracker`).
@@ -33,10 +72,23 @@ class ReporterAgent(BaseAgent):
         # Original Lines 20 and 23 used `self.gateway`.
         # Error in original code: `tracker: TaskTrackerGateway` field vs `self.gateway` usage.
         # I will fix standardizing on `self.tracker` as defined in dataclass.
-        self.tracker.add_comment(task_id, f"{ReporterMessages.FAILURE_PREFIX}{error_msg}")
+        self._write(TrackerOperationKind.COMMENT, task_id, f"{ReporterMessages.FAILURE_PREFIX}{error_msg}")
 
     def transition_task(self, task_id: str, status: TaskStatus) -> None:
-        self.tracker.transition_status(task_id, status)
+        self._write(TrackerOperationKind.TRANSITION, task_id, status)
 
     def update_task_description(self, task_id: str, description: TaskDescription) -> None:
-        self.tracker.update_task_description(task_id, description)
+        self._write(TrackerOperationKind.DESCRIPTION, task_id, description)
+
+    def _write(self, kind: TrackerOperationKind, task_id: str, payload: Any) -> None:
+        buffered = _BATCH.get()
+        if buffered is not None:
+            buffered.append(TrackerOperationDTO(kind=kind, task_id=task_id, payload=payload))
+        elif self.channel is not None:
+            self.channel.post([TrackerOperationDTO(kind=kind, task_id=task_id, payload=payload)])
+        elif kind == TrackerOperationKind.COMMENT:
+            self.tracker.add_comment(task_id, payload)
+        elif kind == TrackerOperationKind.DESCRIPTION:
+            self.tracker.update_task_description(task_id, payload)
+        else:
+            self.tracker.transition_status(task_id, payload)
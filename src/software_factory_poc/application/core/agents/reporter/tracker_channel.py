@@ -0,0 +1,111 @@
+import contextvars
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_operation_dto import TrackerOperationDTO
+from software_factory_poc.application.core.agents.reporter.tracker_outbox import TrackerOutbox
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+
+class TrackerChannel:
+    """
+    Fire-and-forget delivery of tracker writes, so runs never wait on Jira before real work.
+    - Ordering: each issue has its own queue, drained by one worker at a time, so its writes
+      are delivered in the order they were posted.
+    - Retries: a write that failed transiently stays at the head of its issue's queue and is
+      resent after the outbox backoff by a timer; no worker sleeps meanwhile, so the other
+      issues keep being delivered.
+    - Bounded: at most `max_pending` deliveries are queued; a caller posting beyond that
+      waits for a slot (backpressure) instead of growing the queue or dropping writes.
+    - Barrier: `flush(task_id)` waits until everything posted for the issue is delivered.
+    - Context: a unit is delivered in a copy of the context it was posted from, so state bound
+      to the run (e.g. its Jira issue cache) is seen by the delivery threads.
+    """
+
+    def __init__(
+        self,
+        outbox: TrackerOutbox,
+        lanes: int = 4,
+        max_pending: int = 1000,
+        flush_timeout_seconds: float = 30.0,
+    ):
+        self.outbox = outbox
+        self.flush_timeout_seconds = flush_timeout_seconds
+        self._workers = ThreadPoolExecutor(max_workers=max(1, lanes), thread_name_prefix="tracker-channel")
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        # task_id -> (operations, attempt, posting context) not delivered yet, head first
+        self._queues: dict[str, deque[tuple[list[TrackerOperationDTO], int, contextvars.Context]]] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._closed = False
+
+    def post(self, operations: list[TrackerOperationDTO]) -> None:
+        """Queues the operations of one issue for delivery, in order, as a single unit."""
+        if not operations:
+            return
+        task_id = operations[0].task_id
+        if self._closed:
+            self.outbox.flush(operations)
+            return
+        unit = (self.outbox.collapse(operations), 1, contextvars.copy_context())
+        self._slots.acquire()
+        with self._lock:
+            queue = self._queues.get(task_id)
+            if queue is not None:
+                queue.append(unit)
+                return
+            self._queues[task_id] = deque([unit])
+        self._workers.submit(self._drain, task_id)
+
+    def flush(self, task_id: str, timeout: Optional[float] = None) -> bool:
+        """Waits for the writes posted for the issue so far. Returns False on timeout."""
+        with self._idle:
+            done = self._idle.wait_for(
+                lambda: task_id not in self._queues,
+                timeout=self.flush_timeout_seconds if timeout is None else timeout,
+            )
+        if not done:
+            logger.warning(f"Tracker writes for {task_id} still pending after the flush timeout")
+        return done
+
+    def close(self) -> None:
+        """Delivers what is queued, retries included, and stops; later posts are delivered inline."""
+        self._closed = True
+        with self._idle:
+            self._idle.wait_for(lambda: not self._queues)
+        self._workers.shutdown(wait=True)
+
+    def _drain(self, task_id: str) -> None:
+        """Delivers the issue's queue until it is empty or its head waits for a retry."""
+        while True:
+            with self._lock:
+                queue = self._queues[task_id]
+                if not queue:
+                    del self._queues[task_id]
+                    self._idle.notify_all()
+                    return
+                operations, attempt, context = queue[0]
+            try:
+                pending = context.run(self.outbox.send_round, operations)
+            except Exception as e:
+                logger.error(f"Tracker delivery for {task_id} failed: {e}")
+                pending = []
+            if pending and attempt < self.outbox.max_attempts:
+                with self._lock:
+                    queue[0] = (pending, attempt + 1, context)
+                timer = threading.Timer(self.outbox.backoff_seconds(attempt + 1), self._resume, (task_id,))
+                timer.daemon = True
+                timer.start()
+                return
+            for op in pending:
+                logger.error(f"Tracker {op.kind.value} for {op.task_id} dropped after {attempt} attempt(s)")
+            with self._lock:
+                queue.popleft()
+            self._slots.release()
+
+    def _resume(self, task_id: str) -> None:
+        self._workers.submit(self._drain, task_id)
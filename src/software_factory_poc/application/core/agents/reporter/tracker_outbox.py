@@ -0,0 +1,155 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+from software_factory_poc.application.core.agents.reporter.config.tracker_operation_kind import TrackerOperationKind
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_operation_dto import TrackerOperationDTO
+from software_factory_poc.application.core.agents.reporter.ports.task_tracker_gateway import TaskTrackerGateway
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+
+class TrackerOutbox:
+    """
+    Sends the tracker writes a run buffered during its reporting phase in one flush:
+    1. redundant operations are collapsed: the last description and the last transition of
+       an issue win, repeated identical comments are sent once;
+    2. comments and description updates are sent concurrently, then the transitions
+       (workflow validators may read the updated fields); a transition waits until the
+       updates of its issue are delivered, retries included;
+    3. errors the tracker marks as permanent (ProviderError with `retryable=False`, e.g. a
+       missing transition or a 4xx) drop the operation at once;
+    4. operations that failed transiently are retried with exponential backoff on a background
+       thread, so the run completes without waiting for the tracker. A caller scheduling its
+       own retries (TrackerChannel) sends rounds with `send_round` and waits `backoff_seconds`.
+    Operations are sent in copies of the caller's context, so state bound to the run (e.g. its
+    Jira issue cache) is seen by the sending threads.
+    """
+
+    def __init__(
+        self,
+        tracker: TaskTrackerGateway,
+        max_workers: int = 4,
+        max_attempts: int = 4,
+        backoff_base_seconds: float = 2.0,
+        backoff_max_seconds: float = 60.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.tracker = tracker
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self._sleep = sleep
+        self._retry_executor: Optional[ThreadPoolExecutor] = None
+        self._retry_lock = threading.Lock()
+
+    def send(self, operation: TrackerOperationDTO) -> None:
+        """Applies a single operation on the calling thread; errors propagate."""
+        if operation.kind == TrackerOperationKind.COMMENT:
+            self.tracker.add_comment(operation.task_id, operation.payload)
+        elif operation.kind == TrackerOperationKind.DESCRIPTION:
+            self.tracker.update_task_description(operation.task_id, operation.payload)
+        elif operation.kind == TrackerOperationKind.TRANSITION:
+            self.tracker.transition_status(operation.task_id, operation.payload)
+        else:
+            raise ValueError(f"Unsupported tracker operation: {operation.kind}")
+
+    def flush(self, operations: list[TrackerOperationDTO]) -> list[TrackerOperationDTO]:
+        """
+        Sends the buffered operations once. Returns those still pending (transient failures and
+        the transitions held behind them); they are handed to the background retry and the
+        caller does not wait for them.
+        """
+        pending = self.collapse(operations)
+        if not pending:
+            return []
+        failed = self.send_round(pending)
+        if failed:
+            logger.warning(f"{len(failed)} tracker operation(s) pending; retrying in background")
+            self._retry_pool().submit(contextvars.copy_context().run, self._retry, failed)
+        logger.info(f"Tracker outbox flushed {len(pending) - len(failed)}/{len(operations)} operation(s)")
+        return failed
+
+    @staticmethod
+    def collapse(operations: list[TrackerOperationDTO]) -> list[TrackerOperationDTO]:
+        latest: dict[tuple[TrackerOperationKind, str], int] = {}
+        for index, op in enumerate(operations):
+            if op.kind != TrackerOperationKind.COMMENT:
+                latest[(op.kind, op.task_id)] = index
+        collapsed: list[TrackerOperationDTO] = []
+        for index, op in enumerate(operations):
+            if op.kind == TrackerOperationKind.COMMENT:
+                if op not in collapsed:
+                    collapsed.append(op)
+            elif latest[(op.kind, op.task_id)] == index:
+                collapsed.append(op)
+        return collapsed
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Wait before the given attempt (the first retry is attempt 2)."""
+        return min(self.backoff_base_seconds * (2 ** (attempt - 2)), self.backoff_max_seconds)
+
+    def close(self, wait: bool = False) -> None:
+        with self._retry_lock:
+            if self._retry_executor is not None:
+                self._retry_executor.shutdown(wait=wait)
+                self._retry_executor = None
+
+    def send_round(self, operations: list[TrackerOperationDTO]) -> list[TrackerOperationDTO]:
+        """
+        One delivery attempt of collapsed operations. Returns the operations to retry: the transiently failed ones, and
+        the transitions held back because an update of their issue is still to be retried.
+        """
+        updates = [op for op in operations if op.kind != TrackerOperationKind.TRANSITION]
+        transitions = [op for op in operations if op.kind == TrackerOperationKind.TRANSITION]
+        failed_updates = self._send_concurrently(updates)
+        blocked = {op.task_id for op in failed_updates}
+        held = [op for op in transitions if op.task_id in blocked]
+        failed_transitions = self._send_concurrently([op for op in transitions if op.task_id not in blocked])
+        return failed_updates + held + failed_transitions
+
+    def _send_concurrently(self, operations: list[TrackerOperationDTO]) -> list[TrackerOperationDTO]:
+        """Sends the operations; returns those that failed and are worth another attempt."""
+        if len(operations) <= 1:
+            return [op for op in operations if self._try_send(op) is False]
+        workers = min(self.max_workers, len(operations))
+        # One context copy per operation: a Context cannot be entered by two threads at once
+        contexts = [contextvars.copy_context() for _ in operations]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tracker-outbox") as executor:
+            outcomes = list(executor.map(lambda context, op: context.run(self._try_send, op), contexts, operations))
+        return [op for op, outcome in zip(operations, outcomes, strict=True) if outcome is False]
+
+    def _try_send(self, operation: TrackerOperationDTO) -> Optional[bool]:
+        """True when sent, False when it failed transiently, None when it was dropped."""
+        try:
+            self.send(operation)
+            return True
+        except Exception as e:
+            if isinstance(e, ProviderError) and not e.retryable:
+                logger.error(f"Tracker {operation.kind.value} for {operation.task_id} dropped: {e}")
+                return None
+            logger.warning(f"Tracker {operation.kind.value} for {operation.task_id} failed: {e}")
+            return False
+
+    def _retry(self, operations: list[TrackerOperationDTO]) -> list[TrackerOperationDTO]:
+        pending = operations
+        for attempt in range(2, self.max_attempts + 1):
+            self._sleep(self.backoff_seconds(attempt))
+            pending = self.send_round(pending)
+            if not pending:
+                logger.info(f"Tracker operation(s) delivered on attempt {attempt}")
+                return []
+        for op in pending:
+            logger.error(f"Tracker {op.kind.value} for {op.task_id} dropped after {self.max_attempts} attempt(s)")
+        return pending
+
+    def _retry_pool(self) -> ThreadPoolExecutor:
+        with self._retry_lock:
+            if self._retry_executor is None:
+                self._retry_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tracker-outbox-retry")
+            return self._retry_executor
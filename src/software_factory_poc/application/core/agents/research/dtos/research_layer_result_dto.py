@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ResearchLayerResultDTO:
+    """
+    Outcome of a single research layer executed by ResearchAgent.fan_out.
+    """
+    name: str
+    content: Optional[str]
+    elapsed_ms: float
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
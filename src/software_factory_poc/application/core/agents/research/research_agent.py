@@ -1,9 +1,14 @@
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from software_factory_poc.application.core.agents.base_agent import BaseAgent
+from software_factory_poc.application.core.agents.research.dtos.research_layer_result_dto import \
+    ResearchLayerResultDTO
 from software_factory_poc.application.core.agents.research.ports.research_gateway import ResearchGateway
+from software_factory_poc.application.core.agents.research.value_objects.research_layer import ResearchLayer
 from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import \
     ScaffoldingAgentConfig
 
@@ -18,6 +23,62 @@ class ResearchAgent(BaseAgent):
     gateway: ResearchGateway
     config: ScaffoldingAgentConfig
 
+    def fan_out(self, layers: List[ResearchLayer]) -> List[ResearchLayerResultDTO]:
+        """
+        Runs independent research layers concurrently and returns their results in the order given.
+        Each layer has its own deadline (measured from the fan-out start); a layer that fails or
+        times out yields an empty result without affecting the others, unless it is `required`.
+        """
+        if not layers:
+            return []
+
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(layers), thread_name_prefix="research-layer")
+        futures = [executor.submit(self._run_layer, layer) for layer in layers]
+        results: List[ResearchLayerResultDTO] = []
+        try:
+            for layer, future in zip(layers, futures, strict=True):
+                timeout = layer.timeout_seconds
+                if timeout is None:
+                    timeout = self.config.research_layer_timeout_seconds
+                remaining = max(0.0, started + timeout - time.monotonic())
+                try:
+                    result = future.result(timeout=remaining)
+                except FutureTimeoutError as e:
+                    future.cancel()
+                    logger.warning(f"Research layer '{layer.name}' timed out after {timeout}s. Skipping it.")
+                    if layer.required:
+                        raise TimeoutError(f"Research layer '{layer.name}' timed out after {timeout}s") from e
+                    result = ResearchLayerResultDTO(
+                        name=layer.name,
+                        content=None,
+                        elapsed_ms=(time.monotonic() - started) * 1000,
+                        error=f"timed out after {timeout}s"
+                    )
+                results.append(result)
+        finally:
+            # Never block the caller on a straggler; its thread finishes in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        total_ms = (time.monotonic() - started) * 1000
+        timings = ", ".join(f"{r.name}={r.elapsed_ms:.0f}ms" for r in results)
+        logger.info(f"Research fan-out finished in {total_ms:.0f} ms ({timings})")
+        return results
+
+    @staticmethod
+    def _run_layer(layer: ResearchLayer) -> ResearchLayerResultDTO:
+        started = time.monotonic()
+        try:
+            content = layer.loader()
+        except Exception as e:
+            if layer.required:
+                raise
+            logger.warning(f"Research layer '{layer.name}' failed: {e}")
+            return ResearchLayerResultDTO(
+                name=layer.name, content=None, elapsed_ms=(time.monotonic() - started) * 1000, error=str(e)
+            )
+        return ResearchLayerResultDTO(name=layer.name, content=content, elapsed_ms=(time.monotonic() - started) * 1000)
+
     def investigate(self, query: str, specific_page_id: Optional[str] = None) -> str:
         # Priority 1: Specific Page ID
         if specific_page_id:
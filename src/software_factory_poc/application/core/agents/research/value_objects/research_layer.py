@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class ResearchLayer:
+    """
+    One independent source of research context (project docs, a linked page, standards...).
+    The loader returns the formatted section, or None when the layer has nothing to add.
+    """
+    name: str
+    loader: Callable[[], Optional[str]]
+    timeout_seconds: Optional[float] = None  # None -> agent default
+    required: bool = False  # Required layers re-raise their failure instead of being skipped
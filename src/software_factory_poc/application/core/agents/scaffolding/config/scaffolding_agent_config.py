@@ -25,6 +25,7 @@ class ScaffoldingAgentConfig(BaseSettings):
     work_dir: Path = Field(..., description="Working directory")
     default_target_branch: str = Field(default="main", description="Target branch for Merge Requests")
     architecture_page_id: Optional[str] = Field(default=None, description="Confluence Page ID for Architecture")
+    research_layer_timeout_seconds: float = Field(default=60.0, description="Deadline for each concurrent research layer")
 
     # Original fields kept for compatibility
     model_name: Optional[str] = None
@@ -1,38 +1,55 @@
 import re
 from datetime import datetime
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Callable, TypeVar
 
 from software_factory_poc.application.core.agents.base_agent import BaseAgent
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
 from software_factory_poc.application.core.agents.common.config.task_status import TaskStatus
 from software_factory_poc.application.core.agents.common.dtos.file_content_dto import FileContentDTO
+from software_factory_poc.application.core.agents.common.exceptions.flow_failed_error import FlowFailedError
+from software_factory_poc.application.core.agents.common.ports.flow_checkpoint_store import FlowCheckpointStore
+from software_factory_poc.application.core.agents.common.ports.run_phase_tracker import RunPhaseTracker
+from software_factory_poc.application.core.agents.common.tools.null_flow_checkpoint_store import NullFlowCheckpointStore
+from software_factory_poc.application.core.agents.common.tools.null_run_phase_tracker import NullRunPhaseTracker
 from software_factory_poc.application.core.agents.reasoner.reasoner_agent import ReasonerAgent
 from software_factory_poc.application.core.agents.reporter.reporter_agent import ReporterAgent
 from software_factory_poc.application.core.agents.research.research_agent import ResearchAgent
+from software_factory_poc.application.core.agents.research.value_objects.research_layer import ResearchLayer
 from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import \
     ScaffoldingAgentConfig
 from software_factory_poc.application.core.agents.scaffolding.tools.artifact_parser import ArtifactParser
 from software_factory_poc.application.core.agents.scaffolding.tools.scaffolding_prompt_builder import \
     ScaffoldingPromptBuilder
+from software_factory_poc.application.core.agents.vcs.dtos.vcs_dtos import CommitResultDTO
 from software_factory_poc.application.core.agents.vcs.vcs_agent import VcsAgent
 from software_factory_poc.application.core.domain.entities.task import Task
 from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
 
 logger = LoggerFactoryService.build_logger(__name__)
 
+T = TypeVar("T")
+
 
 class ScaffoldingAgent(BaseAgent):
     """
     Orchestrator Agent for Scaffolding Tasks.
     Refactored to consume Domain Task Entity directly.
+    The outputs of research, reasoning, branch creation, commit and merge request are
+    checkpointed: a re-run after a failure resumes after the last phase that succeeded.
     """
 
+    CHECKPOINT_FLOW = "scaffolding"
+    FALLBACK_RESEARCH_QUERY = "Architecture standards for {stack} enterprise projects"
+
     def __init__(
             self,
             config: ScaffoldingAgentConfig,
             reporter: ReporterAgent,
             vcs: VcsAgent,
             researcher: ResearchAgent,
-            reasoner: ReasonerAgent
+            reasoner: ReasonerAgent,
+            phase_tracker: Optional[RunPhaseTracker] = None,
+            checkpoints: Optional[FlowCheckpointStore] = None
     ):
         super().__init__(name="ScaffoldingAgent", role="Orchestrator", goal="Orchestrate scaffolding creation")
 
@@ -42,6 +59,8 @@ class ScaffoldingAgent(BaseAgent):
         self.vcs = vcs
         self.researcher = researcher
         self.reasoner = reasoner
+        self.phase_tracker = phase_tracker or NullRunPhaseTracker()
+        self.checkpoints = checkpoints or NullFlowCheckpointStore()
 
         # Internal Tools
         self.prompt_builder_tool = ScaffoldingPromptBuilder()
@@ -50,6 +69,7 @@ class ScaffoldingAgent(BaseAgent):
     def execute_flow(self, task: Task) -> None:
         """
         Main orchestration flow. Executes the scaffolding process sequentially using Domain Task.
+        A failure is reported on the task and then raised as FlowFailedError.
         """
         try:
             self._report_start(task)
@@ -62,38 +82,74 @@ class ScaffoldingAgent(BaseAgent):
             tech_stack = task_config.get("technology_stack", "unknown")
             service_name = task_config.get("parameters", {}).get("service_name")
 
-            target_repo, project_id, continue_flow = self._validate_preconditions(task, task_config)
+            # Outputs of the phases a previous run of this request completed
+            checkpoint = self.checkpoints.load(self.CHECKPOINT_FLOW, task)
+
+            with self.phase_tracker.phase(RunPhase.VALIDATE):
+                target_repo, project_id, continue_flow = self._validate_preconditions(task, task_config, checkpoint)
 
             if not continue_flow:
                 return
 
             # Phase 2: Intelligence (Research & Reasoning)
-            research_context = self._execute_research_strategy(tech_stack, service_name)
+            with self.phase_tracker.phase(RunPhase.RESEARCH):
+                research_context = self._run_or_resume(
+                    task, checkpoint, RunPhase.RESEARCH,
+                    lambda: self._execute_research_strategy(tech_stack, service_name)
+                )
 
             # Pass full config/task to prompt builder
-            artifacts = self._generate_artifacts(task, research_context)
+            with self.phase_tracker.phase(RunPhase.REASON):
+                artifacts = self._run_or_resume(
+                    task, checkpoint, RunPhase.REASON,
+                    lambda: self._generate_artifacts(task, research_context),
+                    encode=lambda files: [{"path": f.path, "content": f.content} for f in files],
+                    decode=lambda files: [FileContentDTO(**f) for f in files]
+                )
 
             # Phase 3: Execution (VCS Operations)
             branch_name = self._get_branch_name(task)
-            self._create_feature_branch(project_id, branch_name)
-            self._commit_artifacts(project_id, branch_name, artifacts, task)
-
-            mr_link = self._create_merge_request(project_id, branch_name, task)
+            with self.phase_tracker.phase(RunPhase.COMMIT):
+                # Checkpointed on its own: a commit that fails leaves a branch the re-run builds on
+                if RunPhase.COMMIT.value not in checkpoint:
+                    self._run_or_resume(
+                        task, checkpoint, RunPhase.BRANCH,
+                        lambda: self._create_feature_branch(project_id, branch_name)
+                    )
+                self._run_or_resume(
+                    task, checkpoint, RunPhase.COMMIT,
+                    lambda: self._commit_to_branch(project_id, branch_name, artifacts, task)
+                )
+
+            with self.phase_tracker.phase(RunPhase.MERGE_REQUEST):
+                mr_link = self._run_or_resume(
+                    task, checkpoint, RunPhase.MERGE_REQUEST,
+                    lambda: self._create_merge_request(project_id, branch_name, task)
+                )
 
             # Phase 4: Finalization
-            self._finalize_success(task, project_id, branch_name, mr_link)
+            with self.phase_tracker.phase(RunPhase.REPORT), self.reporter.batch():
+                self._finalize_success(task, project_id, branch_name, mr_link)
+            self.checkpoints.clear(self.CHECKPOINT_FLOW, task)
 
         except Exception as e:
             self._handle_critical_failure(task, e)
+            raise FlowFailedError.from_error(e) from e
+        finally:
+            # Progress reports are posted in the background; the run ends once they are delivered
+            self.reporter.flush(task.key)
 
     # --- Phase 1: Analysis & Validation Methods ---
 
     def _report_start(self, task: Task) -> None:
         self.reporter.report_start(task.key, message="🚀 Iniciando generación de scaffolding...")
 
-    def _validate_preconditions(self, task: Task, config: Dict[str, Any]) -> tuple[str, int, bool]:
+    def _validate_preconditions(
+            self, task: Task, config: Dict[str, Any], checkpoint: Dict[str, Any]
+    ) -> tuple[str, int, bool]:
         """
         Validates target repo/Project ID, Security, and Branch existence.
+        A branch this flow created in a previous (failed) run does not stop the execution.
         """
         # 1. Target Repo Resolution
         target_repo = self._resolve_target_repo(task, config)
@@ -106,10 +162,19 @@ class ScaffoldingAgent(BaseAgent):
         branch_name = self._get_branch_name(task)
         existing_url = self.vcs.validate_branch(project_id, branch_name)
 
+        if existing_url and (RunPhase.BRANCH.value in checkpoint or RunPhase.COMMIT.value in checkpoint):
+            logger.info(f"Branch '{branch_name}' was created by a previous run of {task.key}. Resuming.")
+            return target_repo, project_id, True
+
         if existing_url:
             self._report_branch_exists(task, branch_name, existing_url, project_id)
             return target_repo, project_id, False  # Stop execution
 
+        # The branch of a previous run is gone: it and its commit (and MR) have to be redone
+        checkpoint.pop(RunPhase.BRANCH.value, None)
+        checkpoint.pop(RunPhase.COMMIT.value, None)
+        checkpoint.pop(RunPhase.MERGE_REQUEST.value, None)
+
         return target_repo, project_id, True  # Continue execution
 
     def _resolve_target_repo(self, task: Task, config: Dict[str, Any]) -> str:
@@ -155,24 +220,48 @@ class ScaffoldingAgent(BaseAgent):
             "links": links
         }
 
-        self.reporter.report_success(task.key, message_payload)
-        self.reporter.transition_task(task.key, TaskStatus.IN_REVIEW)
+        with self.reporter.batch():
+            self.reporter.report_success(task.key, message_payload)
+            self.reporter.transition_task(task.key, TaskStatus.IN_REVIEW)
+
+    def _run_or_resume(
+            self,
+            task: Task,
+            checkpoint: Dict[str, Any],
+            phase: RunPhase,
+            compute: Callable[[], T],
+            encode: Callable[[T], Any] = lambda value: value,
+            decode: Callable[[Any], T] = lambda value: value
+    ) -> T:
+        """
+        Returns the checkpointed output of the phase, or computes and checkpoints it.
+        """
+        if phase.value in checkpoint:
+            logger.info(f"♻️ Resuming {task.key}: '{phase.value}' output taken from checkpoint.")
+            return decode(checkpoint[phase.value])
+
+        output = compute()
+        self.checkpoints.save(self.CHECKPOINT_FLOW, task, phase, encode(output))
+        return output
 
     # --- Phase 2: Intelligence Methods ---
 
     def _execute_research_strategy(self, tech_stack: str, service_name: Optional[str]) -> str:
-        context_parts = []
+        layers = []
 
         # 1. Project Context
         if service_name:
-            context_parts.append(self._research_project_context(service_name))
+            layers.append(ResearchLayer("project_context", lambda: self._research_project_context(service_name)))
 
         # 2. Global Standards
         if self.config.architecture_page_id:
-            context_parts.append(self._research_global_standards())
+            layers.append(ResearchLayer("global_standards", self._research_global_standards))
+
+        # Independent layers run concurrently; results keep the order above
+        context_parts = [result.content for result in self.researcher.fan_out(layers)]
 
         # 3. Fallback
-        if not context_parts:
+        if not layers:
             context_parts.append(self._research_fallback(tech_stack))
 
         full_context = "\n\n".join(filter(None, context_parts))
@@ -207,7 +296,7 @@ class ScaffoldingAgent(BaseAgent):
             return None
 
     def _research_fallback(self, stack: str) -> str:
-        query = f"Architecture standards for {stack} enterprise projects"
+        query = self.FALLBACK_RESEARCH_QUERY.format(stack=stack)
         logger.info(f"🔎 executing Fallback Research: {query}")
         return f"=== CONTEXTO GENERAL ===\n{self.researcher.investigate(query)}"
 
@@ -239,12 +328,21 @@ class ScaffoldingAgent(BaseAgent):
         safe_key = re.sub(r'[^a-z0-9\-]', '', task.key.lower())
         return f"feature/{safe_key}-scaffolding"
 
-    def _create_feature_branch(self, project_id: int, branch_name: str) -> None:
+    def _create_feature_branch(self, project_id: int, branch_name: str) -> str:
         self.vcs.create_branch(project_id, branch_name, ref=self.config.default_target_branch)
+        return branch_name
 
-    def _commit_artifacts(self, project_id: int, branch_name: str, artifacts: List[FileContentDTO], task: Task) -> None:
+    def _commit_to_branch(
+            self, project_id: int, branch_name: str, artifacts: List[FileContentDTO], task: Task
+    ) -> Dict[str, str]:
+        commit = self._commit_artifacts(project_id, branch_name, artifacts, task)
+        return {"branch_name": branch_name, "commit_id": commit.id}
+
+    def _commit_artifacts(
+            self, project_id: int, branch_name: str, artifacts: List[FileContentDTO], task: Task
+    ) -> CommitResultDTO:
         files_map = self._prepare_files_map(artifacts)
-        self.vcs.commit_files(
+        return self.vcs.commit_files(
             project_id=project_id,
             branch_name=branch_name,
             files_map=files_map,
@@ -318,7 +416,7 @@ class ScaffoldingAgent(BaseAgent):
 
     def _handle_critical_failure(self, task: Task, error: Exception) -> None:
         logger.error(f"Task {task.key} failed: {error}", exc_info=True)
-        self.reporter.report_failure(task.key, str(error))
-
-        self.reporter.transition_task(task.key, TaskStatus.TO_DO)
+        with self.reporter.batch():
+            self.reporter.report_failure(task.key, str(error))
+            self.reporter.transition_task(task.key, TaskStatus.TO_DO)
         logger.info(f"Error handled gracefully for task {task.key}. Flow terminated.")
\ No newline at end of file
@@ -6,6 +6,7 @@ from software_factory_poc.application.core.agents.code_reviewer.code_reviewer_ag
 from software_factory_poc.application.core.agents.code_reviewer.config.code_reviewer_agent_config import (
     CodeReviewerAgentConfig,
 )
+from software_factory_poc.application.core.agents.common.exceptions.flow_failed_error import FlowFailedError
 from software_factory_poc.application.core.agents.reasoner.reasoner_agent import ReasonerAgent
 from software_factory_poc.application.core.agents.reporter.reporter_agent import ReporterAgent
 from software_factory_poc.application.core.agents.research.research_agent import ResearchAgent
@@ -51,6 +52,9 @@ class PerformCodeReviewUseCase:
             # 3. Delegate execution
             self._delegate_execution(orchestrator, task)
 
+        except FlowFailedError:
+            # Already reported on the task by the agent
+            raise
         except Exception as e:
             # 4. Safety Net
             self._handle_critical_error(task, e, reporter)
@@ -90,7 +94,8 @@ class PerformCodeReviewUseCase:
             reporter=reporter,
             vcs=vcs,
             researcher=researcher,
-            reasoner=reasoner
+            reasoner=reasoner,
+            phase_tracker=self.resolver.resolve_phase_tracker()
         )
 
     def _delegate_execution(self, orchestrator: CodeReviewerAgent, task: Task) -> None:
@@ -106,6 +111,7 @@ class PerformCodeReviewUseCase:
         if reporter:
             try:
                 reporter.report_failure(task.key, f"System Error (Initialization): {str(e)}")
+                reporter.flush(task.key)
             except Exception as report_error:
                 logger.error(f"Failed to report failure to tracker: {report_error}")
         
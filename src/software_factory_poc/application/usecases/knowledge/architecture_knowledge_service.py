@@ -1,34 +1,41 @@
 from __future__ import annotations
 
-import time
 from typing import Optional
 
+from software_factory_poc.application.core.agents.research.config.research_provider_type import ResearchProviderType
 from software_factory_poc.application.core.agents.research.ports.confluence_provider import ConfluenceProvider
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.configuration.research_cache_settings import ResearchCacheSettings
 from software_factory_poc.infrastructure.configuration.tool_settings import ToolSettings
 
 
 class ArchitectureKnowledgeService:
-    def __init__(self, provider: ConfluenceProvider, settings: ToolSettings) -> None:
+    def __init__(
+        self,
+        provider: ConfluenceProvider,
+        settings: ToolSettings,
+        cache: Optional[ResearchCache] = None,
+        cache_settings: Optional[ResearchCacheSettings] = None,
+    ) -> None:
         self.client = provider
         self.page_id = settings.architecture_doc_page_id
-        
-        # Simple in-memory cache
-        self._cache:Optional[ str] = None
-        self._cache_timestamp: float = 0.0
-        self._cache_ttl_seconds: float = 300.0  # 5 minutes default
+
+        # Shared with CachedResearchGateway: same kind and key for the same page
+        cache_settings = cache_settings or ResearchCacheSettings()
+        self._cache: Optional[ResearchCache] = None
+        if cache_settings.enabled:
+            self._cache = cache or ResearchCache.shared(cache_settings)
 
     def get_architecture_guidelines(self) -> str:
         """
-        Retrieves the architecture guidelines from Confluence, using a cache.
+        Retrieves the architecture guidelines from Confluence, using the shared research cache
+        unless it is disabled.
         """
-        now = time.time()
-        if self._cache and (now - self._cache_timestamp < self._cache_ttl_seconds):
-            return self._cache
-        
-        content = self.client.get_page_content(self.page_id)
-        
-        # Update cache
-        self._cache = content
-        self._cache_timestamp = now
-        
-        return content
+        if self._cache is None:
+            return self.client.get_page_content(self.page_id)
+        return self._cache.get_or_load(
+            ResearchCacheKind.PAGE,
+            f"{ResearchProviderType.CONFLUENCE.value}:{self.page_id}",
+            lambda: self.client.get_page_content(self.page_id)
+        )
@@ -1,5 +1,6 @@
 from typing import Optional, Tuple, TYPE_CHECKING
 
+from software_factory_poc.application.core.agents.common.exceptions.flow_failed_error import FlowFailedError
 from software_factory_poc.application.core.agents.reasoner.reasoner_agent import ReasonerAgent
 from software_factory_poc.application.core.agents.reporter.reporter_agent import ReporterAgent
 from software_factory_poc.application.core.agents.research.research_agent import ResearchAgent
@@ -49,6 +50,9 @@ class CreateScaffoldingUseCase:
             # 3. Delegate to Orchestrator
             self._delegate_execution(orchestrator, task)
 
+        except FlowFailedError:
+            # Already reported on the task by the agent
+            raise
         except Exception as e:
             # 4. Safety Net (Circuit Breaker)
             self._handle_critical_error(task, e, reporter)
@@ -85,7 +89,9 @@ class CreateScaffoldingUseCase:
             reporter=reporter,
             vcs=vcs,
             researcher=researcher,
-            reasoner=reasoner
+            reasoner=reasoner,
+            phase_tracker=self.resolver.resolve_phase_tracker(),
+            checkpoints=self.resolver.resolve_checkpoint_store()
         )
 
     def _delegate_execution(self, orchestrator: ScaffoldingAgent, task: Task) -> None:
@@ -104,6 +110,7 @@ class CreateScaffoldingUseCase:
         if reporter:
             try:
                 reporter.report_failure(task.key, f"System Error (Initialization): {str(e)}")
+                reporter.flush(task.key)
             except Exception as report_error:
                 logger.error(f"Failed to report system failure to tracker: {report_error}")
         
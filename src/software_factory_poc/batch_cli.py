@@ -0,0 +1,51 @@
+import argparse
+import json
+import sys
+from typing import Optional
+
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.entrypoints.api.app_factory import build_batch_service, build_job_worker_pool
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+from software_factory_poc.infrastructure.resolution.app_container import AppContainer
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="sf-poc-batch", description="Scaffold many Jira issues in one run.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--keys", nargs="+", metavar="ISSUE_KEY", help="Jira issues to scaffold")
+    source.add_argument("--jql", help="JQL query selecting the issues to scaffold")
+    parser.add_argument("--timeout", type=float, default=3600.0, help="Seconds to wait for the batch to finish")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds between two progress checks")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Runs a scaffolding batch in-process: a local worker pool executes the queued runs
+    and the consolidated report is printed as JSON. Exit code 1 if any issue failed.
+    """
+    args = parse_args(argv)
+    LoggerFactoryService.configure_root_logger()
+
+    container = AppContainer()
+    job_settings = JobQueueSettings()
+    job_pool = build_job_worker_pool(job_settings, container)
+    job_pool.start()
+    try:
+        service = build_batch_service(container, job_pool)
+        report = service.submit(issue_keys=args.keys, jql=args.jql)
+        # The stored batch only disappears once its TTL expires; keep the submitted report then
+        report = service.wait(report.batch_id, timeout=args.timeout, poll_interval=args.poll_interval) or report
+    finally:
+        job_pool.drain(job_settings.drain_timeout_seconds)
+        job_pool.queue.close()
+        container.close()
+
+    print(json.dumps(report.to_dict(), indent=2))
+    if not report.done:
+        return 2
+    return 0 if report.counts.get("succeeded", 0) == len(report.items) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+from software_factory_poc.infrastructure.batch.batch_item import BatchItem
+from software_factory_poc.infrastructure.batch.batch_report import BatchReport
+from software_factory_poc.infrastructure.batch.batch_scaffolding_service import BatchScaffoldingService
+
+__all__ = ["BatchItem", "BatchReport", "BatchScaffoldingService"]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+
+REJECTED = "rejected"
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """
+    One issue of a scaffolding batch. `status` is the job status, or "rejected" when
+    the issue never became a job (invalid key, issue not found).
+    """
+    issue_key: str
+    status: str
+    job_id: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_ms: Optional[float] = None
+    deduplicated: bool = False
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status == REJECTED or JobStatus(self.status).is_terminal
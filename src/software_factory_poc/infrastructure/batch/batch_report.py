@@ -0,0 +1,30 @@
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+
+from software_factory_poc.infrastructure.batch.batch_item import BatchItem
+
+
+@dataclass(frozen=True)
+class BatchReport:
+    """Consolidated status of a scaffolding batch."""
+    batch_id: str
+    created_at: float
+    items: list[BatchItem] = field(default_factory=list)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        return dict(Counter(item.status for item in self.items))
+
+    @property
+    def done(self) -> bool:
+        return all(item.is_terminal for item in self.items)
+
+    def to_dict(self) -> dict:
+        return {
+            "batch_id": self.batch_id,
+            "created_at": self.created_at,
+            "done": self.done,
+            "total": len(self.items),
+            "counts": self.counts,
+            "items": [asdict(item) for item in self.items],
+        }
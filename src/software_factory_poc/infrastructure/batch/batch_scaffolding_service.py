@@ -0,0 +1,150 @@
+import json
+import re
+import time
+import uuid
+from dataclasses import asdict
+from typing import Any, Callable, Optional
+
+from software_factory_poc.application.core.agents.reporter.ports.task_tracker_gateway import TaskTrackerGateway
+from software_factory_poc.application.core.agents.research.ports.research_gateway import ResearchGateway
+from software_factory_poc.infrastructure.batch.batch_item import REJECTED, BatchItem
+from software_factory_poc.infrastructure.batch.batch_report import BatchReport
+from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+_ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+
+
+class BatchScaffoldingService:
+    """
+    Scaffolds many Jira issues in one go (migration waves).
+    1. the issues (explicit keys or a JQL query) are fetched with bulk searches;
+    2. research shared by every run (the architecture page) is loaded once into the research cache;
+    3. each issue becomes a regular scaffolding job, so the runs execute concurrently on the
+       worker pool under its concurrency caps, with retries, checkpoints and run tracking.
+    Batches are kept in the shared store for `batch_ttl_seconds`, and run outcomes are read
+    from the job queue, so any server process can report on a batch submitted to another one.
+    Gateways and configuration are supplied as callables, resolved when a batch is submitted.
+    """
+
+    def __init__(
+        self,
+        tracker: Callable[[], TaskTrackerGateway],
+        research: Callable[[], ResearchGateway],
+        job_pool: JobWorkerPool,
+        architecture_page_id: Callable[[], Optional[str]] = lambda: None,
+        max_issues: int = 200,
+        store: Optional[SharedStore] = None,
+        batch_ttl_seconds: int = 86400,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.tracker = tracker
+        self.research = research
+        self.job_pool = job_pool
+        self.architecture_page_id = architecture_page_id
+        self.max_issues = max_issues
+        self.store = store or InMemorySharedStore()
+        self.batch_ttl_seconds = batch_ttl_seconds
+        self._clock = clock
+
+    def submit(self, issue_keys: Optional[list[str]] = None, jql: Optional[str] = None) -> BatchReport:
+        """Queues a scaffolding run per issue. Raises ValueError unless exactly one of keys/JQL is given."""
+        if bool(issue_keys) == bool(jql):
+            raise ValueError("Provide either a list of issue keys or a JQL query")
+
+        tracker = self.tracker()
+        if jql:
+            issue_keys = tracker.search_task_ids(jql, limit=self.max_issues)
+        keys, items = self._normalize_keys(issue_keys or [])
+
+        tasks = {task.key: task for task in tracker.get_tasks(keys)} if keys else {}
+        if tasks:
+            self._warm_shared_research()
+
+        for key in keys:
+            task = tasks.get(key)
+            if task is None:
+                items.append(BatchItem(issue_key=key, status=REJECTED, error="Issue not found"))
+                continue
+            submission = self.job_pool.submit(JobKind.SCAFFOLDING, task)
+            items.append(BatchItem(
+                issue_key=key,
+                status=submission.job.status.value,
+                job_id=submission.job.id,
+                deduplicated=not submission.created,
+            ))
+
+        batch_id = uuid.uuid4().hex
+        batch = {"created_at": self._clock(), "items": [asdict(item) for item in items]}
+        self.store.set(self._key(batch_id), json.dumps(batch), ex=self.batch_ttl_seconds)
+        logger.info(f"Batch {batch_id}: {len(tasks)} scaffolding run(s) queued, {len(items) - len(tasks)} rejected")
+        return self._build_report(batch_id, batch)
+
+    def report(self, batch_id: str) -> Optional[BatchReport]:
+        raw = self.store.get(self._key(batch_id))
+        if raw is None:
+            return None
+        return self._build_report(batch_id, json.loads(raw))
+
+    def _build_report(self, batch_id: str, batch: dict[str, Any]) -> BatchReport:
+        items = [self._current(BatchItem(**item)) for item in batch["items"]]
+        return BatchReport(batch_id=batch_id, created_at=batch["created_at"], items=items)
+
+    def wait(self, batch_id: str, timeout: float, poll_interval: float = 1.0) -> Optional[BatchReport]:
+        """Blocks until every run of the batch has finished or `timeout` elapses; returns the last report."""
+        deadline = time.monotonic() + timeout
+        report = self.report(batch_id)
+        while report is not None and not report.done and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            report = self.report(batch_id)
+        return report
+
+    @staticmethod
+    def _key(batch_id: str) -> str:
+        return f"batch:{batch_id}"
+
+    def _normalize_keys(self, issue_keys: list[str]) -> tuple[list[str], list[BatchItem]]:
+        keys: list[str] = []
+        rejected: list[BatchItem] = []
+        seen: set[str] = set()
+        for raw in issue_keys:
+            key = raw.strip().upper()
+            if key in seen:
+                continue
+            seen.add(key)
+            if not _ISSUE_KEY.match(key):
+                rejected.append(BatchItem(issue_key=raw, status=REJECTED, error="Invalid issue key"))
+            elif len(keys) >= self.max_issues:
+                rejected.append(BatchItem(issue_key=key, status=REJECTED, error=f"Batch limit of {self.max_issues} issues"))
+            else:
+                keys.append(key)
+        return keys, rejected
+
+    def _warm_shared_research(self) -> None:
+        # Every run of the batch reads the architecture page; load it once into the research cache
+        try:
+            page_id = self.architecture_page_id()
+            if page_id:
+                self.research().get_page_content(page_id)
+        except Exception as e:
+            logger.warning(f"Shared research not pre-loaded for the batch: {e}")
+
+    def _current(self, item: BatchItem) -> BatchItem:
+        if item.job_id is None:
+            return item
+        job = self.job_pool.queue.get(item.job_id)
+        if job is None:
+            return item
+        return BatchItem(
+            issue_key=item.issue_key,
+            status=job.status.value,
+            job_id=item.job_id,
+            error=job.last_error,
+            elapsed_ms=job.elapsed_ms if job.status.is_terminal else None,
+            deduplicated=item.deduplicated,
+        )
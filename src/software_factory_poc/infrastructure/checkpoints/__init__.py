@@ -0,0 +1,3 @@
+from software_factory_poc.infrastructure.checkpoints.sqlite_flow_checkpoint_store import SqliteFlowCheckpointStore
+
+__all__ = ["SqliteFlowCheckpointStore"]
@@ -0,0 +1,95 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Union
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.agents.common.ports.flow_checkpoint_store import FlowCheckpointStore
+from software_factory_poc.application.core.domain.entities.task import Task
+from software_factory_poc.infrastructure.jobs.task_fingerprint import TaskFingerprint
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    flow TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    output TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (flow, issue_key, config_hash, phase)
+);
+"""
+
+
+class SqliteFlowCheckpointStore(FlowCheckpointStore):
+    """
+    Phase checkpoints on a local SQLite file (WAL mode), keyed by flow, issue key and config hash.
+    A checkpoint is an optimisation: storage errors are logged and the flow carries on without it.
+    """
+
+    def __init__(self, db_path: Union[str, Path], ttl_seconds: float = 7 * 24 * 3600.0,
+                 clock: Callable[[], float] = time.time):
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+
+    def load(self, flow: str, task: Task) -> dict[str, Any]:
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT phase, output FROM checkpoints "
+                    "WHERE flow = ? AND issue_key = ? AND config_hash = ? AND saved_at >= ?",
+                    (flow, task.key, TaskFingerprint.config_hash(task), self._clock() - self.ttl_seconds),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load checkpoints for {task.key}: {e}")
+            return {}
+        return {phase: json.loads(output) for phase, output in rows}
+
+    def save(self, flow: str, task: Task, phase: RunPhase, output: Any) -> None:
+        config_hash = TaskFingerprint.config_hash(task)
+        try:
+            with self._lock:
+                # Outputs computed for a previous version of the config can never be resumed
+                self._conn.execute(
+                    "DELETE FROM checkpoints WHERE flow = ? AND issue_key = ? AND config_hash != ?",
+                    (flow, task.key, config_hash),
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO checkpoints (flow, issue_key, config_hash, phase, output, saved_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (flow, task.key, config_hash, RunPhase(phase).value, json.dumps(output), self._clock()),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Could not save {phase} checkpoint for {task.key}: {e}")
+
+    def clear(self, flow: str, task: Task) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM checkpoints WHERE flow = ? AND issue_key = ?", (flow, task.key))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not clear checkpoints for {task.key}: {e}")
+
+    def purge_expired(self) -> int:
+        """Deletes checkpoints past their TTL. Returns how many rows were removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM checkpoints WHERE saved_at < ?", (self._clock() - self.ttl_seconds,)
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
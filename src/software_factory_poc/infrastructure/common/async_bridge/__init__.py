@@ -0,0 +1,3 @@
+from software_factory_poc.infrastructure.common.async_bridge.background_event_loop import BackgroundEventLoop
+
+__all__ = ["BackgroundEventLoop"]
@@ -0,0 +1,5 @@
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.common.cache.research_cache_metrics import ResearchCacheMetrics
+
+__all__ = ["ResearchCache", "ResearchCacheKind", "ResearchCacheMetrics"]
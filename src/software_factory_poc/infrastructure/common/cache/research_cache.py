@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.common.cache.research_cache_metrics import ResearchCacheMetrics
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.configuration.research_cache_settings import ResearchCacheSettings
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+_T = TypeVar("_T")
+_MISSING = object()
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    stored_at: float
+
+
+class ResearchCache:
+    """
+    Thread-safe, size-bounded research cache with per-kind TTLs.
+    Expired entries are served for a grace window (stale-while-revalidate)
+    while a background refresh replaces them. Concurrent misses on the same key
+    share a single load (e.g. a batch of runs needing the same architecture page).
+    With a `shared_store`, text entries are also written to a second tier shared by every
+    worker process, so a page loaded (or pre-warmed) by one process is a hit for the others.
+    """
+
+    _shared: Optional["ResearchCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        ttl_by_kind: dict[ResearchCacheKind, float],
+        stale_window_seconds: float = 0.0,
+        max_entries: int = 256,
+        refresh_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+        submit_refresh: Optional[Callable[[Callable[[], None]], Any]] = None,
+        shared_store: Optional[SharedStore] = None,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.ttl_by_kind = dict(ttl_by_kind)
+        self.stale_window_seconds = stale_window_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], _CacheEntry] = OrderedDict()
+        self._refreshing: set[tuple[str, str]] = set()
+        self._loading: dict[tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0, "stale_hits": 0, "misses": 0,
+            "refreshes": 0, "refresh_failures": 0, "evictions": 0, "coalesced": 0, "shared_hits": 0,
+        }
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refresh_workers = max(1, refresh_workers)
+        self._submit_refresh = submit_refresh or self._submit_to_executor
+        self.shared_store = shared_store
+        # The shared tier stores wall-clock timestamps: monotonic clocks differ between processes
+        self._wall_clock = wall_clock
+
+    @classmethod
+    def from_settings(
+        cls, settings: ResearchCacheSettings, shared_store: Optional[SharedStore] = None
+    ) -> "ResearchCache":
+        return cls(
+            ttl_by_kind={
+                ResearchCacheKind.PAGE: settings.page_ttl_seconds,
+                ResearchCacheKind.SEARCH: settings.search_ttl_seconds,
+                ResearchCacheKind.PROJECT_CONTEXT: settings.project_context_ttl_seconds,
+            },
+            stale_window_seconds=settings.stale_window_seconds,
+            max_entries=settings.max_entries,
+            refresh_workers=settings.refresh_workers,
+            shared_store=shared_store,
+        )
+
+    @classmethod
+    def shared(
+        cls, settings: Optional[ResearchCacheSettings] = None, shared_store: Optional[SharedStore] = None
+    ) -> "ResearchCache":
+        """
+        Returns the process-wide cache, building it on first use.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.from_settings(settings or ResearchCacheSettings(), shared_store)
+            return cls._shared
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.shutdown()
+            cls._shared = None
+
+    def get_or_load(self, kind: ResearchCacheKind, key: str, loader: Callable[[], _T]) -> _T:
+        """
+        Returns the cached value for (kind, key) or loads it with `loader`.
+        Loader errors on a miss propagate (to every caller waiting on that load) and nothing is cached.
+        """
+        cache_key = (kind.value, key)
+        ttl = self.ttl_by_kind.get(kind, 0.0)
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+
+            if entry is not None and now - entry.stored_at < ttl:
+                self._entries.move_to_end(cache_key)
+                self._counters["hits"] += 1
+                return entry.value
+
+            if entry is not None and now - entry.stored_at < ttl + self.stale_window_seconds:
+                self._entries.move_to_end(cache_key)
+                self._counters["stale_hits"] += 1
+                schedule_refresh = cache_key not in self._refreshing
+                if schedule_refresh:
+                    self._refreshing.add(cache_key)
+                stale_value = entry.value
+            else:
+                self._counters["misses"] += 1
+                stale_value = None
+                schedule_refresh = False
+                entry = None
+                existing = self._loading.get(cache_key)
+                owns_load = existing is None
+                if existing is None:
+                    pending: Future = Future()
+                    self._loading[cache_key] = pending
+                else:
+                    pending = existing
+                    self._counters["coalesced"] += 1
+
+        if entry is not None:
+            if schedule_refresh:
+                logger.debug(f"Serving stale research entry {cache_key}, refreshing in background.")
+                self._submit_refresh(lambda: self._refresh(cache_key, loader))
+            return stale_value
+
+        if not owns_load:
+            return pending.result()
+
+        try:
+            shared = self._load_shared(cache_key, ttl)
+            if shared is _MISSING:
+                value, stored_at = loader(), None
+                self._store_shared(cache_key, value, ttl)
+            else:
+                value, stored_at = shared
+        except BaseException as e:
+            self._end_load(cache_key)
+            pending.set_exception(e)
+            raise
+        self._store(cache_key, value, stored_at)
+        self._end_load(cache_key)
+        pending.set_result(value)
+        return value
+
+    def put(self, kind: ResearchCacheKind, key: str, value: Any) -> None:
+        self._store((kind.value, key), value)
+        self._store_shared((kind.value, key), value, self.ttl_by_kind.get(kind, 0.0))
+
+    def peek(self, kind: ResearchCacheKind, key: str) -> Optional[Any]:
+        """
+        Returns the stored value regardless of freshness, without touching counters.
+        """
+        with self._lock:
+            entry = self._entries.get((kind.value, key))
+            return entry.value if entry else None
+
+    def invalidate(self, kind: ResearchCacheKind, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is not None:
+                self._entries.pop((kind.value, key), None)
+                return
+            for cache_key in [k for k in self._entries if k[0] == kind.value]:
+                del self._entries[cache_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> ResearchCacheMetrics:
+        with self._lock:
+            return ResearchCacheMetrics(size=len(self._entries), **self._counters)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _store(self, cache_key: tuple[str, str], value: Any, stored_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._entries[cache_key] = _CacheEntry(
+                value=value, stored_at=self._clock() if stored_at is None else stored_at
+            )
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _load_shared(self, cache_key: tuple[str, str], ttl: float) -> Any:
+        """
+        (value, local stored_at) of a fresh shared entry, or _MISSING. Stale shared entries are
+        reloaded, not served. The local timestamp keeps the age the entry has in the shared tier.
+        """
+        if self.shared_store is None:
+            return _MISSING
+        try:
+            raw = self.shared_store.get(self._shared_key(cache_key))
+            if raw is None:
+                return _MISSING
+            entry = json.loads(raw)
+            age = self._wall_clock() - entry["t"]
+        except Exception as e:
+            logger.warning(f"Shared research cache read failed for {cache_key}: {e}")
+            return _MISSING
+        if age >= ttl:
+            return _MISSING
+        with self._lock:
+            self._counters["shared_hits"] += 1
+        return entry["v"], self._clock() - max(0.0, age)
+
+    def _store_shared(self, cache_key: tuple[str, str], value: Any, ttl: float) -> None:
+        # Only text is shared; structured values (project contexts) stay in the process
+        if self.shared_store is None or not isinstance(value, str):
+            return
+        try:
+            self.shared_store.set(
+                self._shared_key(cache_key),
+                json.dumps({"v": value, "t": self._wall_clock()}),
+                ex=ttl + self.stale_window_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"Shared research cache write failed for {cache_key}: {e}")
+
+    @staticmethod
+    def _shared_key(cache_key: tuple[str, str]) -> str:
+        return f"research:{cache_key[0]}:{cache_key[1]}"
+
+    def _end_load(self, cache_key: tuple[str, str]) -> None:
+        with self._lock:
+            self._loading.pop(cache_key, None)
+
+    def _refresh(self, cache_key: tuple[str, str], loader: Callable[[], Any]) -> None:
+        try:
+            value = loader()
+            self._store(cache_key, value)
+            self._store_shared(cache_key, value, self._ttl_of(cache_key))
+            with self._lock:
+                self._counters["refreshes"] += 1
+        except Exception as e:
+            logger.warning(f"Background refresh failed for research entry {cache_key}: {e}")
+            with self._lock:
+                self._counters["refresh_failures"] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(cache_key)
+
+    def _ttl_of(self, cache_key: tuple[str, str]) -> float:
+        return next((ttl for kind, ttl in self.ttl_by_kind.items() if kind.value == cache_key[0]), 0.0)
+
+    def _submit_to_executor(self, job: Callable[[], None]) -> None:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers,
+                    thread_name_prefix="research-cache-refresh"
+                )
+            executor = self._executor
+        executor.submit(job)
@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class ResearchCacheKind(StrEnum):
+    PAGE = "page"
+    SEARCH = "search"
+    PROJECT_CONTEXT = "project_context"
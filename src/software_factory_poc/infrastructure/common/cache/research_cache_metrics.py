@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ResearchCacheMetrics:
+    """
+    Point-in-time snapshot of the research cache counters.
+    """
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    evictions: int = 0
+    coalesced: int = 0
+    shared_hits: int = 0
+    size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        if not lookups:
+            return 0.0
+        return (self.hits + self.stale_hits) / lookups
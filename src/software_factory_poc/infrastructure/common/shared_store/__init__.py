@@ -0,0 +1,6 @@
+from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store_factory import SharedStoreFactory
+from software_factory_poc.infrastructure.common.shared_store.sqlite_shared_store import SqliteSharedStore
+
+__all__ = ["InMemorySharedStore", "SharedStore", "SharedStoreFactory", "SqliteSharedStore"]
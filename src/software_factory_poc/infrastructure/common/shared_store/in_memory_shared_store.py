@@ -0,0 +1,58 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+
+
+class InMemorySharedStore(SharedStore):
+    """
+    Process-local SharedStore. Stand-in for tests and single-process deployments;
+    nothing is shared between worker processes.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+        self._values: dict[str, tuple[str, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._live(key)
+
+    def set(self, key: str, value: str, ex: Optional[float] = None, nx: bool = False) -> bool:
+        with self._lock:
+            if nx and self._live(key) is not None:
+                return False
+            self._values[key] = (value, self._expiry(ex))
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def incr(self, key: str, amount: int = 1, ex: Optional[float] = None) -> int:
+        with self._lock:
+            current = self._live(key)
+            if current is None:
+                value, expires_at = amount, self._expiry(ex)
+            else:
+                value, expires_at = int(current) + amount, self._values[key][1]
+            self._values[key] = (str(value), expires_at)
+            return value
+
+    def _live(self, key: str) -> Optional[str]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._values[key]
+            return None
+        return value
+
+    def close(self) -> None:
+        """Nothing to release: the values live in this process."""
+
+    def _expiry(self, ex: Optional[float]) -> Optional[float]:
+        return self._clock() + ex if ex is not None else None
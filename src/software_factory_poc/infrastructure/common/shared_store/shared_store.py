@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class SharedStore(ABC):
+    """
+    Key-value store shared by every worker process of the service.
+    The operations mirror the Redis commands of the same name (GET, SET EX/NX, DEL, INCRBY)
+    so a Redis-backed implementation can be dropped in for multi-host deployments.
+    Values are strings; callers serialize (JSON) what they store.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Returns the value, or None when the key is missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, ex: Optional[float] = None, nx: bool = False) -> bool:
+        """
+        Stores the value, expiring after `ex` seconds when given.
+        With `nx`, only stores when the key does not exist; returns whether the value was stored.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def incr(self, key: str, amount: int = 1, ex: Optional[float] = None) -> int:
+        """
+        Atomically adds `amount` to an integer counter (missing keys start at 0) and returns the new value.
+        `ex` sets the expiry when the counter is created.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases the backend's resources (connections, files)."""
+        pass
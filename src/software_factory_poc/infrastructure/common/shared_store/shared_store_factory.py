@@ -0,0 +1,37 @@
+import threading
+from typing import Optional
+
+from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.common.shared_store.sqlite_shared_store import SqliteSharedStore
+from software_factory_poc.infrastructure.configuration.shared_store_backend import SharedStoreBackend
+from software_factory_poc.infrastructure.configuration.shared_store_settings import SharedStoreSettings
+
+
+class SharedStoreFactory:
+    """
+    Builds the SharedStore selected by the settings and keeps one per process.
+    """
+
+    _shared: Optional[SharedStore] = None
+    _shared_lock = threading.Lock()
+
+    @staticmethod
+    def build(settings: SharedStoreSettings) -> SharedStore:
+        if settings.backend == SharedStoreBackend.SQLITE:
+            return SqliteSharedStore(settings.db_path)
+        return InMemorySharedStore()
+
+    @classmethod
+    def shared(cls, settings: Optional[SharedStoreSettings] = None) -> SharedStore:
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.build(settings or SharedStoreSettings())
+            return cls._shared
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        with cls._shared_lock:
+            if cls._shared is not None:
+                cls._shared.close()
+            cls._shared = None
@@ -0,0 +1,95 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shared_kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_shared_kv_expiry ON shared_kv (expires_at);
+"""
+
+
+class SqliteSharedStore(SharedStore):
+    """
+    SharedStore on a local SQLite file in WAL mode: every worker process on the host opens
+    the same file, readers never block the writer and each command is a single atomic statement.
+    Expired keys are ignored on read and purged every `purge_every` writes.
+    """
+
+    def __init__(self, db_path: Union[str, Path], clock: Callable[[], float] = time.time, purge_every: int = 500):
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._purge_every = max(1, purge_every)
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM shared_kv WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, self._clock())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ex: Optional[float] = None, nx: bool = False) -> bool:
+        now = self._clock()
+        expires_at = now + ex if ex is not None else None
+        with self._lock:
+            if nx:
+                # Takes over only a missing or expired key
+                cursor = self._conn.execute(
+                    "INSERT INTO shared_kv (key, value, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                    "WHERE shared_kv.expires_at IS NOT NULL AND shared_kv.expires_at <= ?",
+                    (key, value, expires_at, now)
+                )
+            else:
+                cursor = self._conn.execute(
+                    "INSERT OR REPLACE INTO shared_kv (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at)
+                )
+            self._after_write(now)
+        return cursor.rowcount > 0
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM shared_kv WHERE key = ?", (key,))
+
+    def incr(self, key: str, amount: int = 1, ex: Optional[float] = None) -> int:
+        now = self._clock()
+        expires_at = now + ex if ex is not None else None
+        with self._lock:
+            row = self._conn.execute(
+                "INSERT INTO shared_kv (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "value = CASE WHEN shared_kv.expires_at IS NOT NULL AND shared_kv.expires_at <= ? "
+                "THEN excluded.value ELSE CAST(CAST(shared_kv.value AS INTEGER) + ? AS TEXT) END, "
+                "expires_at = CASE WHEN shared_kv.expires_at IS NOT NULL AND shared_kv.expires_at <= ? "
+                "THEN excluded.expires_at ELSE shared_kv.expires_at END "
+                "RETURNING value",
+                (key, str(amount), expires_at, now, amount, now)
+            ).fetchone()
+            self._after_write(now)
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _after_write(self, now: float) -> None:
+        self._writes += 1
+        if self._writes % self._purge_every == 0:
+            self._conn.execute("DELETE FROM shared_kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
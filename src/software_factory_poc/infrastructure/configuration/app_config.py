@@ -1,11 +1,16 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .checkpoint_settings import CheckpointSettings
 from .confluence_settings import ConfluenceSettings
 from .gitlab_settings import GitLabSettings
 from .jira_settings import JiraSettings
+from .job_queue_settings import JobQueueSettings
 from .llm_settings import LlmSettings
+from .reporter_settings import ReporterSettings
+from .research_cache_settings import ResearchCacheSettings
 from .scaffolding_settings import ScaffoldingSettings
+from .shared_store_settings import SharedStoreSettings
 from .tool_settings import ToolSettings
 
 
@@ -20,6 +25,11 @@ class AppConfig(BaseSettings):
     llm: LlmSettings = Field(default_factory=LlmSettings)
     scaffolding: ScaffoldingSettings = Field(default_factory=ScaffoldingSettings)
     tools: ToolSettings = Field(default_factory=ToolSettings)
+    research_cache: ResearchCacheSettings = Field(default_factory=ResearchCacheSettings)
+    job_queue: JobQueueSettings = Field(default_factory=JobQueueSettings)
+    checkpoints: CheckpointSettings = Field(default_factory=CheckpointSettings)
+    shared_store: SharedStoreSettings = Field(default_factory=SharedStoreSettings)
+    reporter: ReporterSettings = Field(default_factory=ReporterSettings)
 
     model_config = SettingsConfigDict(
         env_file=".env",
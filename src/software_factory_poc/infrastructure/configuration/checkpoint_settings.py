@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CheckpointSettings(BaseSettings):
+    """
+    Settings for the checkpoints that let a failed agent flow resume after its last successful phase.
+    """
+    enabled: bool = Field(default=True, description="Persist phase outputs and resume failed flows")
+    db_path: Path = Field(
+        default=Path("./runtime_data/checkpoints.sqlite3"),
+        description="SQLite file backing the checkpoints"
+    )
+    ttl_seconds: float = Field(
+        default=7 * 24 * 3600.0,
+        description="Checkpoints older than this are ignored and purged"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="CHECKPOINT_",
+        case_sensitive=False,
+        extra="ignore"
+    )
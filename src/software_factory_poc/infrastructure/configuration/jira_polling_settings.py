@@ -0,0 +1,32 @@
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class JiraPollingSettings(BaseSettings):
+    """
+    Settings for the scheduled JQL poller, an alternative to webhooks for Jira instances
+    that cannot reach the service. Matching issues are queued like webhook triggers.
+    """
+    enabled: bool = Field(default=False, description="Poll Jira on an interval")
+    scaffolding_jql: Optional[str] = Field(
+        default=None,
+        description='Issues to scaffold, e.g. project = KAN AND status = "To Do" AND labels = scaffolding'
+    )
+    code_review_jql: Optional[str] = Field(default=None, description="Issues whose merge request should be reviewed")
+    interval_seconds: float = Field(default=60.0, description="Delay between two polls")
+    page_size: int = Field(default=50, description="Issues per search request and per bulk fetch")
+    concurrency: int = Field(default=2, description="Bulk fetches of changed issues running in parallel")
+    max_issues_per_poll: int = Field(default=500, description="Upper bound of issues read by one poll of a query")
+    initial_lookback_minutes: int = Field(default=60, description="Window of the first poll, before any cursor exists")
+    overlap_seconds: float = Field(
+        default=120.0,
+        description="Re-read window before the cursor (Jira indexing lag, minute precision of JQL dates)"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="JIRA_POLLING_",
+        case_sensitive=False,
+        extra="ignore"
+    )
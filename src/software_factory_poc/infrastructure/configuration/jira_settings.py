@@ -25,6 +25,31 @@ class JiraSettings(BaseSettings):
     webhook_secret: SecretStr = Field(..., description="Token to validate incoming Jira webhooks")
     transition_in_review: str = Field(default="In Review",
                                       description="Name of the transition to move issue to In Review")
+    transition_cache_ttl_seconds: float = Field(
+        default=3600.0,
+        description="How long the transitions of a (project, issue type, status) are reused without asking Jira"
+    )
+    issue_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description="How long an issue read by an agent run is reused before Jira is asked again (0 disables)"
+    )
+    bulk_concurrency: int = Field(
+        default=8,
+        description="Requests in flight at once for bulk comments and transitions"
+    )
+    rate_limit_per_second: float = Field(
+        default=10.0,
+        description="Jira requests per second allowed to this process; lowered on its own while Jira throttles"
+    )
+    rate_limit_burst: int = Field(default=20, description="Requests that may be sent at once after an idle period")
+    max_throttle_retries: int = Field(
+        default=3,
+        description="Times a throttled (429) request is re-sent after the Retry-After wait"
+    )
+    max_retry_after_seconds: float = Field(
+        default=60.0,
+        description="Longest Retry-After waited before re-sending; a longer one fails the call instead"
+    )
 
     def validate_credentials(self) -> None:
         """
@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class JobQueueSettings(BaseSettings):
+    """
+    Settings for the durable job queue and the worker pool that executes agent runs.
+    """
+    db_path: Path = Field(default=Path("./runtime_data/jobs.sqlite3"), description="SQLite file backing the queue")
+    workers: int = Field(default=4, description="Number of worker threads executing jobs")
+    max_attempts: int = Field(default=3, description="Attempts per job before it is marked as failed")
+    backoff_base_seconds: float = Field(default=5.0, description="Delay before the first retry (doubles per attempt)")
+    backoff_max_seconds: float = Field(default=300.0, description="Upper bound for the retry delay")
+    poll_interval_seconds: float = Field(default=1.0, description="Idle wait between two queue polls")
+    dedup_window_seconds: float = Field(
+        default=120.0,
+        description="Identical triggers (issue, webhook event, config) within this window reuse the existing run"
+    )
+    # Fair scheduling across Jira projects (tenants)
+    tenant_max_concurrency: int = Field(default=2, description="Running jobs allowed per Jira project key")
+    tenant_concurrency_overrides: dict[str, int] = Field(
+        default_factory=dict,
+        description='Per-project cap overrides, e.g. {"KAN": 4}'
+    )
+    tenant_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description='Fair-share weights per project (default 1.0), e.g. {"KAN": 2}'
+    )
+    lane_priorities: dict[str, int] = Field(
+        default_factory=lambda: {"code_review": 0, "scaffolding": 1},
+        description="Priority per job kind; lower values are dispatched first"
+    )
+    # Admission control on the webhook endpoints
+    max_queued_jobs: int = Field(
+        default=1000,
+        description="Queued jobs above which webhooks are refused with 429 (0 disables the limit)"
+    )
+    admission_retry_after_seconds: int = Field(
+        default=30,
+        description="Retry-After returned with 429/503 responses"
+    )
+    drain_timeout_seconds: float = Field(default=30.0, description="Time given to running jobs on shutdown")
+    # Several server processes may share the queue file
+    heartbeat_interval_seconds: float = Field(
+        default=10.0,
+        description="How often a process refreshes its heartbeat and re-queues the jobs of stopped peers"
+    )
+    worker_stale_after_seconds: float = Field(
+        default=60.0,
+        description="A process without heartbeat for this long is considered dead; its running jobs are re-queued"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="JOB_QUEUE_",
+        case_sensitive=False,
+        extra="ignore"
+    )
@@ -0,0 +1,27 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ReporterSettings(BaseSettings):
+    """
+    Settings for the delivery of progress reports to the task tracker.
+    """
+    async_enabled: bool = Field(
+        default=True,
+        description="Post tracker writes through a background channel instead of on the run's thread"
+    )
+    channel_lanes: int = Field(default=4, description="Delivery threads shared by all issues; each issue is delivered in order")
+    max_pending_operations: int = Field(
+        default=1000,
+        description="Queued deliveries above which posting waits for a free slot"
+    )
+    flush_timeout_seconds: float = Field(
+        default=30.0,
+        description="How long a finished run waits for its tracker writes to be delivered"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="REPORTER_",
+        case_sensitive=False,
+        extra="ignore"
+    )
@@ -0,0 +1,46 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ResearchCacheSettings(BaseSettings):
+    """
+    Settings for the process-wide research cache shared by every ResearchGateway.
+    """
+    enabled: bool = Field(default=True, description="Enable the research cache")
+    page_ttl_seconds: float = Field(default=300.0, description="Freshness window for pages fetched by ID")
+    search_ttl_seconds: float = Field(default=120.0, description="Freshness window for search results")
+    project_context_ttl_seconds: float = Field(default=600.0, description="Freshness window for project contexts")
+    stale_window_seconds: float = Field(
+        default=900.0,
+        description="Extra time an expired entry may be served while it is refreshed in background"
+    )
+    max_entries: int = Field(default=256, description="Maximum number of cached entries (LRU eviction)")
+    refresh_workers: int = Field(default=2, description="Background threads used for stale refreshes")
+    shared_tier_enabled: bool = Field(
+        default=True,
+        description="Also keep text entries in the shared store, so every worker process benefits from a load"
+    )
+
+    # Background pre-warmer (started from the FastAPI lifespan)
+    prewarm_enabled: bool = Field(default=False, description="Periodically sync Confluence spaces into the cache")
+    prewarm_interval_seconds: float = Field(default=600.0, description="Seconds between two pre-warm syncs")
+    prewarm_concurrency: int = Field(default=4, description="Maximum parallel page downloads per sync")
+    prewarm_max_pages: int = Field(default=200, description="Maximum pages synced per space")
+    prewarm_cache_fraction: float = Field(
+        default=0.5,
+        description="Share of max_entries a sync may fill; the rest is left to webhook-time lookups"
+    )
+    prewarm_technology_stacks: list[str] = Field(
+        default_factory=list,
+        description="Technology stacks whose fallback research search is kept warm"
+    )
+    prewarm_space_keys: list[str] = Field(
+        default_factory=list,
+        description="Spaces to sync. Empty means the provider space (CONFLUENCE_SPACE_KEY)"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="RESEARCH_CACHE_",
+        case_sensitive=False,
+        extra="ignore"
+    )
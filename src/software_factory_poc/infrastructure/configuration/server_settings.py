@@ -0,0 +1,18 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ServerSettings(BaseSettings):
+    """
+    Settings for the production server launched by `sf-poc-serve`.
+    Worker processes share the job queue and the shared store through their SQLite files.
+    """
+    host: str = Field(default="0.0.0.0", description="Interface the server binds to")
+    port: int = Field(default=8000, description="Port the server listens on")
+    workers: int = Field(default=0, description="Number of server processes (0 = one per CPU)")
+
+    model_config = SettingsConfigDict(
+        env_prefix="SERVER_",
+        case_sensitive=False,
+        extra="ignore"
+    )
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class SharedStoreBackend(StrEnum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from software_factory_poc.infrastructure.configuration.shared_store_backend import SharedStoreBackend
+
+
+class SharedStoreSettings(BaseSettings):
+    """
+    Settings for the state shared by the worker processes of a multi-worker deployment
+    (research cache second tier, batch reports, pre-warmer leadership).
+    """
+    backend: SharedStoreBackend = Field(
+        default=SharedStoreBackend.SQLITE,
+        description="'sqlite' shares state between the processes of one host; 'memory' keeps it per process"
+    )
+    db_path: Path = Field(
+        default=Path("./runtime_data/shared_state.sqlite3"),
+        description="SQLite file backing the shared store"
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="SHARED_STORE_",
+        case_sensitive=False,
+        extra="ignore"
+    )
@@ -19,6 +19,12 @@ class JiraAuthMode(StrEnum):
 class ToolSettings(BaseSettings):
     # Security
     jira_webhook_secret: SecretStr = Field(..., description="Token to validate incoming Jira webhooks")
+    jira_webhook_previous_secrets: Optional[SecretStr] = Field(
+        default=None, description="Comma-separated secrets still accepted while the webhook secret is rotated"
+    )
+    jira_webhook_require_signature: bool = Field(
+        default=False, description="Accept webhooks only with a valid X-Hub-Signature HMAC of the body"
+    )
 
     # Jira Config
     jira_base_url: str = Field(..., description="Jira Base URL, e.g. https://myorg.atlassian.net")
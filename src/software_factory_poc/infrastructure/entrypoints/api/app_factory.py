@@ -1,22 +1,47 @@
 import os
+from contextlib import asynccontextmanager
+from typing import Optional
 
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from software_factory_poc.infrastructure.batch.batch_scaffolding_service import BatchScaffoldingService
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store_factory import SharedStoreFactory
+from software_factory_poc.infrastructure.configuration.jira_polling_settings import JiraPollingSettings
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
 from software_factory_poc.infrastructure.configuration.main_settings import Settings
+from software_factory_poc.infrastructure.configuration.shared_store_settings import SharedStoreSettings
 from software_factory_poc.infrastructure.entrypoints.api.code_review_router import (
     router as code_review_router,
 )
 from software_factory_poc.infrastructure.entrypoints.api.health_router import (
     router as health_router,
 )
+from software_factory_poc.infrastructure.entrypoints.api.jobs_router import (
+    router as jobs_router,
+)
+from software_factory_poc.infrastructure.entrypoints.api.mappers.jira_payload_mapper import JiraPayloadMapper
+from software_factory_poc.infrastructure.entrypoints.api.runs_router import (
+    router as runs_router,
+)
 from software_factory_poc.infrastructure.entrypoints.api.scaffolding_router import (
     router as scaffolding_router,
 )
+from software_factory_poc.infrastructure.entrypoints.api.webhook_authenticator import WebhookAuthenticator
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
 from software_factory_poc.infrastructure.observability.logger_factory_service import (
     LoggerFactoryService,
 )
+from software_factory_poc.infrastructure.polling.jira_issue_poller import JiraIssuePoller
+from software_factory_poc.infrastructure.providers.tracker.jira_issue_cache import JiraIssueCache
+from software_factory_poc.infrastructure.providers.research.research_provider_factory import (
+    ResearchProviderFactory,
+)
+from software_factory_poc.infrastructure.resolution.app_container import AppContainer
 
 logger = LoggerFactoryService.build_logger(__name__)
 
@@ -38,6 +63,103 @@ def boot_diagnostics():
         logger.error(f"Error during boot diagnostics: {e}")
 
 
+def warm_up_container(container: AppContainer) -> None:
+    """Builds the shared gateways at boot. A misconfiguration is logged and retried on first use."""
+    try:
+        container.warm_up()
+    except Exception as e:
+        logger.warning(f"Application container not warmed up: {e}")
+
+
+def start_research_prewarmer(container: AppContainer):
+    """Starts the optional Confluence pre-warmer. Never blocks or breaks startup."""
+    try:
+        prewarmer = ResearchProviderFactory.build_prewarmer(container.app_config)
+        if prewarmer:
+            prewarmer.start()
+        return prewarmer
+    except Exception as e:
+        logger.warning(f"Research pre-warmer not started: {e}")
+        return None
+
+
+def build_job_worker_pool(settings: JobQueueSettings, container: AppContainer) -> JobWorkerPool:
+    """Wires the durable queue with the use cases that execute each kind of job."""
+    queue = SqliteJobQueue(settings.db_path, stale_after_seconds=settings.worker_stale_after_seconds)
+    queue.requeue_interrupted()
+    handlers = {
+        JobKind.SCAFFOLDING: lambda task: container.scaffolding_usecase().execute(task),
+        JobKind.CODE_REVIEW: lambda task: container.code_review_usecase().execute(task),
+    }
+    return JobWorkerPool(
+        queue, handlers, settings,
+        webhook_decoder=JiraPayloadMapper.from_json,
+        run_registry=container.run_registry,
+        run_scopes=(JiraIssueCache.run_scope,),
+    )
+
+
+def build_batch_service(
+    container: AppContainer, job_pool: JobWorkerPool, store: Optional[SharedStore] = None
+) -> BatchScaffoldingService:
+    """Batch scaffolding on top of the worker pool; gateways are resolved from the container on each batch."""
+    return BatchScaffoldingService(
+        tracker=lambda: container.resolver.resolve_tracker(),
+        research=lambda: container.resolver.resolve_research(),
+        job_pool=job_pool,
+        architecture_page_id=lambda: container.scaffolding_config.architecture_page_id,
+        store=store,
+    )
+
+
+def start_jira_poller(container: AppContainer, job_pool: JobWorkerPool, store: SharedStore):
+    """Starts the optional JQL poller (alternative to webhooks). Never blocks or breaks startup."""
+    try:
+        settings = JiraPollingSettings()
+        if not settings.enabled:
+            return None
+        poller = JiraIssuePoller(
+            tracker=lambda: container.resolver.resolve_tracker(),
+            job_pool=job_pool,
+            settings=settings,
+            store=store,
+        )
+        if not poller.queries:
+            logger.warning("Jira polling enabled without any JQL query; poller not started.")
+            return None
+        poller.start()
+        return poller
+    except Exception as e:
+        logger.warning(f"Jira poller not started: {e}")
+        return None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    container = AppContainer(settings=getattr(app.state, "settings", None))
+    app.state.container = container
+    warm_up_container(container)
+    job_settings = JobQueueSettings()
+    app.state.job_pool = build_job_worker_pool(job_settings, container)
+    app.state.job_pool.start()
+    shared_store = SharedStoreFactory.shared(SharedStoreSettings())
+    app.state.batch_service = build_batch_service(container, app.state.job_pool, shared_store)
+    prewarmer = start_research_prewarmer(container)
+    poller = start_jira_poller(container, app.state.job_pool, shared_store)
+    yield
+    if poller:
+        poller.stop()
+    if prewarmer:
+        prewarmer.stop()
+    if app.state.job_pool.drain(job_settings.drain_timeout_seconds):
+        app.state.job_pool.queue.close()
+    else:
+        # Busy workers still write their outcome; the connection goes away with the process
+        logger.warning("Job queue left open: workers are still running after the drain timeout.")
+    container.close()
+    SharedStoreFactory.reset_shared()
+
+
 def create_app(settings: Settings) -> FastAPI:
     # 1. CRITICAL: Configure Root Logger so INFO logs appear in Docker console
     LoggerFactoryService.configure_root_logger()
@@ -46,7 +168,9 @@ def create_app(settings: Settings) -> FastAPI:
 
     logger.info(f"--- APP INITIALIZATION: {settings.app_name} ---")
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
+    app.state.settings = settings
+    app.state.webhook_authenticator = WebhookAuthenticator.from_settings(settings)
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -60,5 +184,7 @@ def create_app(settings: Settings) -> FastAPI:
     app.include_router(health_router)
     app.include_router(scaffolding_router, prefix="/api/v1")
     app.include_router(code_review_router, prefix="/api/v1")
+    app.include_router(jobs_router, prefix="/api/v1")
+    app.include_router(runs_router, prefix="/api/v1")
 
     return app
\ No newline at end of file
@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from software_factory_poc.infrastructure.batch.batch_scaffolding_service import BatchScaffoldingService
+
+
+def get_batch_service(request: Request) -> BatchScaffoldingService:
+    """Returns the batch scaffolding service created by the application lifespan."""
+    return request.app.state.batch_service
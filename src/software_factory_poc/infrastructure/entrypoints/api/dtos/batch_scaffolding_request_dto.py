@@ -0,0 +1,15 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class BatchScaffoldingRequestDTO(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+    issue_keys: List[str] = Field(default_factory=list, description="Jira issues to scaffold")
+    jql: Optional[str] = Field(None, description="JQL query selecting the issues to scaffold")
+
+    @model_validator(mode="after")
+    def _exactly_one_source(self) -> "BatchScaffoldingRequestDTO":
+        if bool(self.issue_keys) == bool(self.jql):
+            raise ValueError("Provide either 'issue_keys' or 'jql'")
+        return self
@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+
+
+def get_job_pool(request: Request) -> JobWorkerPool:
+    """Returns the worker pool created by the application lifespan."""
+    return request.app.state.job_pool
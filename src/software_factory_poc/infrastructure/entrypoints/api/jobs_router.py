@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends
+
+from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
+from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+
+router = APIRouter()
+
+
+@router.get("/jobs/metrics", dependencies=[Depends(validate_api_key)])
+def get_job_metrics(job_pool: JobWorkerPool = Depends(get_job_pool)):
+    metrics = job_pool.scheduler.metrics()
+    return {
+        "status_counts": job_pool.queue.counts(),
+        "queued_total": metrics.total_queued,
+        "running_total": metrics.total_running,
+        "queued_by_tenant": metrics.queued_by_tenant,
+        "queued_by_lane": metrics.queued_by_lane,
+        "running_by_tenant": metrics.running_by_tenant,
+        "dispatched_by_tenant": metrics.dispatched_by_tenant,
+    }
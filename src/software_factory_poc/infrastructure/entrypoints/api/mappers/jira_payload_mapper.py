@@ -1,5 +1,9 @@
+import hashlib
 import re
-from typing import Dict, Union, Any
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Union
 
 import yaml
 
@@ -9,6 +13,11 @@ from software_factory_poc.infrastructure.observability.logger_factory_service im
 
 logger = LoggerFactoryService.build_logger(__name__)
 
+# libyaml parser when available; it builds the same objects as the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Parsed descriptions kept, least recently used evicted first
+PARSED_DESCRIPTION_CACHE_SIZE = 512
+
 
 class JiraPayloadMapper:
     """
@@ -27,6 +36,9 @@ class JiraPayloadMapper:
         re.IGNORECASE | re.DOTALL
     )
 
+    _parsed: "OrderedDict[bytes, tuple[str, Mapping[str, Any]]]" = OrderedDict()
+    _parsed_lock = threading.Lock()
+
     @classmethod
     def to_domain(cls, payload: Union[Dict, JiraWebhookDTO]) -> Task:
         """
@@ -109,35 +121,61 @@ class JiraPayloadMapper:
         logger.info(f"✅ Domain Task Created: {task.key} | Config Found: {len(task.description.config) > 0}")
         return task
 
+    @classmethod
+    def from_json(cls, raw: Union[str, bytes]) -> Task:
+        """
+        Validates a raw webhook body and maps it to a Task. Used by the job workers,
+        which receive the body exactly as it was queued by the webhook endpoints.
+        """
+        return cls.to_domain(JiraWebhookDTO.model_validate_json(raw))
+
     @classmethod
     def _parse_description_config(cls, text: str) -> TaskDescription:
         """
         Extracts YAML config from text using robust Regex.
         Separates the configuration block from the human-readable text.
+        Memoized by a digest of the text: repeated issue_updated events carry the same
+        description. The cache keeps an immutable snapshot and every call gets its own copy.
         """
-        logger.info(f"� Scanning Description ({len(text)} chars) for Config Block...")
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with cls._parsed_lock:
+            entry = cls._parsed.get(digest)
+            if entry is not None:
+                cls._parsed.move_to_end(digest)
+        if entry is None:
+            entry = cls._parse_uncached(text)
+            with cls._parsed_lock:
+                cls._parsed[digest] = entry
+                while len(cls._parsed) > PARSED_DESCRIPTION_CACHE_SIZE:
+                    cls._parsed.popitem(last=False)
+        else:
+            logger.debug("Description config served from cache.")
+
+        clean_text, snapshot = entry
+        return TaskDescription(raw_content=clean_text, config=cls._thaw(snapshot))
+
+    @classmethod
+    def _parse_uncached(cls, text: str) -> tuple[str, Mapping[str, Any]]:
+        logger.info(f"🔎 Scanning Description ({len(text)} chars) for Config Block...")
         match = cls.CODE_BLOCK_PATTERN.search(text)
         logger.info(f"🧩 Match Found: {bool(match)}")
-        
+
         config: Dict[str, Any] = {}
         clean_text = text
 
         if match:
-            # Extract content
-            raw_yaml = match.group(1)
-            
             # Sanitize Invisible Characters (Jira Artifacts)
-            clean_yaml = raw_yaml.replace(u'\xa0', ' ').strip()
-            
+            clean_yaml = match.group(1).replace(u'\xa0', ' ').strip()
+
             try:
-                parsed = yaml.safe_load(clean_yaml)
+                parsed = yaml.load(clean_yaml, Loader=_YAML_LOADER)
                 if isinstance(parsed, dict):
                     config = parsed
                 else:
                     logger.warning("Parsed YAML is not a dictionary. Ignoring.")
             except yaml.YAMLError as e:
                 logger.warning(f"Failed to parse YAML block in description: {e}")
-            
+
             # Remove the configuration block from the raw text
             # We replace the *entire match* (delimiters + content) with empty string
             clean_text = text.replace(match.group(0), "").strip()
@@ -145,45 +183,24 @@ class JiraPayloadMapper:
         else:
             logger.debug("No configuration block found in description.")
 
-        return TaskDescription(
-            raw_content=clean_text,
-            config=config
-        )
-
+        return clean_text, cls._freeze(config)
 
     @classmethod
-    def _parse_description_config(cls, text: str) -> TaskDescription:
-        """
-        Extracts YAML config from text using robust Regex.
-        Separates the configuration block from the human-readable text.
-        """
-        match = cls.CODE_BLOCK_PATTERN.search(text)
-        config: Dict[str, Any] = {}
-        clean_text = text
+    def _freeze(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            return MappingProxyType({key: cls._freeze(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return tuple(cls._freeze(item) for item in value)
+        if isinstance(value, set):
+            return frozenset(value)
+        return value
 
-        if match:
-            # Extract content
-            raw_yaml = match.group(1)
-            
-            # Sanitize Invisible Characters (Jira Artifacts)
-            clean_yaml = raw_yaml.replace(u'\xa0', ' ').strip()
-            
-            try:
-                parsed = yaml.safe_load(clean_yaml)
-                if isinstance(parsed, dict):
-                    config = parsed
-                else:
-                    logger.warning("Parsed YAML is not a dictionary. Ignoring.")
-            except yaml.YAMLError as e:
-                logger.warning(f"Failed to parse YAML block in description: {e}")
-            
-            # Remove the configuration block from the raw text
-            # We replace the *entire match* (delimiters + content) with empty string
-            clean_text = text.replace(match.group(0), "").strip()
-        else:
-            logger.debug("No configuration block found in description.")
-
-        return TaskDescription(
-            raw_content=clean_text,
-            config=config
-        )
+    @classmethod
+    def _thaw(cls, value: Any) -> Any:
+        if isinstance(value, MappingProxyType):
+            return {key: cls._thaw(item) for key, item in value.items()}
+        if isinstance(value, tuple):
+            return [cls._thaw(item) for item in value]
+        if isinstance(value, frozenset):
+            return set(value)
+        return value
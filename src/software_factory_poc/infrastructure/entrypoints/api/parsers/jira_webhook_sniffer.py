@@ -0,0 +1,79 @@
+import hashlib
+import json
+import re
+from typing import Any, Optional
+
+from software_factory_poc.infrastructure.entrypoints.api.mappers.jira_payload_mapper import (
+    JiraPayloadMapper,
+)
+from software_factory_poc.infrastructure.jobs.webhook_trigger import WebhookTrigger
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_text_walker import (
+    CONFIG_LANGUAGES,
+    JiraAdfTextWalker,
+)
+
+# Issue keys carry a number suffix; project keys do not
+_ISSUE_KEY_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_-]*-\d+")
+
+
+class JiraWebhookSniffer:
+    """
+    Reads the few fields the ingestion endpoints need from the raw webhook body:
+    `issue.key`, the project key, the event and a hash of the description's config block.
+    They deduplicate and fairly schedule the job; the YAML is parsed and the full payload
+    validated later by the worker.
+    """
+
+    @staticmethod
+    def sniff(body: bytes) -> Optional[WebhookTrigger]:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return None
+        issue = JiraWebhookSniffer._mapping(payload, "issue")
+        key = issue.get("key")
+        if not isinstance(key, str) or not _ISSUE_KEY_PATTERN.fullmatch(key):
+            return None
+
+        fields = JiraWebhookSniffer._mapping(issue, "fields")
+        project = JiraWebhookSniffer._mapping(fields, "project") or JiraWebhookSniffer._mapping(issue, "project")
+        project_key = project.get("key")
+        event_type = payload.get("webhookEvent")
+        return WebhookTrigger(
+            issue_key=key,
+            project_key=project_key if isinstance(project_key, str) and project_key else None,
+            event_type=event_type if isinstance(event_type, str) and event_type else "unknown",
+            config_hash=JiraWebhookSniffer.config_block_hash(fields.get("description")),
+        )
+
+    @staticmethod
+    def config_block_hash(description: Any) -> str:
+        """
+        Hash of the description's config block text; empty when there is no block.
+        Accepts both plain-text descriptions and ADF documents (Jira Cloud).
+        """
+        raw_block = JiraWebhookSniffer._config_block(description)
+        if raw_block is None:
+            return ""
+        block = "\n".join(line.rstrip() for line in raw_block.strip().splitlines())
+        return hashlib.sha256(block.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _config_block(description: Any) -> Optional[str]:
+        if isinstance(description, dict):
+            # Same rule as JiraDescriptionMapper: a YAML codeBlock first, else a fence pasted as text
+            texts = []
+            for block in JiraAdfTextWalker.iter_blocks(description):
+                if JiraAdfTextWalker.language(block) in CONFIG_LANGUAGES:
+                    return JiraAdfTextWalker.block_text(block)
+                texts.append(JiraAdfTextWalker.block_text(block))
+            description = "\n\n".join(texts)
+        if not isinstance(description, str):
+            return None
+        match = JiraPayloadMapper.CODE_BLOCK_PATTERN.search(description)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _mapping(container: Any, name: str) -> dict:
+        value = container.get(name) if isinstance(container, dict) else None
+        return value if isinstance(value, dict) else {}
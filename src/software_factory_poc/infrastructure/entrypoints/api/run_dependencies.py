@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+
+
+def get_run_registry(request: Request) -> RunRegistry:
+    """Returns the run registry held by the application container."""
+    return request.app.state.container.run_registry
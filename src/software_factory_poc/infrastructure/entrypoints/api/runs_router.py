@@ -0,0 +1,105 @@
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Any, AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
+from software_factory_poc.infrastructure.entrypoints.api.run_dependencies import get_run_registry
+from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.jobs.job_record import JobRecord
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.run_event_type import RunEventType
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+
+router = APIRouter()
+
+SSE_POLL_INTERVAL_SECONDS = 0.5
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+@router.get("/runs/{run_id}", dependencies=[Depends(validate_api_key)])
+def get_run(
+    run_id: str,
+    job_pool: JobWorkerPool = Depends(get_job_pool),
+    registry: RunRegistry = Depends(get_run_registry)
+):
+    # The outcome comes from the shared queue, whichever process ran the job;
+    # phase timings are only known by the process that ran it
+    job = _get_job_or_404(job_pool, run_id)
+    snapshot = registry.get(run_id)
+    return {
+        "run_id": run_id,
+        "kind": job.kind.value,
+        "issue_key": job.issue_key,
+        "status": job.status.value,
+        "attempts": job.attempts,
+        "job_status": job.status.value,
+        "last_error": job.last_error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "elapsed_ms": job.elapsed_ms,
+        "phases": [asdict(phase) for phase in snapshot.phases] if snapshot else [],
+    }
+
+
+@router.get("/runs/{run_id}/events", dependencies=[Depends(validate_api_key)])
+async def stream_run_events(
+    run_id: str,
+    job_pool: JobWorkerPool = Depends(get_job_pool),
+    registry: RunRegistry = Depends(get_run_registry),
+    last_event_id: Optional[str] = Header(default=None)
+):
+    """Server-sent events with the phase transitions of a run; the stream closes when the run ends."""
+    _get_job_or_404(job_pool, run_id)
+    after = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+    return StreamingResponse(
+        _event_stream(run_id, after, job_pool, registry),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _event_stream(run_id: str, after: int, job_pool: JobWorkerPool, registry: RunRegistry) -> AsyncIterator[str]:
+    idle = 0.0
+    while True:
+        events = registry.events_after(run_id, after)
+        for event in events:
+            after = event.seq
+            yield f"id: {event.seq}\nevent: {event.type.value}\ndata: {json.dumps(event.to_dict())}\n\n"
+            if event.type != RunEventType.RUN_FINISHED or event.status is None:
+                continue
+            if JobStatus(event.status).is_terminal:
+                return
+
+        if not events:
+            job = job_pool.queue.get(run_id)
+            finished: Optional[dict[str, Any]] = None
+            if job is None:
+                finished = {"run_id": run_id, "status": "unknown"}
+            elif job.status.is_terminal:
+                # Ended without a local event (another process, restart, eviction): report the stored outcome
+                finished = {"run_id": run_id, "status": job.status.value}
+                if job.last_error:
+                    finished["error"] = job.last_error
+            if finished is not None:
+                yield f"event: {RunEventType.RUN_FINISHED.value}\ndata: {json.dumps(finished)}\n\n"
+                return
+            idle += SSE_POLL_INTERVAL_SECONDS
+            if idle >= SSE_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+        else:
+            idle = 0.0
+        await asyncio.sleep(SSE_POLL_INTERVAL_SECONDS)
+
+
+def _get_job_or_404(job_pool: JobWorkerPool, run_id: str) -> JobRecord:
+    job = job_pool.queue.get(run_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Run '{run_id}' not found")
+    return job
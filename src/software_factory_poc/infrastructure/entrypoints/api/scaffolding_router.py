@@ -1,81 +1,56 @@
-from functools import lru_cache
-from typing import Union
-
-from fastapi import APIRouter, BackgroundTasks, Depends, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import JSONResponse
 
-from software_factory_poc.application.core.domain.entities.task import Task
-from software_factory_poc.application.usecases.scaffolding.create_scaffolding_usecase import (
-    CreateScaffoldingUseCase,
+from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+from software_factory_poc.infrastructure.batch.batch_scaffolding_service import BatchScaffoldingService
+from software_factory_poc.infrastructure.entrypoints.api.batch_dependencies import get_batch_service
+from software_factory_poc.infrastructure.entrypoints.api.dtos.batch_scaffolding_request_dto import (
+    BatchScaffoldingRequestDTO,
 )
-from software_factory_poc.infrastructure.configuration.app_config import AppConfig
-from software_factory_poc.infrastructure.configuration.main_settings import Settings
-from software_factory_poc.infrastructure.entrypoints.api.dtos.jira_webhook_dto import JiraWebhookDTO
-from software_factory_poc.infrastructure.entrypoints.api.mappers.jira_payload_mapper import JiraPayloadMapper
+from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
 from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.entrypoints.api.webhook_ingestion import admission_rejection, enqueue_webhook
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
 from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
-from software_factory_poc.infrastructure.resolution.provider_resolver import ProviderResolver
 
 logger = LoggerFactoryService.build_logger(__name__)
 router = APIRouter()
 
-@lru_cache
-def get_settings() -> Settings:
-    return Settings()
-
-def get_usecase(settings: Settings = Depends(get_settings)) -> CreateScaffoldingUseCase:
-    from software_factory_poc.infrastructure.configuration.scaffolding_config_loader import ScaffoldingConfigLoader
-    scaffolding_config = ScaffoldingConfigLoader.load_config()
-    
-    app_config = AppConfig()
-    resolver = ProviderResolver(scaffolding_config, app_config=app_config)
-    
-    return CreateScaffoldingUseCase(
-        config=scaffolding_config,
-        resolver=resolver
-    )
-
 @router.post("/webhooks/jira/scaffolding-trigger", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(validate_api_key)])
 async def trigger_scaffold(
     request: Request,
-    background_tasks: BackgroundTasks,
-    usecase: CreateScaffoldingUseCase = Depends(get_usecase)
+    job_pool: JobWorkerPool = Depends(get_job_pool)
 ):
     try:
-        task_entity = await _process_incoming_webhook(request)
-        
-        if isinstance(task_entity, JSONResponse):
-            return task_entity
-            
-        # Fire and Forget
-        background_tasks.add_task(usecase.execute, task_entity)
-        
-        return {
-            "status": "accepted",
-            "message": "Scaffolding request queued.",
-            "issue_key": task_entity.key
-        }
+        # Durable, idempotent enqueue of the raw body; the worker parses and maps it
+        return await enqueue_webhook(request, job_pool, JobKind.SCAFFOLDING, "Scaffolding request queued.")
     except Exception as e:
-         # Generic catch-all to prevent 500s from leaking if _process fails unexpectedly
+         # Generic catch-all to prevent 500s from leaking if the enqueue fails unexpectedly
          logger.error(f"Router Error: {e}")
          return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"status": "error", "message": "Internal processing error."})
 
-async def _process_incoming_webhook(request: Request) -> Union[Task, JSONResponse]:
-    """Helper to parse, validate and map webhook."""
-    body_bytes = await request.body()
+
+@router.post("/scaffolding/batch", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(validate_api_key)])
+def scaffold_batch(
+    body: BatchScaffoldingRequestDTO,
+    job_pool: JobWorkerPool = Depends(get_job_pool),
+    batch_service: BatchScaffoldingService = Depends(get_batch_service)
+):
+    """Queues one scaffolding run per issue (explicit keys or JQL); poll GET /scaffolding/batch/{id} for the report."""
+    decision = job_pool.admit()
+    if not decision.admitted:
+        return admission_rejection(decision)
     try:
-        logger.info(f"Incoming Jira Payload (Raw): {body_bytes.decode('utf-8')}")
-        payload = JiraWebhookDTO.model_validate_json(body_bytes)
-        
-        issue_key = payload.issue.key
-        logger.info(f"Processing webhook for {issue_key}")
-        
-        return JiraPayloadMapper.to_domain(payload)
-        
-    except ValueError as e:
-        logger.warning(f"Skipping webhook: {e}")
-        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "ignored", "message": str(e)})
-    except Exception as e:
-        logger.error(f"Error processing webhook: {e}")
-        # If parsing fails entirely (malformed JSON), return 200 to satisfy Jira
-        return JSONResponse(status_code=status.HTTP_200_OK, content={"status": "error", "message": str(e)})
+        return batch_service.submit(issue_keys=body.issue_keys, jql=body.jql).to_dict()
+    except ProviderError as e:
+        logger.error(f"Batch scaffolding failed to load the issues: {e}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"Issue tracker error: {e}") from e
+
+
+@router.get("/scaffolding/batch/{batch_id}", dependencies=[Depends(validate_api_key)])
+def get_batch_report(batch_id: str, batch_service: BatchScaffoldingService = Depends(get_batch_service)):
+    report = batch_service.report(batch_id)
+    if report is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Batch not found")
+    return report.to_dict()
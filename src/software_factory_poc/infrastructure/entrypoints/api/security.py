@@ -1,17 +1,30 @@
-from fastapi import Security, HTTPException, status
+from functools import lru_cache
+
+from fastapi import Request, Security, HTTPException, status
 from fastapi.security import APIKeyHeader
 
 from software_factory_poc.infrastructure.configuration.main_settings import Settings
+from software_factory_poc.infrastructure.entrypoints.api.webhook_authenticator import WebhookAuthenticator
 
 api_key_header = APIKeyHeader(name="X-API-KEY", auto_error=False)
 
-async def validate_api_key(api_key_header: str = Security(api_key_header)):
-    settings = Settings()
-    if not api_key_header:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail="Could not validate credentials"
-        )
-    if api_key_header != settings.jira_webhook_secret.get_secret_value():
+
+@lru_cache
+def _fallback_authenticator() -> WebhookAuthenticator:
+    return WebhookAuthenticator.from_settings(Settings())
+
+
+def _resolve_authenticator(request: Request) -> WebhookAuthenticator:
+    # Resolved once by create_app; apps built without it fall back to a cached copy
+    authenticator = getattr(request.app.state, "webhook_authenticator", None)
+    return authenticator if authenticator is not None else _fallback_authenticator()
+
+
+async def validate_api_key(request: Request, api_key_header: str = Security(api_key_header)):
+    authenticator = _resolve_authenticator(request)
+    signature = request.headers.get(authenticator.signature_header)
+    body = await request.body() if signature else b""
+    if not authenticator.authorize(api_key_header, body, signature):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Could not validate credentials"
         )
@@ -0,0 +1,62 @@
+import hashlib
+import hmac
+from typing import Any, Optional, Sequence
+
+from pydantic import SecretStr
+
+# Header Jira sends when the webhook is registered with a secret: "sha256=<hex HMAC of the body>"
+SIGNATURE_HEADER = "X-Hub-Signature"
+
+
+class WebhookAuthenticator:
+    """
+    Authenticates webhook and API calls against the configured secrets, resolved once at
+    startup. A request is accepted with a valid HMAC-SHA256 signature of its body or, unless
+    signatures are required, with a secret in the API key header. Several secrets can be
+    active at once so they can be rotated without downtime. Every comparison is constant-time.
+    """
+
+    def __init__(self, secrets: Sequence[str], require_signature: bool = False):
+        self._secrets = tuple(secret.encode("utf-8") for secret in secrets if secret)
+        self.require_signature = require_signature
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "WebhookAuthenticator":
+        secrets = [settings.jira_webhook_secret.get_secret_value()]
+        previous = getattr(settings, "jira_webhook_previous_secrets", None)
+        if isinstance(previous, SecretStr):
+            secrets.extend(secret.strip() for secret in previous.get_secret_value().split(","))
+        require_signature = getattr(settings, "jira_webhook_require_signature", False)
+        return cls(secrets, require_signature=require_signature is True)
+
+    @property
+    def signature_header(self) -> str:
+        return SIGNATURE_HEADER
+
+    def authorize(self, api_key: Optional[str], body: bytes = b"", signature: Optional[str] = None) -> bool:
+        if signature and self.verify_signature(body, signature):
+            return True
+        return not self.require_signature and self.verify_api_key(api_key)
+
+    def verify_api_key(self, api_key: Optional[str]) -> bool:
+        if not api_key:
+            return False
+        candidate = api_key.encode("utf-8")
+        # Every secret is compared, so the timing does not reveal which one matched
+        matched = False
+        for secret in self._secrets:
+            matched |= hmac.compare_digest(candidate, secret)
+        return matched
+
+    def verify_signature(self, body: bytes, signature: str) -> bool:
+        algorithm, _, digest = signature.partition("=")
+        if not digest:
+            algorithm, digest = "sha256", algorithm
+        if algorithm.strip().lower() != "sha256":
+            return False
+        candidate = digest.strip().lower().encode("ascii", "ignore")
+        matched = False
+        for secret in self._secrets:
+            expected = hmac.new(secret, body, hashlib.sha256).hexdigest().encode("ascii")
+            matched |= hmac.compare_digest(candidate, expected)
+        return matched
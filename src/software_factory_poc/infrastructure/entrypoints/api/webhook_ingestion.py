@@ -0,0 +1,58 @@
+from typing import Union
+
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from software_factory_poc.infrastructure.entrypoints.api.parsers.jira_webhook_sniffer import JiraWebhookSniffer
+from software_factory_poc.infrastructure.jobs.admission_decision import AdmissionDecision
+from software_factory_poc.infrastructure.jobs.admission_outcome import AdmissionOutcome
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+
+async def enqueue_webhook(
+    request: Request, job_pool: JobWorkerPool, kind: JobKind, queued_message: str
+) -> Union[dict, JSONResponse]:
+    """
+    Fast ingestion path: admission check, raw body persisted to the job queue, 202.
+    Validation, YAML parsing and mapping run later on the worker, so Jira never waits on them.
+    """
+    decision = job_pool.admit()
+    if not decision.admitted:
+        return admission_rejection(decision)
+
+    body = await request.body()
+    trigger = JiraWebhookSniffer.sniff(body)
+    if trigger is None:
+        logger.warning(f"Skipping {kind.value} webhook: payload does not reference a Jira issue")
+        # Return 200 to Jira to avoid retries on bad data
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"status": "ignored", "message": "Payload does not reference a Jira issue."}
+        )
+
+    submission = job_pool.submit_webhook(kind, trigger, body)
+    return {
+        "status": "accepted",
+        "message": queued_message if submission.created else "Duplicate trigger; existing run reused.",
+        "issue_key": trigger.issue_key,
+        "job_id": submission.job.id,
+        "deduplicated": not submission.created
+    }
+
+
+def admission_rejection(decision: AdmissionDecision) -> JSONResponse:
+    """429 (queue full) or 503 (draining) response, with Retry-After, for a refused trigger."""
+    if decision.outcome == AdmissionOutcome.SATURATED:
+        logger.warning(f"Trigger refused: {decision.queued} jobs queued")
+        status_code, message = status.HTTP_429_TOO_MANY_REQUESTS, "Job queue is full; retry later."
+    else:
+        status_code, message = status.HTTP_503_SERVICE_UNAVAILABLE, "Service is shutting down; retry later."
+    return JSONResponse(
+        status_code=status_code,
+        content={"status": "rejected", "message": message},
+        headers={"Retry-After": str(decision.retry_after_seconds)}
+    )
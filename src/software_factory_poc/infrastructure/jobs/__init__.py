@@ -0,0 +1,39 @@
+from software_factory_poc.infrastructure.jobs.admission_decision import AdmissionDecision
+from software_factory_poc.infrastructure.jobs.admission_outcome import AdmissionOutcome
+from software_factory_poc.infrastructure.jobs.fair_job_scheduler import FairJobScheduler
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_record import JobRecord
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_submission import JobSubmission
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.phase_timing import PhaseTiming
+from software_factory_poc.infrastructure.jobs.queue_depth import QueueDepth
+from software_factory_poc.infrastructure.jobs.registry_run_phase_tracker import RegistryRunPhaseTracker
+from software_factory_poc.infrastructure.jobs.run_event import RunEvent
+from software_factory_poc.infrastructure.jobs.run_event_type import RunEventType
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+from software_factory_poc.infrastructure.jobs.run_snapshot import RunSnapshot
+from software_factory_poc.infrastructure.jobs.scheduler_metrics import SchedulerMetrics
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+from software_factory_poc.infrastructure.jobs.task_fingerprint import TaskFingerprint
+
+__all__ = [
+    "AdmissionDecision",
+    "AdmissionOutcome",
+    "FairJobScheduler",
+    "JobKind",
+    "JobRecord",
+    "JobStatus",
+    "JobSubmission",
+    "JobWorkerPool",
+    "PhaseTiming",
+    "QueueDepth",
+    "RegistryRunPhaseTracker",
+    "RunEvent",
+    "RunEventType",
+    "RunRegistry",
+    "RunSnapshot",
+    "SchedulerMetrics",
+    "SqliteJobQueue",
+    "TaskFingerprint",
+]
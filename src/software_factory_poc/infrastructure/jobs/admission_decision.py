@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from software_factory_poc.infrastructure.jobs.admission_outcome import AdmissionOutcome
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    """
+    Whether the queue accepts a new trigger. Rejections carry the delay the caller
+    should wait before retrying (sent back to Jira as `Retry-After`).
+    """
+    outcome: AdmissionOutcome
+    queued: int = 0
+    retry_after_seconds: int = 0
+
+    @property
+    def admitted(self) -> bool:
+        return self.outcome == AdmissionOutcome.ADMITTED
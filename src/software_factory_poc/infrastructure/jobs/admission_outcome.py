@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class AdmissionOutcome(StrEnum):
+    ADMITTED = "admitted"
+    SATURATED = "saturated"
+    UNAVAILABLE = "unavailable"
@@ -0,0 +1,86 @@
+import threading
+from collections import Counter
+from typing import Optional
+
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_record import JobRecord
+from software_factory_poc.infrastructure.jobs.scheduler_metrics import SchedulerMetrics
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+
+class FairJobScheduler:
+    """
+    Decides which queued job a free worker runs next:
+    1. tenants (Jira project keys) already at their concurrency cap are skipped;
+    2. the highest-priority lane with eligible work wins (e.g. code review before scaffolding);
+    3. inside that lane, tenants are served by weighted fair queuing (virtual time),
+       so a project with 50 tickets cannot starve the others.
+    """
+
+    def __init__(self, queue: SqliteJobQueue, settings: JobQueueSettings):
+        self.queue = queue
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._virtual_time = 0.0
+        self._finish_tags: dict[str, float] = {}
+        self._dispatched: Counter = Counter()
+
+    def next_job(self) -> Optional[JobRecord]:
+        with self._lock:
+            running = self.queue.running_by_tenant()
+            eligible = [
+                depth for depth in self.queue.queue_depths(due_only=True)
+                if running.get(depth.tenant or "", 0) < self._tenant_cap(depth.tenant)
+            ]
+            if not eligible:
+                return None
+
+            lane = min(self._lane(depth.kind) for depth in eligible)
+            in_lane = [depth for depth in eligible if self._lane(depth.kind) == lane]
+            tenant = min({depth.tenant for depth in in_lane}, key=lambda t: (self._start_tag(t), t or ""))
+            kinds = [depth.kind for depth in in_lane if depth.tenant == tenant]
+
+            # The cap is re-checked by the claim itself: other processes may have claimed meanwhile
+            job = self.queue.claim(tenant=tenant, kinds=kinds, max_running=self._tenant_cap(tenant))
+            if job is not None:
+                self._charge(tenant)
+            return job
+
+    def metrics(self) -> SchedulerMetrics:
+        depths = self.queue.queue_depths()
+        queued_by_tenant: Counter = Counter()
+        queued_by_lane: Counter = Counter()
+        for depth in depths:
+            queued_by_tenant[depth.tenant or ""] += depth.queued
+            queued_by_lane[depth.kind.value] += depth.queued
+        with self._lock:
+            dispatched = {tenant or "": count for tenant, count in self._dispatched.items()}
+        return SchedulerMetrics(
+            queued_by_tenant=dict(queued_by_tenant),
+            queued_by_lane=dict(queued_by_lane),
+            running_by_tenant={tenant or "": count for tenant, count in self.queue.running_by_tenant().items()},
+            dispatched_by_tenant=dispatched,
+        )
+
+    def _tenant_cap(self, tenant: Optional[str]) -> int:
+        return self.settings.tenant_concurrency_overrides.get(tenant or "", self.settings.tenant_max_concurrency)
+
+    def _lane(self, kind: JobKind) -> int:
+        return self.settings.lane_priorities.get(kind.value, len(self.settings.lane_priorities))
+
+    def _weight(self, tenant: Optional[str]) -> float:
+        return max(self.settings.tenant_weights.get(tenant or "", 1.0), 0.001)
+
+    def _start_tag(self, tenant: Optional[str]) -> float:
+        # An idle tenant re-enters at the current virtual time: no credit is banked while idle
+        return max(self._finish_tags.get(tenant or "", 0.0), self._virtual_time)
+
+    def _charge(self, tenant: Optional[str]) -> None:
+        start = self._start_tag(tenant)
+        self._virtual_time = start
+        self._finish_tags[tenant or ""] = start + 1.0 / self._weight(tenant)
+        self._dispatched[tenant or ""] += 1
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class JobKind(StrEnum):
+    SCAFFOLDING = "scaffolding"
+    CODE_REVIEW = "code_review"
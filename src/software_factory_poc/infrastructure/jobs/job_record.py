@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+
+
+@dataclass
+class JobRecord:
+    """
+    Snapshot of a queued agent run as stored in the job queue: the outcome of a run is
+    read from here, whichever worker process executed it.
+    Timestamps are epoch seconds; `started_at`/`finished_at` belong to the latest attempt.
+    """
+    id: str
+    kind: JobKind
+    issue_key: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    available_at: float
+    created_at: float
+    updated_at: float
+    payload: dict[str, Any] = field(default_factory=dict)
+    last_error: Optional[str] = None
+    dedup_key: Optional[str] = None
+    tenant: Optional[str] = None
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at) * 1000
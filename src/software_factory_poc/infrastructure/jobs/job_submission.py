@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from software_factory_poc.infrastructure.jobs.job_record import JobRecord
+
+
+@dataclass(frozen=True)
+class JobSubmission:
+    """
+    Result of submitting a job. `created` is False when the trigger was a duplicate
+    (or was coalesced into a pending run) and `job` is the existing run.
+    """
+    job: JobRecord
+    created: bool
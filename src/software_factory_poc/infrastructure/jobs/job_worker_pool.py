@@ -0,0 +1,252 @@
+import threading
+import time
+from contextlib import AbstractContextManager, ExitStack
+from typing import Any, Callable, Optional, Sequence
+
+from software_factory_poc.application.core.domain.entities.task import Task
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.admission_decision import AdmissionDecision
+from software_factory_poc.infrastructure.jobs.admission_outcome import AdmissionOutcome
+from software_factory_poc.infrastructure.jobs.fair_job_scheduler import FairJobScheduler
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_record import JobRecord
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_submission import JobSubmission
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+from software_factory_poc.infrastructure.jobs.task_fingerprint import TaskFingerprint
+from software_factory_poc.infrastructure.jobs.task_job_codec import TaskJobCodec
+from software_factory_poc.infrastructure.jobs.webhook_trigger import WebhookTrigger
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+JobHandler = Callable[[Task], None]
+WebhookDecoder = Callable[[str], Task]
+RunScope = Callable[[], AbstractContextManager[Any]]
+
+
+class JobWorkerPool:
+    """
+    Fixed pool of worker threads pulling agent runs from the durable queue.
+    A handler reports a failed run by raising: the job is retried with exponential backoff,
+    unless the error is marked not `retryable` (FlowFailedError, ProviderError), then it fails.
+    `drain` stops claiming new work and waits for the running jobs, leaving the rest queued
+    for the next start.
+    Webhook jobs carry the raw request body; `webhook_decoder` maps it to a Task on the worker.
+    With a `run_registry`, each attempt is recorded there and bound to the worker thread.
+    Each `run_scopes` context manager is entered around every attempt (e.g. per-run caches).
+    While started, a heartbeat thread keeps this process registered as the owner of its
+    running jobs and re-queues those of processes that stopped heartbeating.
+    """
+
+    def __init__(
+        self,
+        queue: SqliteJobQueue,
+        handlers: dict[JobKind, JobHandler],
+        settings: JobQueueSettings,
+        scheduler: Optional[FairJobScheduler] = None,
+        webhook_decoder: Optional[WebhookDecoder] = None,
+        run_registry: Optional[RunRegistry] = None,
+        run_scopes: Sequence[RunScope] = (),
+    ):
+        self.queue = queue
+        self.handlers = handlers
+        self.settings = settings
+        self.scheduler = scheduler or FairJobScheduler(queue, settings)
+        self.webhook_decoder = webhook_decoder
+        self.run_registry = run_registry
+        self.run_scopes = tuple(run_scopes)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._heartbeat_thread: Optional[threading.Thread] = None
+
+    def submit(self, kind: JobKind, task: Task) -> JobSubmission:
+        """Queues a run for the task, reusing the pending/recent run when the trigger is a duplicate."""
+        submission = self.queue.enqueue_unique(
+            kind,
+            task.key,
+            TaskJobCodec.to_payload(task),
+            dedup_key=TaskFingerprint.dedup_key(kind, task),
+            window_seconds=self.settings.dedup_window_seconds,
+            max_attempts=self.settings.max_attempts,
+            tenant=task.project_key or None,
+        )
+        if submission.created:
+            self._wake.set()
+        return submission
+
+    def submit_webhook(self, kind: JobKind, trigger: WebhookTrigger, body: bytes) -> JobSubmission:
+        """
+        Queues the raw webhook body as is; parsing and mapping happen on the worker that runs it.
+        The sniffed `trigger` fields give the dedup key and the tenant.
+        """
+        submission = self.queue.enqueue_unique(
+            kind,
+            trigger.issue_key,
+            TaskJobCodec.to_webhook_payload(body),
+            dedup_key=TaskFingerprint.webhook_dedup_key(kind, trigger),
+            window_seconds=self.settings.dedup_window_seconds,
+            max_attempts=self.settings.max_attempts,
+            tenant=trigger.project_key,
+        )
+        if submission.created:
+            self._wake.set()
+        return submission
+
+    def admit(self) -> AdmissionDecision:
+        """Admission control for new triggers: refuse while draining or once the backlog reaches its limit."""
+        retry_after = self.settings.admission_retry_after_seconds
+        if self._stopping.is_set():
+            return AdmissionDecision(AdmissionOutcome.UNAVAILABLE, retry_after_seconds=retry_after)
+        if self.settings.max_queued_jobs <= 0:
+            return AdmissionDecision(AdmissionOutcome.ADMITTED)
+        queued = self.queue.queued_count()
+        if queued >= self.settings.max_queued_jobs:
+            return AdmissionDecision(AdmissionOutcome.SATURATED, queued=queued, retry_after_seconds=retry_after)
+        return AdmissionDecision(AdmissionOutcome.ADMITTED, queued=queued)
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopping.clear()
+        self.queue.heartbeat()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+        for index in range(max(1, self.settings.workers)):
+            thread = threading.Thread(target=self._worker_loop, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Job worker pool started with {len(self._threads)} worker(s).")
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Stops the workers after their current job. Returns False if some are still busy at the deadline."""
+        self._stopping.set()
+        self._wake.set()
+        deadline = time.monotonic() + (timeout if timeout is not None else self.settings.drain_timeout_seconds)
+        for thread in self._threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        busy = [t.name for t in self._threads if t.is_alive()]
+        self._threads = []
+        self._stop_heartbeat(retire=not busy)
+        if busy:
+            logger.warning(f"Job worker pool drain timed out; still running: {busy}")
+            return False
+        logger.info("Job worker pool drained.")
+        return True
+
+    def backoff_seconds(self, attempts: int) -> float:
+        delay = self.settings.backoff_base_seconds * (2 ** max(0, attempts - 1))
+        return min(delay, self.settings.backoff_max_seconds)
+
+    def run_pending(self) -> int:
+        """Executes the jobs the scheduler hands out on the calling thread, until none is eligible."""
+        executed = 0
+        while not self._stopping.is_set():
+            job = self.scheduler.next_job()
+            if job is None:
+                return executed
+            self._execute(job)
+            executed += 1
+        return executed
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopping.wait(self.settings.heartbeat_interval_seconds):
+            try:
+                self.queue.heartbeat()
+                if self.queue.requeue_interrupted():
+                    self._wake.set()
+            except Exception as e:
+                logger.error(f"Job queue heartbeat error: {e}", exc_info=True)
+
+    def _stop_heartbeat(self, retire: bool) -> None:
+        if self._heartbeat_thread is None:
+            return
+        self._heartbeat_thread.join(timeout=1.0)
+        self._heartbeat_thread = None
+        # Jobs still running at the deadline keep their owner: peers take them over once it goes stale
+        if retire:
+            try:
+                self.queue.retire()
+            except Exception as e:
+                logger.warning(f"Job queue owner not retired: {e}")
+
+    def _worker_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                if self.run_pending() == 0:
+                    self._wake.wait(self.settings.poll_interval_seconds)
+                    self._wake.clear()
+            except Exception as e:
+                logger.error(f"Job worker loop error: {e}", exc_info=True)
+                self._stopping.wait(self.settings.poll_interval_seconds)
+
+    def _execute(self, job: JobRecord) -> None:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            self.queue.fail(job.id, f"No handler registered for job kind '{job.kind.value}'")
+            return
+
+        try:
+            task = self._decode(job)
+        except Exception as e:
+            # A payload that cannot be mapped will not improve on retry
+            logger.warning(f"Job {job.id} ignored: {type(e).__name__}: {e}")
+            self.queue.fail(job.id, f"Ignored webhook: {e}")
+            return
+
+        logger.info(f"Job {job.id} started ({job.kind.value} for {job.issue_key}, attempt {job.attempts}/{job.max_attempts})")
+        try:
+            swallowed_error = self._run_handler(job, handler, task)
+        except Exception as e:
+            self._record_failure(job, f"{type(e).__name__}: {e}", retryable=getattr(e, "retryable", True))
+            return
+        if swallowed_error is not None:
+            self._record_failure(job, swallowed_error, retryable=True)
+            return
+
+        self.queue.complete(job.id)
+        self._finish_run(job, JobStatus.SUCCEEDED)
+        logger.info(f"Job {job.id} succeeded.")
+        # A finished job frees a tenant slot; let idle workers re-check the backlog
+        self._wake.set()
+
+    def _run_handler(self, job: JobRecord, handler: JobHandler, task: Task) -> Optional[str]:
+        """Runs the handler; returns the error of a phase that failed without the handler raising."""
+        with ExitStack() as scopes:
+            for scope in self.run_scopes:
+                scopes.enter_context(scope())
+            if self.run_registry is None:
+                handler(task)
+                return None
+            self.run_registry.start(job.id, job.kind.value, job.issue_key, job.attempts)
+            with self.run_registry.bind(job.id):
+                handler(task)
+            failed_phase = self.run_registry.failed_phase(job.id)
+            return f"{failed_phase.phase}: {failed_phase.error}" if failed_phase else None
+
+    def _record_failure(self, job: JobRecord, error: str, retryable: bool) -> None:
+        """Stores the failed attempt in the queue (retry or FAILED), where every process reads the outcome."""
+        if retryable and job.attempts < job.max_attempts:
+            delay = self.backoff_seconds(job.attempts)
+            logger.warning(f"Job {job.id} failed ({error}); retrying in {delay:.0f}s.")
+            self.queue.retry_later(job.id, error, delay)
+            self._finish_run(job, JobStatus.QUEUED, error)
+        else:
+            logger.error(f"Job {job.id} failed permanently after {job.attempts} attempt(s): {error}")
+            self.queue.fail(job.id, error)
+            self._finish_run(job, JobStatus.FAILED, error)
+
+    def _finish_run(self, job: JobRecord, status: JobStatus, error: Optional[str] = None) -> None:
+        if self.run_registry is not None:
+            self.run_registry.finish(job.id, status, error)
+
+    def _decode(self, job: JobRecord) -> Task:
+        body = TaskJobCodec.webhook_body(job.payload)
+        if body is None:
+            return TaskJobCodec.from_payload(job.payload)
+        if self.webhook_decoder is None:
+            raise ValueError("No webhook decoder configured")
+        logger.debug(f"Job {job.id} webhook payload: {body}")
+        return self.webhook_decoder(body)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """Duration of one phase of the latest attempt of a run."""
+    phase: str
+    started_at: float
+    finished_at: Optional[float] = None
+    elapsed_ms: Optional[float] = None
+    error: Optional[str] = None
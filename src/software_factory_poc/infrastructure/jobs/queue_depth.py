@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+
+
+@dataclass(frozen=True)
+class QueueDepth:
+    """Number of queued jobs of one kind for one tenant (Jira project key)."""
+    tenant: Optional[str]
+    kind: JobKind
+    queued: int
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.agents.common.ports.run_phase_tracker import RunPhaseTracker
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+
+
+class RegistryRunPhaseTracker(RunPhaseTracker):
+    """
+    Publishes phases to the RunRegistry entry of the run bound to the current worker thread.
+    Outside of a worker (no bound run) phases are not recorded.
+    """
+
+    def __init__(self, registry: RunRegistry):
+        self.registry = registry
+
+    @contextmanager
+    def phase(self, phase: RunPhase) -> Iterator[None]:
+        run_id = self.registry.current_run_id()
+        if run_id is None:
+            yield
+            return
+        self.registry.phase_started(run_id, phase.value)
+        try:
+            yield
+        except BaseException as e:
+            self.registry.phase_finished(run_id, phase.value, error=f"{type(e).__name__}: {e}")
+            raise
+        self.registry.phase_finished(run_id, phase.value)
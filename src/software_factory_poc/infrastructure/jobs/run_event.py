@@ -0,0 +1,20 @@
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from software_factory_poc.infrastructure.jobs.run_event_type import RunEventType
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    """One progress event of a run; `seq` increases per run and is used as the SSE event id."""
+    seq: int
+    run_id: str
+    type: RunEventType
+    at: float
+    phase: Optional[str] = None
+    elapsed_ms: Optional[float] = None
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
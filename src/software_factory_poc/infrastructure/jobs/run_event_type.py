@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class RunEventType(StrEnum):
+    RUN_STARTED = "run_started"
+    PHASE_STARTED = "phase_started"
+    PHASE_FINISHED = "phase_finished"
+    PHASE_FAILED = "phase_failed"
+    RUN_FINISHED = "run_finished"
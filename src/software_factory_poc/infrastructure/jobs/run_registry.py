@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.phase_timing import PhaseTiming
+from software_factory_poc.infrastructure.jobs.run_event import RunEvent
+from software_factory_poc.infrastructure.jobs.run_event_type import RunEventType
+from software_factory_poc.infrastructure.jobs.run_snapshot import RunSnapshot
+
+_CURRENT_RUN: ContextVar[Optional[str]] = ContextVar("_CURRENT_RUN", default=None)
+
+
+@dataclass
+class _RunState:
+    kind: str
+    issue_key: str
+    attempt: int
+    started_at: float
+    status: JobStatus = JobStatus.RUNNING
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+    phase_clocks: dict[str, float] = field(default_factory=dict)
+    events: list[RunEvent] = field(default_factory=list)
+    seq: int = 0
+
+
+class RunRegistry:
+    """
+    In-memory record of the recent agent runs (keyed by job id) and their phase timings.
+    Workers bind the run they execute to the current thread, so orchestrator agents can
+    report phases without knowing the job id. The oldest runs are evicted past `max_runs`.
+    """
+
+    def __init__(self, max_runs: int = 500, max_events_per_run: int = 200, clock: Callable[[], float] = time.time):
+        self.max_runs = max_runs
+        self.max_events_per_run = max_events_per_run
+        self._clock = clock
+        self._runs: "OrderedDict[str, _RunState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # --- Run lifecycle (called by the worker pool) ---
+
+    def start(self, run_id: str, kind: str, issue_key: str, attempt: int = 1) -> None:
+        """Opens an attempt; a retry keeps the event history but resets the phase timings."""
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None:
+                state = _RunState(kind=kind, issue_key=issue_key, attempt=attempt, started_at=self._clock())
+                self._runs[run_id] = state
+                while len(self._runs) > self.max_runs:
+                    self._runs.popitem(last=False)
+            else:
+                state.attempt, state.started_at = attempt, self._clock()
+                state.status, state.finished_at, state.error = JobStatus.RUNNING, None, None
+                state.phases.clear()
+                state.phase_clocks.clear()
+            self._emit(run_id, state, RunEventType.RUN_STARTED, status=state.status.value)
+
+    def finish(self, run_id: str, status: JobStatus, error: Optional[str] = None) -> None:
+        """
+        Closes the attempt. A run whose handler returned normally but had a failed phase
+        (a failure reported to Jira without raising) is recorded as FAILED.
+        """
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None:
+                return
+            failed_phase = self._failed_phase(state)
+            if status == JobStatus.SUCCEEDED and failed_phase is not None:
+                status, error = JobStatus.FAILED, f"{failed_phase.phase}: {failed_phase.error}"
+            state.status, state.error, state.finished_at = status, error, self._clock()
+            elapsed_ms = (state.finished_at - state.started_at) * 1000
+            self._emit(run_id, state, RunEventType.RUN_FINISHED, status=status.value, elapsed_ms=elapsed_ms, error=error)
+
+    def failed_phase(self, run_id: str) -> Optional[PhaseTiming]:
+        """The first phase of the current attempt that ended with an error, if any."""
+        with self._lock:
+            state = self._runs.get(run_id)
+            return self._failed_phase(state) if state else None
+
+    # --- Phases (called through the RunPhaseTracker port) ---
+
+    def phase_started(self, run_id: str, phase: str) -> None:
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None:
+                return
+            state.phase_clocks[phase] = time.perf_counter()
+            state.phases[phase] = PhaseTiming(phase=phase, started_at=self._clock())
+            self._emit(run_id, state, RunEventType.PHASE_STARTED, phase=phase)
+
+    def phase_finished(self, run_id: str, phase: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None or phase not in state.phases:
+                return
+            elapsed_ms = (time.perf_counter() - state.phase_clocks.pop(phase)) * 1000
+            started = state.phases[phase]
+            state.phases[phase] = PhaseTiming(
+                phase=phase, started_at=started.started_at, finished_at=self._clock(), elapsed_ms=elapsed_ms, error=error
+            )
+            event_type = RunEventType.PHASE_FAILED if error else RunEventType.PHASE_FINISHED
+            self._emit(run_id, state, event_type, phase=phase, elapsed_ms=elapsed_ms, error=error)
+
+    # --- Binding of the run executed by the current thread ---
+
+    @contextmanager
+    def bind(self, run_id: str) -> Iterator[None]:
+        token = _CURRENT_RUN.set(run_id)
+        try:
+            yield
+        finally:
+            _CURRENT_RUN.reset(token)
+
+    @staticmethod
+    def current_run_id() -> Optional[str]:
+        return _CURRENT_RUN.get()
+
+    # --- Queries ---
+
+    def get(self, run_id: str) -> Optional[RunSnapshot]:
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None:
+                return None
+            return RunSnapshot(
+                run_id=run_id,
+                kind=state.kind,
+                issue_key=state.issue_key,
+                status=state.status,
+                attempt=state.attempt,
+                started_at=state.started_at,
+                finished_at=state.finished_at,
+                error=state.error,
+                phases=list(state.phases.values()),
+                last_seq=state.seq,
+            )
+
+    def events_after(self, run_id: str, seq: int = 0) -> list[RunEvent]:
+        with self._lock:
+            state = self._runs.get(run_id)
+            if state is None:
+                return []
+            return [event for event in state.events if event.seq > seq]
+
+    @staticmethod
+    def _failed_phase(state: _RunState) -> Optional[PhaseTiming]:
+        return next((phase for phase in state.phases.values() if phase.error), None)
+
+    def _emit(self, run_id: str, state: _RunState, event_type: RunEventType, **fields) -> None:
+        state.seq += 1
+        state.events.append(RunEvent(seq=state.seq, run_id=run_id, type=event_type, at=self._clock(), **fields))
+        if len(state.events) > self.max_events_per_run:
+            del state.events[0]
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.phase_timing import PhaseTiming
+
+
+@dataclass(frozen=True)
+class RunSnapshot:
+    """Point-in-time view of a run held by the RunRegistry."""
+    run_id: str
+    kind: str
+    issue_key: str
+    status: JobStatus
+    attempt: int
+    started_at: float
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    phases: list[PhaseTiming] = field(default_factory=list)
+    last_seq: int = 0
+
+    @property
+    def elapsed_ms(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return (self.finished_at - self.started_at) * 1000
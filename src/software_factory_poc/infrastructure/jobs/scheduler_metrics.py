@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class SchedulerMetrics:
+    """
+    Point-in-time view of the job scheduler: backlog per tenant and lane, running jobs
+    per tenant, and how many jobs each tenant has been dispatched since start.
+    """
+    queued_by_tenant: dict[str, int] = field(default_factory=dict)
+    queued_by_lane: dict[str, int] = field(default_factory=dict)
+    running_by_tenant: dict[str, int] = field(default_factory=dict)
+    dispatched_by_tenant: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total_queued(self) -> int:
+        return sum(self.queued_by_tenant.values())
+
+    @property
+    def total_running(self) -> int:
+        return sum(self.running_by_tenant.values())
@@ -0,0 +1,371 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_record import JobRecord
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_submission import JobSubmission
+from software_factory_poc.infrastructure.jobs.queue_depth import QueueDepth
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT,
+    dedup_key TEXT,
+    tenant TEXT,
+    owner TEXT,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, available_at, created_at);
+CREATE TABLE IF NOT EXISTS queue_workers (
+    owner TEXT PRIMARY KEY,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+# Columns added after the first release; created on open for older queue files
+_MIGRATIONS = {
+    "dedup_key": "ALTER TABLE jobs ADD COLUMN dedup_key TEXT",
+    "tenant": "ALTER TABLE jobs ADD COLUMN tenant TEXT",
+    "owner": "ALTER TABLE jobs ADD COLUMN owner TEXT",
+    "started_at": "ALTER TABLE jobs ADD COLUMN started_at REAL",
+    "finished_at": "ALTER TABLE jobs ADD COLUMN finished_at REAL",
+}
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_issue ON jobs (issue_key, kind, status);
+CREATE INDEX IF NOT EXISTS idx_jobs_dedup ON jobs (dedup_key, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_tenant ON jobs (status, tenant, kind, available_at);
+"""
+
+_COLUMNS = (
+    "id, kind, issue_key, payload, status, attempts, max_attempts, available_at, created_at, updated_at, "
+    "last_error, dedup_key, tenant, started_at, finished_at"
+)
+_ACTIVE_STATUSES = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+
+
+class SqliteJobQueue:
+    """
+    Durable FIFO job queue on a local SQLite file (WAL mode), safe to share between the
+    worker processes of one host. Each process claims jobs under its `owner_id` and
+    heartbeats; jobs left RUNNING by an owner that stopped heartbeating (a crash, or a
+    previous start) are re-queued by `requeue_interrupted`.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        clock: Callable[[], float] = time.time,
+        owner_id: Optional[str] = None,
+        stale_after_seconds: float = 60.0,
+    ):
+        self.db_path = str(db_path)
+        self.owner_id = owner_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stale_after_seconds = stale_after_seconds
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def enqueue(
+        self,
+        kind: JobKind,
+        issue_key: str,
+        payload: dict[str, Any],
+        max_attempts: int = 3,
+        tenant: Optional[str] = None,
+    ) -> JobRecord:
+        with self._lock:
+            job_id = self._insert(kind, issue_key, payload, max_attempts, None, tenant)
+            return self._require(job_id)
+
+    def enqueue_unique(
+        self,
+        kind: JobKind,
+        issue_key: str,
+        payload: dict[str, Any],
+        dedup_key: str,
+        window_seconds: float,
+        max_attempts: int = 3,
+        tenant: Optional[str] = None,
+    ) -> JobSubmission:
+        """
+        Idempotent enqueue. In a single transaction:
+        - a QUEUED run of the same kind for the issue absorbs the trigger (latest payload wins);
+        - a RUNNING run with the same dedup key is reused;
+        - a non-failed run with the same dedup key created within `window_seconds` is reused;
+        otherwise a new job is inserted.
+        """
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                submission = self._find_reusable(kind, issue_key, payload, dedup_key, now - window_seconds)
+                if submission is None:
+                    job_id = self._insert(kind, issue_key, payload, max_attempts, dedup_key, tenant)
+                    submission = JobSubmission(job=self._require(job_id), created=True)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if not submission.created:
+            logger.info(f"Duplicate trigger for {issue_key} ({kind.value}) reuses job {submission.job.id}")
+        return submission
+
+    def claim(
+        self,
+        tenant: Optional[str] = None,
+        kinds: Optional[list[JobKind]] = None,
+        max_running: Optional[int] = None,
+    ) -> Optional[JobRecord]:
+        """
+        Atomically moves the oldest due job to RUNNING and returns it (None when nothing is due).
+        Optionally restricted to one tenant and/or some job kinds (used by the fair scheduler).
+        With a tenant, `max_running` is checked in the same statement, so the per-project cap
+        holds across processes sharing the queue file.
+        """
+        now = self._clock()
+        filters, params = "", [JobStatus.QUEUED.value, now]
+        if tenant is not None:
+            filters += " AND tenant = ?"
+            params.append(tenant)
+            if max_running is not None:
+                filters += " AND (SELECT COUNT(*) FROM jobs WHERE status = ? AND tenant = ?) < ?"
+                params.extend([JobStatus.RUNNING.value, tenant, max_running])
+        if kinds:
+            filters += f" AND kind IN ({', '.join('?' for _ in kinds)})"
+            params.extend(kind.value for kind in kinds)
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ?, owner = ?,
+                    started_at = ?, finished_at = NULL
+                WHERE id = (
+                    SELECT id FROM jobs WHERE status = ? AND available_at <= ?{filters}
+                    ORDER BY available_at, created_at LIMIT 1
+                )
+                RETURNING {_COLUMNS}
+                """,
+                (JobStatus.RUNNING.value, now, self.owner_id, now, *params)
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def queue_depths(self, due_only: bool = False) -> list[QueueDepth]:
+        """Number of QUEUED jobs per (tenant, kind); with `due_only`, only those whose backoff has elapsed."""
+        query = "SELECT tenant, kind, COUNT(*) AS total FROM jobs WHERE status = ?"
+        params: list[Any] = [JobStatus.QUEUED.value]
+        if due_only:
+            query += " AND available_at <= ?"
+            params.append(self._clock())
+        with self._lock:
+            rows = self._conn.execute(query + " GROUP BY tenant, kind", params).fetchall()
+        return [QueueDepth(tenant=row["tenant"], kind=JobKind(row["kind"]), queued=row["total"]) for row in rows]
+
+    def queued_count(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (JobStatus.QUEUED.value,)).fetchone()
+        return row[0]
+
+    def running_by_tenant(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT tenant, COUNT(*) AS total FROM jobs WHERE status = ? GROUP BY tenant",
+                (JobStatus.RUNNING.value,)
+            ).fetchall()
+        return {row["tenant"] or "": row["total"] for row in rows}
+
+    def complete(self, job_id: str) -> None:
+        self._set_status(job_id, JobStatus.SUCCEEDED, None)
+
+    def retry_later(self, job_id: str, error: str, delay_seconds: float) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, updated_at = ?, finished_at = ?, last_error = ? "
+                "WHERE id = ?",
+                (JobStatus.QUEUED.value, now + max(0.0, delay_seconds), now, now, error, job_id)
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._set_status(job_id, JobStatus.FAILED, error)
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        with self._lock:
+            return self._select(job_id)
+
+    def heartbeat(self) -> None:
+        """Marks this owner as alive; its RUNNING jobs are not taken over while it keeps heartbeating."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO queue_workers (owner, heartbeat_at) VALUES (?, ?) "
+                "ON CONFLICT(owner) DO UPDATE SET heartbeat_at = excluded.heartbeat_at",
+                (self.owner_id, self._clock())
+            )
+
+    def retire(self) -> None:
+        """Removes this owner's heartbeat on a clean shutdown."""
+        with self._lock:
+            self._conn.execute("DELETE FROM queue_workers WHERE owner = ?", (self.owner_id,))
+
+    def requeue_interrupted(self) -> int:
+        """
+        Re-queues RUNNING jobs whose owner is gone: no heartbeat within `stale_after_seconds`
+        (crashed peer, previous start) or no owner at all (queue files from older versions).
+        Safe to call at startup and periodically while other processes keep working.
+        """
+        now = self._clock()
+        stale_before = now - self.stale_after_seconds
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM queue_workers WHERE heartbeat_at < ? AND owner != ?", (stale_before, self.owner_id)
+                )
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET status = ?, updated_at = ?, owner = NULL WHERE status = ? AND owner IS NOT ? "
+                    "AND (owner IS NULL OR owner NOT IN (SELECT owner FROM queue_workers WHERE heartbeat_at >= ?))",
+                    (JobStatus.QUEUED.value, now, JobStatus.RUNNING.value, self.owner_id, stale_before)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if cursor.rowcount:
+            logger.warning(f"Re-queued {cursor.rowcount} job(s) interrupted by a stopped worker process.")
+        return cursor.rowcount
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS total FROM jobs GROUP BY status").fetchall()
+        counts = {status.value: 0 for status in JobStatus}
+        counts.update({row["status"]: row["total"] for row in rows})
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _insert(
+        self,
+        kind: JobKind,
+        issue_key: str,
+        payload: dict[str, Any],
+        max_attempts: int,
+        dedup_key: Optional[str],
+        tenant: Optional[str],
+    ) -> str:
+        now = self._clock()
+        job_id = uuid.uuid4().hex
+        # Tenant defaults to the Jira project key ("KAN-12" -> "KAN")
+        tenant = tenant or issue_key.split("-", 1)[0]
+        self._conn.execute(
+            f"INSERT INTO jobs ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?, ?, NULL, ?, ?, NULL, NULL)",
+            (job_id, kind.value, issue_key, json.dumps(payload, default=str), JobStatus.QUEUED.value,
+             max(1, max_attempts), now, now, now, dedup_key, tenant)
+        )
+        logger.info(f"Job {job_id} queued ({kind.value} for {issue_key})")
+        return job_id
+
+    def _find_reusable(
+        self, kind: JobKind, issue_key: str, payload: dict[str, Any], dedup_key: str, window_start: float
+    ) -> Optional[JobSubmission]:
+        active = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE issue_key = ? AND kind = ? AND status IN (?, ?) "
+            "ORDER BY created_at DESC",
+            (issue_key, kind.value, *_ACTIVE_STATUSES)
+        ).fetchall()
+        for row in active:
+            if row["status"] == JobStatus.QUEUED.value:
+                if row["dedup_key"] != dedup_key:
+                    # Coalesce: the pending run picks up the newest description instead of queuing another
+                    self._conn.execute(
+                        "UPDATE jobs SET payload = ?, dedup_key = ?, updated_at = ? WHERE id = ?",
+                        (json.dumps(payload, default=str), dedup_key, self._clock(), row["id"])
+                    )
+                return JobSubmission(job=self._require(row["id"]), created=False)
+            if row["dedup_key"] == dedup_key:
+                return JobSubmission(job=self._to_record(row), created=False)
+
+        recent = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE dedup_key = ? AND created_at >= ? AND status != ? "
+            "ORDER BY created_at DESC LIMIT 1",
+            (dedup_key, window_start, JobStatus.FAILED.value)
+        ).fetchone()
+        return JobSubmission(job=self._to_record(recent), created=False) if recent else None
+
+    def _select(self, job_id: str) -> Optional[JobRecord]:
+        row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_record(row) if row else None
+
+    def _require(self, job_id: str) -> JobRecord:
+        """Reads a job the caller just wrote under the lock, so it must exist."""
+        job = self._select(job_id)
+        if job is None:
+            raise LookupError(f"Job {job_id} is missing from the queue")
+        return job
+
+    def _migrate(self) -> None:
+        existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, ddl in _MIGRATIONS.items():
+            if column not in existing:
+                self._conn.execute(ddl)
+        self._conn.execute(
+            "UPDATE jobs SET tenant = CASE WHEN instr(issue_key, '-') > 0 "
+            "THEN substr(issue_key, 1, instr(issue_key, '-') - 1) ELSE issue_key END WHERE tenant IS NULL"
+        )
+        self._conn.executescript(_INDEXES)
+
+    def _set_status(self, job_id: str, status: JobStatus, error: Optional[str]) -> None:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ?, finished_at = ?, last_error = ? WHERE id = ?",
+                (status.value, now, now, error, job_id)
+            )
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> JobRecord:
+        return JobRecord(
+            id=row["id"],
+            kind=JobKind(row["kind"]),
+            issue_key=row["issue_key"],
+            status=JobStatus(row["status"]),
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            available_at=row["available_at"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            payload=json.loads(row["payload"]),
+            last_error=row["last_error"],
+            dedup_key=row["dedup_key"],
+            tenant=row["tenant"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+        )
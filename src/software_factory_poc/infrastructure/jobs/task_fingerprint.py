@@ -0,0 +1,30 @@
+import hashlib
+import json
+
+from software_factory_poc.application.core.domain.entities.task import Task
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.webhook_trigger import WebhookTrigger
+
+
+class TaskFingerprint:
+    """
+    Stable identifiers derived from a Task, used to recognise repeated webhooks for the same request.
+    """
+
+    @staticmethod
+    def config_hash(task: Task) -> str:
+        """Hash of the parsed YAML config; key order and formatting in the description do not matter."""
+        canonical = json.dumps(task.description.config, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def dedup_key(kind: JobKind, task: Task) -> str:
+        return f"{kind.value}:{task.key}:{task.event_type or 'unknown'}:{TaskFingerprint.config_hash(task)}"
+
+    @staticmethod
+    def webhook_dedup_key(kind: JobKind, trigger: WebhookTrigger) -> str:
+        """
+        Identifies repeated webhooks for the same request: issue, event and config block.
+        Timestamp and changelog differ on every delivery, so the body itself is not hashed.
+        """
+        return f"{kind.value}:{trigger.issue_key}:{trigger.event_type}:block:{trigger.config_hash or 'none'}"
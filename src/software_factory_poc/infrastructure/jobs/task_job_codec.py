@@ -0,0 +1,33 @@
+from dataclasses import asdict
+from typing import Any, Optional
+
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription, TaskUser
+
+
+class TaskJobCodec:
+    """
+    Converts the domain Task to and from the JSON-safe payload persisted with a job.
+    Webhook jobs persist the raw request body instead; workers map it to a Task when they run it.
+    """
+
+    WEBHOOK_BODY_FIELD = "webhook_body"
+
+    @staticmethod
+    def to_payload(task: Task) -> dict[str, Any]:
+        return asdict(task)
+
+    @staticmethod
+    def from_payload(payload: dict[str, Any]) -> Task:
+        data = dict(payload)
+        data["description"] = TaskDescription(**data["description"])
+        if data.get("reporter"):
+            data["reporter"] = TaskUser(**data["reporter"])
+        return Task(**data)
+
+    @staticmethod
+    def to_webhook_payload(body: bytes) -> dict[str, Any]:
+        return {TaskJobCodec.WEBHOOK_BODY_FIELD: body.decode("utf-8", errors="replace")}
+
+    @staticmethod
+    def webhook_body(payload: dict[str, Any]) -> Optional[str]:
+        return payload.get(TaskJobCodec.WEBHOOK_BODY_FIELD)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class WebhookTrigger:
+    """
+    Fields sniffed from a raw webhook body at ingestion time. They identify the trigger
+    (issue, event and config block) independently of per-delivery noise such as the
+    timestamp or the changelog, and route the job to its project's tenant.
+    """
+    issue_key: str
+    project_key: Optional[str] = None
+    event_type: str = "unknown"
+    config_hash: str = ""
@@ -0,0 +1,4 @@
+from software_factory_poc.infrastructure.polling.jira_issue_poller import JiraIssuePoller
+from software_factory_poc.infrastructure.polling.jira_poll_report import JiraPollReport
+
+__all__ = ["JiraIssuePoller", "JiraPollReport"]
@@ -0,0 +1,190 @@
+import math
+import os
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Optional
+
+from software_factory_poc.application.core.agents.reporter.ports.task_tracker_gateway import TaskTrackerGateway
+from software_factory_poc.application.core.domain.entities.task import Task
+from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.configuration.jira_polling_settings import JiraPollingSettings
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+from software_factory_poc.infrastructure.polling.jira_poll_report import JiraPollReport
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+_ORDER_BY = re.compile(r"\s+order\s+by\s+.*$", re.IGNORECASE | re.DOTALL)
+_JIRA_TIMESTAMP = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+class JiraIssuePoller:
+    """
+    Scheduled ingestion for Jira instances that cannot call the webhooks.
+    Each poll of a configured JQL query:
+    1. searches only the issues updated since the cursor (relative `updated >= -Nm`, so the
+       Jira user's time zone does not matter), reading the `updated` field alone;
+    2. skips issues whose `updated` value was already ingested;
+    3. bulk-fetches the changed issues in pages, `concurrency` pages at a time;
+    4. queues them on the worker pool like a webhook would (same dedup and fairness).
+    Polls are skipped while the queue refuses new work. Cursors and ingested markers live
+    in the shared store; with several processes only the lease holder polls.
+    """
+
+    LEADER_KEY = "jira-poll:leader"
+
+    def __init__(
+        self,
+        tracker: Callable[[], TaskTrackerGateway],
+        job_pool: JobWorkerPool,
+        settings: JiraPollingSettings,
+        store: Optional[SharedStore] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.tracker = tracker
+        self.job_pool = job_pool
+        self.settings = settings
+        self.store = store or InMemorySharedStore()
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.queries = {
+            kind: jql for kind, jql in (
+                (JobKind.CODE_REVIEW, settings.code_review_jql),
+                (JobKind.SCAFFOLDING, settings.scaffolding_jql),
+            ) if jql
+        }
+        self._clock = clock
+        # An ingested marker must outlive every window that can still return the issue
+        self._seen_ttl = int(2 * max(settings.initial_lookback_minutes * 60,
+                                     settings.interval_seconds + settings.overlap_seconds))
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="jira-poller", daemon=True)
+        self._thread.start()
+        logger.info(f"Jira poller started for {[kind.value for kind in self.queries]}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info("Jira poller stopped.")
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self.is_leader():
+                    self.poll_once()
+            except Exception as e:
+                logger.error(f"Jira poll failed: {e}")
+            self._stop_event.wait(self.settings.interval_seconds)
+
+    def is_leader(self) -> bool:
+        lease = max(1, int(self.settings.interval_seconds * 2))
+        if self.store.set(self.LEADER_KEY, self.owner_id, ex=lease, nx=True):
+            return True
+        if self.store.get(self.LEADER_KEY) == self.owner_id:
+            self.store.set(self.LEADER_KEY, self.owner_id, ex=lease)
+            return True
+        return False
+
+    # --- Polling ---
+
+    def poll_once(self) -> list[JiraPollReport]:
+        reports = []
+        for kind, jql in self.queries.items():
+            try:
+                reports.append(self._poll(kind, jql))
+            except Exception as e:
+                logger.error(f"Jira poll of {kind.value} issues failed: {e}")
+                reports.append(JiraPollReport(kind=kind.value, error=f"{type(e).__name__}: {e}"))
+        return reports
+
+    def _poll(self, kind: JobKind, jql: str) -> JiraPollReport:
+        started = time.monotonic()
+        if not self.job_pool.admit().admitted:
+            logger.info(f"Jira poll of {kind.value} issues skipped: job queue is not accepting work")
+            return JiraPollReport(kind=kind.value, throttled=True)
+
+        now = self._clock()
+        tracker = self.tracker()
+        limit = self.settings.max_issues_per_poll
+        versions = tracker.search_task_versions(
+            self._incremental_query(kind, jql, now), limit=limit, page_size=self.settings.page_size
+        )
+        changed = [key for key, updated in versions.items() if self.store.get(self._seen_key(kind, key)) != updated]
+
+        queued = deduplicated = 0
+        for task in self._fetch(tracker, changed):
+            submission = self.job_pool.submit(kind, task)
+            queued += submission.created
+            deduplicated += not submission.created
+            self.store.set(self._seen_key(kind, task.key), versions.get(task.key, ""), ex=self._seen_ttl)
+
+        cursor = now
+        if len(versions) >= limit:
+            # Truncated (oldest first): continue from the last issue read instead of skipping the rest
+            logger.warning(f"Jira poll of {kind.value} issues hit the limit of {limit} issues")
+            cursor = self._epoch(list(versions.values())[-1]) or now
+        self.store.set(self._cursor_key(kind), repr(cursor))
+
+        report = JiraPollReport(
+            kind=kind.value,
+            matched=len(versions),
+            changed=len(changed),
+            queued=queued,
+            deduplicated=deduplicated,
+            duration_ms=(time.monotonic() - started) * 1000,
+        )
+        if report.changed:
+            logger.info(
+                f"Jira poll of {kind.value} issues: {report.matched} matched, {report.changed} changed, "
+                f"{report.queued} queued, {report.deduplicated} deduplicated in {report.duration_ms:.0f} ms"
+            )
+        return report
+
+    def _incremental_query(self, kind: JobKind, jql: str, now: float) -> str:
+        cursor = self.store.get(self._cursor_key(kind))
+        window: float
+        if cursor is None:
+            window = self.settings.initial_lookback_minutes * 60
+        else:
+            window = max(0.0, now - float(cursor)) + self.settings.overlap_seconds
+        minutes = max(1, math.ceil(window / 60))
+        return f"({_ORDER_BY.sub('', jql.strip())}) AND updated >= -{minutes}m ORDER BY updated ASC"
+
+    def _fetch(self, tracker: TaskTrackerGateway, keys: list[str]) -> list[Task]:
+        if not keys:
+            return []
+        size = max(1, self.settings.page_size)
+        pages = [keys[start:start + size] for start in range(0, len(keys), size)]
+        workers = max(1, min(self.settings.concurrency, len(pages)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-poll") as executor:
+            return [task for tasks in executor.map(tracker.get_tasks, pages) for task in tasks]
+
+    @staticmethod
+    def _epoch(updated: str) -> Optional[float]:
+        try:
+            return datetime.strptime(updated, _JIRA_TIMESTAMP).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _cursor_key(kind: JobKind) -> str:
+        return f"jira-poll:{kind.value}:cursor"
+
+    @staticmethod
+    def _seen_key(kind: JobKind, issue_key: str) -> str:
+        return f"jira-poll:{kind.value}:seen:{issue_key}"
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class JiraPollReport:
+    """
+    Outcome of one poll of a JQL query: issues matched by the incremental search, new or
+    changed ones, and what the job queue did with them.
+    """
+    kind: str
+    matched: int = 0
+    changed: int = 0
+    queued: int = 0
+    deduplicated: int = 0
+    throttled: bool = False
+    error: Optional[str] = None
+    duration_ms: float = 0.0
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Any
+from typing import Any, Optional
 
 from software_factory_poc.application.core.agents.common.config.llm_provider_type import (
     LlmProviderType,
@@ -18,6 +18,7 @@ from software_factory_poc.application.core.agents.reasoner.value_objects.message
 from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import (
     ScaffoldingAgentConfig,
 )
+from software_factory_poc.infrastructure.common.async_bridge.background_event_loop import BackgroundEventLoop
 from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
 
 logger = LoggerFactoryService.build_logger(__name__)
@@ -35,10 +36,13 @@ class CompositeLlmGateway(LlmGateway):
     def __init__(
             self,
             config: ScaffoldingAgentConfig,
-            clients: dict[LlmProviderType, LlmProvider]
+            clients: dict[LlmProviderType, LlmProvider],
+            event_loop: Optional[BackgroundEventLoop] = None
     ):
         self.config = config
         self.clients = clients
+        # With a shared background loop the async SDK clients can be reused across runs
+        self.event_loop = event_loop
         # Use config provided priority list, or fallback to known keys
         self.priority_list: list[Any] = config.llm_model_priority
 
@@ -154,6 +158,8 @@ class CompositeLlmGateway(LlmGateway):
             )
         )
 
+        if self.event_loop is not None:
+            return self.event_loop.run(client.generate(request))
         response = asyncio.run(client.generate(request))
         return response
 
@@ -0,0 +1,44 @@
+from software_factory_poc.application.core.agents.research.dtos.project_context_dto import ProjectContextDTO
+from software_factory_poc.application.core.agents.research.ports.research_gateway import ResearchGateway
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+
+
+class CachedResearchGateway(ResearchGateway):
+    """
+    Decorator that routes every ResearchGateway read through the shared ResearchCache.
+    Keys are namespaced by provider so different backends never collide.
+    """
+
+    def __init__(self, inner: ResearchGateway, cache: ResearchCache, namespace: str):
+        self.inner = inner
+        self.cache = cache
+        self.namespace = namespace
+
+    def retrieve_context(self, query: str) -> str:
+        return self.cache.get_or_load(
+            ResearchCacheKind.SEARCH,
+            self._key(query),
+            lambda: self.inner.retrieve_context(query)
+        )
+
+    def get_page_content(self, page_id: str) -> str:
+        return self.cache.get_or_load(
+            ResearchCacheKind.PAGE,
+            self._key(page_id),
+            lambda: self.inner.get_page_content(page_id)
+        )
+
+    def get_project_context(self, project_name: str) -> ProjectContextDTO:
+        return self.cache.get_or_load(
+            ResearchCacheKind.PROJECT_CONTEXT,
+            self._key(project_name),
+            lambda: self.inner.get_project_context(project_name)
+        )
+
+    @staticmethod
+    def build_key(namespace: str, value: str) -> str:
+        return f"{namespace}:{value}"
+
+    def _key(self, value: str) -> str:
+        return self.build_key(self.namespace, value)
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
 import httpx
 
 from software_factory_poc.infrastructure.configuration.confluence_settings import ConfluenceSettings
@@ -7,6 +10,10 @@ logger = LoggerFactoryService.build_logger(__name__)
 
 
 class ConfluenceHttpClient:
+    CHILD_PAGE_SIZE = 50
+    MAX_PARALLEL_REQUESTS = 4
+    METADATA_EXPAND = "version,space"
+
     def __init__(self, settings: ConfluenceSettings) -> None:
         self.base_url = settings.base_url.rstrip("/")
         self.auth = (
@@ -15,10 +22,12 @@ class ConfluenceHttpClient:
         )
         self.timeout = 30.0
 
-    def get(self, path: str, params: dict = None) -> httpx.Response:
+    def get(self, path: str, params: dict = None, headers: Optional[dict] = None) -> httpx.Response:
         url = f"{self.base_url}/{path.lstrip('/')}"
         logger.info(f"GET {url}")
         with httpx.Client(timeout=self.timeout) as client:
+            if headers:
+                return client.get(url, auth=self.auth, params=params, headers=headers)
             return client.get(url, auth=self.auth, params=params)
 
     def get_page(self, page_id: str) -> dict:
@@ -28,20 +37,97 @@ class ConfluenceHttpClient:
         response.raise_for_status()
         return response.json()
 
-    def search(self, query: str, limit: int = 25) -> list[dict]:
+    def get_page_if_modified(self, page_id: str, etag: Optional[str] = None) -> tuple[Optional[dict], Optional[str]]:
+        """
+        Conditional GET of a page. Returns (None, etag) when the server answers 304 Not Modified,
+        otherwise (page, new_etag).
+        """
+        path = f"rest/api/content/{page_id}"
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.get(path, params={"expand": "body.storage,version"}, headers=headers)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return response.json(), response.headers.get("ETag")
+
+    def search(self, query: str, limit: int = 25, start: int = 0, expand: str = "body.storage,body.view") -> list[dict]:
         """Busca páginas usando CQL (Confluence Query Language)."""
         # Asumimos búsqueda por título o texto si no es CQL puro
         cql_expression = f'text ~ "{query}"' if "=" not in query else query
         
         path = "rest/api/content/search"
-        response = self.get(path, params={"cql": cql_expression, "limit": limit, "expand": "body.storage,body.view"})
+        params = {"cql": cql_expression, "limit": limit, "expand": expand}
+        if start:
+            params["start"] = start
+        response = self.get(path, params=params)
         response.raise_for_status()
         data = response.json()
         return data.get("results", [])
 
     def get_child_pages(self, page_id: str, start: int = 0, limit: int = 50, expand: str = "body.storage") -> list[dict]:
         """Obtiene las páginas hijas directas."""
+        return self._get_child_page_batch(page_id, start, limit, expand).get("results", [])
+
+    def get_all_child_pages(
+        self,
+        page_id: str,
+        metadata_only: bool = False,
+        limit: int = CHILD_PAGE_SIZE,
+        max_workers: int = MAX_PARALLEL_REQUESTS,
+    ) -> list[dict]:
+        """
+        Returns every direct child of a page, in server order.
+        The first batch is fetched alone to learn `size`/`totalSize`; the remaining offsets
+        are then requested concurrently (at most `max_workers` in flight).
+        With `metadata_only` the bodies are not expanded; use `get_pages` for the ones you need.
+        """
+        expand = self.METADATA_EXPAND if metadata_only else "body.storage"
+        first = self._get_child_page_batch(page_id, 0, limit, expand)
+        pages = list(first.get("results", []))
+        size = first.get("size", len(pages))
+        if size < limit:
+            return pages
+
+        total = first.get("totalSize")
+        if total is not None:
+            offsets = list(range(size, total, limit))
+            for batch in self._map_concurrently(
+                lambda start: self._get_child_page_batch(page_id, start, limit, expand).get("results", []),
+                offsets,
+                max_workers,
+            ):
+                pages.extend(batch)
+            return pages
+
+        # No totalSize in the response: probe the next offsets in waves of `max_workers`
+        start = size
+        while True:
+            offsets = [start + i * limit for i in range(max(1, max_workers))]
+            batches = self._map_concurrently(
+                lambda offset: self._get_child_page_batch(page_id, offset, limit, expand).get("results", []),
+                offsets,
+                max_workers,
+            )
+            for batch in batches:
+                pages.extend(batch)
+                if len(batch) < limit:
+                    return pages
+            start = offsets[-1] + limit
+
+    def get_pages(self, page_ids: Iterable[str], max_workers: int = MAX_PARALLEL_REQUESTS) -> list[dict]:
+        """Fetches several pages (with body) concurrently, keeping the order of `page_ids`."""
+        return self._map_concurrently(self.get_page, list(page_ids), max_workers)
+
+    def _get_child_page_batch(self, page_id: str, start: int, limit: int, expand: str) -> dict:
         path = f"rest/api/content/{page_id}/child/page"
         response = self.get(path, params={"start": start, "limit": limit, "expand": expand})
         response.raise_for_status()
-        return response.json().get("results", [])
+        return response.json()
+
+    @staticmethod
+    def _map_concurrently(fn, items: list, max_workers: int) -> list:
+        if len(items) <= 1 or max_workers <= 1:
+            return [fn(item) for item in items]
+        workers = min(max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="confluence-http") as executor:
+            return list(executor.map(fn, items))
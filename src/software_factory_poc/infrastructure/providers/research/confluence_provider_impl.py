@@ -1,7 +1,8 @@
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Any
-from html.parser import HTMLParser
 
 from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
 from software_factory_poc.application.core.agents.research.config.research_provider_type import ResearchProviderType
@@ -9,27 +10,14 @@ from software_factory_poc.application.core.agents.research.ports.research_gatewa
 from software_factory_poc.infrastructure.configuration.confluence_settings import ConfluenceSettings
 from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
 from software_factory_poc.infrastructure.providers.research.clients.confluence_http_client import ConfluenceHttpClient
+from software_factory_poc.infrastructure.providers.research.mappers.confluence_storage_mapper import ConfluenceStorageMapper
 from software_factory_poc.application.core.agents.research.dtos.document_content_dto import DocumentContentDTO
 from software_factory_poc.application.core.agents.research.dtos.project_context_dto import ProjectContextDTO
 
 logger = LoggerFactoryService.build_logger(__name__)
 
-class _ConfluenceHTMLParser(HTMLParser):
-    def __init__(self):
-        super().__init__()
-        self.text_parts = []
-    
-    def handle_starttag(self, tag, attrs):
-        if tag in ['br', 'p', 'div', 'tr']:
-            self.text_parts.append('\n')
-        elif tag in ['td', 'th']:
-            self.text_parts.append(' | ')
-            
-    def handle_data(self, data):
-        self.text_parts.append(data)
-        
-    def get_text(self):
-        return "".join(self.text_parts).strip()
+# Rendered project documents kept, least recently used evicted first
+CHILD_PAGE_CACHE_SIZE = 512
 
 class ConfluenceProviderImpl(ResearchGateway):
     """
@@ -41,6 +29,9 @@ class ConfluenceProviderImpl(ResearchGateway):
         self.http_client = ConfluenceHttpClient(settings)
         # 1. Configurable Space Key
         self.space_key = os.getenv("CONFLUENCE_SPACE_KEY", "DDS")
+        # Project documents by page id: (version number, rendered text)
+        self._child_pages: "OrderedDict[str, tuple[Any, str]]" = OrderedDict()
+        self._child_pages_lock = threading.Lock()
 
     def retrieve_context(self, query: str) -> str:
         """
@@ -75,9 +66,13 @@ class ConfluenceProviderImpl(ResearchGateway):
                 return ""
             raise e
 
+    def render_page(self, page: dict) -> str:
+        """Converts a raw page payload into the same text served by get_page_content."""
+        return self._extract_text(page)
+
     def _get_page_by_id(self, page_id: str) -> str:
         page = self.http_client.get_page(page_id)
-        return self._extract_text(page)
+        return self.render_page(page)
 
     def _search_pages(self, cql_query: str) -> str:
         results = self.http_client.search(cql_query)
@@ -85,6 +80,37 @@ class ConfluenceProviderImpl(ResearchGateway):
              return "No knowledge found."
         return self._extract_text(results[0])
 
+    def _child_page_contents(self, children: list[dict]) -> dict[str, str]:
+        """
+        Rendered text of each listed child page. Bodies are downloaded (in parallel) only for
+        pages not rendered before or whose version changed since; the others are reused.
+        """
+        contents: dict[str, str] = {}
+        outdated: list[tuple[str, Any]] = []
+        with self._child_pages_lock:
+            for child in children:
+                page_id: str = child.get("id") or ""
+                version = (child.get("version") or {}).get("number")
+                known = self._child_pages.get(page_id)
+                if known is not None and version is not None and known[0] == version:
+                    self._child_pages.move_to_end(page_id)
+                    contents[page_id] = known[1]
+                elif page_id:
+                    outdated.append((page_id, version))
+
+        if not outdated:
+            return contents
+        pages = self.http_client.get_pages([page_id for page_id, _ in outdated])
+        with self._child_pages_lock:
+            for (page_id, version), page in zip(outdated, pages, strict=True):
+                contents[page_id] = self._extract_text(page)
+                self._child_pages[page_id] = (version, contents[page_id])
+                self._child_pages.move_to_end(page_id)
+            while len(self._child_pages) > CHILD_PAGE_CACHE_SIZE:
+                self._child_pages.popitem(last=False)
+        logger.info(f"Downloaded {len(outdated)} of {len(children)} project documents (others unchanged)")
+        return contents
+
     def _extract_text(self, page_obj: Any) -> str:
         if not page_obj: 
             return ""
@@ -112,9 +138,8 @@ class ConfluenceProviderImpl(ResearchGateway):
                     break
             
             if val and isinstance(val, str) and len(val.strip()) > 50:
-                parser = _ConfluenceHTMLParser()
-                parser.feed(val)
-                return self._sanitize_content(parser.get_text())
+                # Single pass: the mapper already decodes entities and normalises whitespace
+                return ConfluenceStorageMapper.to_markdown(val)
 
         # Fallback to string repr if nothing else matches, but sanitize it too
         return self._sanitize_content(str(page_obj))
@@ -319,44 +344,17 @@ class ConfluenceProviderImpl(ResearchGateway):
                     retryable=False
                 )
             
-            # Step C: Recuperación Masiva de Hijos (Documentos)
-            all_pages = []
-            start = 0
-            limit = 50
-            
-            while True:
-                # Assuming check for implicit next link or loop
-                results = self.http_client.get_child_pages(
-                    page_id=project_folder_id, 
-                    limit=limit, 
-                    expand='body.storage',
-                    start=start
-                )
-                
-                if not results:
-                    break
-                    
-                all_pages.extend(results)
-                start += len(results)
-                
-                # Check for pagination break
-                if len(results) < limit:
-                     break
+            # Step C: Recuperación Masiva de Hijos (solo metadatos), paginada en paralelo
+            all_pages = self.http_client.get_all_child_pages(project_folder_id, metadata_only=True)
+            contents = self._child_page_contents(all_pages)
             
             # Step D: Procesamiento
             docs = []
             for child in all_pages:
-                # Reuse extraction logic properly
-                raw_html_val = ""
-                # Safely extract body.storage.value manually or reuse _extract_text
-                # _extract_text Logic already finds body.storage and cleans it.
-                # Let's use it to be consistent and clean.
-                cleaned_content = self._extract_text(child)
-                
                 doc = DocumentContentDTO(
                     title=child.get("title", "Untitled"),
                     url=child.get("_links", {}).get("webui", ""),
-                    content=cleaned_content,
+                    content=contents.get(child.get("id") or "", ""),
                     metadata={
                         "id": child.get("id"),
                         "space": child.get("space", {}).get("key", "")
@@ -0,0 +1,267 @@
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from software_factory_poc.application.core.agents.research.config.research_provider_type import ResearchProviderType
+from software_factory_poc.application.core.agents.scaffolding.scaffolding_agent import ScaffoldingAgent
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.configuration.research_cache_settings import ResearchCacheSettings
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+from software_factory_poc.infrastructure.providers.research.cached_research_gateway import CachedResearchGateway
+from software_factory_poc.infrastructure.providers.research.confluence_provider_impl import ConfluenceProviderImpl
+from software_factory_poc.infrastructure.providers.research.dtos.prewarm_report_dto import PrewarmReportDTO
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+# A cache entry the research agent looks up by something other than a page ID
+_Lookup = tuple[ResearchCacheKind, str, Callable[[], Any]]
+
+
+class ConfluenceSpacePrewarmer:
+    """
+    Background job that keeps the research cache warm with what the research agent looks up
+    at webhook time: the architecture page, the project context of every project folder,
+    the fallback searches of the configured technology stacks, and the pages of the
+    configured Confluence spaces. A sync fills at most `prewarm_cache_fraction` of the cache,
+    in that order, so it never evicts the entries webhook-time lookups depend on.
+    Pages are listed with version metadata only; bodies are downloaded (conditionally,
+    with bounded concurrency) just for pages that are new or changed since the last sync.
+    With a `leader_store`, only the process holding the lease syncs; the others read the
+    pages it loads from the cache's shared tier.
+    """
+
+    PAGE_LIST_BATCH = 50
+    LEADER_KEY = "research-prewarm:leader"
+
+    def __init__(
+        self,
+        provider: ConfluenceProviderImpl,
+        cache: ResearchCache,
+        settings: ResearchCacheSettings,
+        architecture_page_id: Optional[str] = None,
+        leader_store: Optional[SharedStore] = None,
+    ):
+        self.provider = provider
+        self.http_client = provider.http_client
+        self.cache = cache
+        self.settings = settings
+        self.architecture_page_id = architecture_page_id
+        self.space_keys = settings.prewarm_space_keys or [provider.space_key]
+        self.namespace = ResearchProviderType.CONFLUENCE.value
+        self.leader_store = leader_store
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._versions: dict[str, int] = {}
+        self._etags: dict[str, str] = {}
+        self._state_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_loop, name="confluence-prewarmer", daemon=True)
+        self._thread.start()
+        logger.info(f"Confluence pre-warmer started. Spaces: {self.space_keys}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info("Confluence pre-warmer stopped.")
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                if self.is_leader():
+                    self.sync_once()
+            except Exception as e:
+                logger.error(f"Confluence pre-warm sync failed: {e}")
+            self._stop_event.wait(self.settings.prewarm_interval_seconds)
+
+    def is_leader(self) -> bool:
+        """Takes or renews the sync lease. The lease outlives one interval, so a dead leader is replaced."""
+        if self.leader_store is None:
+            return True
+        lease = max(1, int(self.settings.prewarm_interval_seconds * 2))
+        if self.leader_store.set(self.LEADER_KEY, self.owner_id, ex=lease, nx=True):
+            logger.info(f"Confluence pre-warmer lease acquired by {self.owner_id}")
+            return True
+        if self.leader_store.get(self.LEADER_KEY) == self.owner_id:
+            self.leader_store.set(self.LEADER_KEY, self.owner_id, ex=lease)
+            return True
+        return False
+
+    # --- Sync ---
+
+    def budget(self) -> int:
+        """Maximum entries one sync may put in the cache."""
+        return max(1, int(self.cache.max_entries * self.settings.prewarm_cache_fraction))
+
+    def sync_once(self) -> PrewarmReportDTO:
+        started = time.monotonic()
+        budget = self.budget()
+        reserved = 1 if self.architecture_page_id else 0
+        lookups = self._research_lookups(budget - reserved)
+
+        listed_versions: dict[str, Optional[int]] = {}
+        for space_key in self.space_keys:
+            remaining = budget - reserved - len(lookups) - len(listed_versions)
+            if remaining <= 0:
+                break
+            for page_id, version in self._list_space_versions(space_key, remaining).items():
+                listed_versions.setdefault(page_id, version)
+        if self.architecture_page_id:
+            listed_versions.setdefault(self.architecture_page_id, None)
+
+        to_fetch: list[str] = []
+        unchanged = 0
+        for page_id, version in listed_versions.items():
+            if self._is_unchanged(page_id, version):
+                self._touch(page_id)
+                unchanged += 1
+            else:
+                to_fetch.append(page_id)
+
+        fetched = failed = 0
+        jobs: list[Callable[[], Optional[bool]]] = [
+            *(partial(self._warm_lookup, lookup) for lookup in lookups),
+            *(partial(self._fetch_page, page_id) for page_id in to_fetch),
+        ]
+        if jobs:
+            workers = max(1, min(self.settings.prewarm_concurrency, len(jobs)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="confluence-prewarm") as executor:
+                for outcome in executor.map(lambda job: job(), jobs):
+                    if outcome is None:
+                        failed += 1
+                    elif outcome:
+                        fetched += 1
+                    else:
+                        unchanged += 1
+
+        report = PrewarmReportDTO(
+            listed=len(lookups) + len(listed_versions),
+            fetched=fetched,
+            unchanged=unchanged,
+            failed=failed,
+            duration_ms=(time.monotonic() - started) * 1000
+        )
+        logger.info(
+            f"Confluence pre-warm sync done: {report.listed} listed, {report.fetched} fetched, "
+            f"{report.unchanged} unchanged, {report.failed} failed in {report.duration_ms:.0f} ms"
+        )
+        return report
+
+    def _research_lookups(self, limit: int) -> list[_Lookup]:
+        """Project contexts, then fallback searches: the non-page keys the research agent reads."""
+        lookups: list[_Lookup] = []
+        for project_name in self._list_project_names(limit):
+            lookups.append((
+                ResearchCacheKind.PROJECT_CONTEXT, self._key(project_name),
+                partial(self.provider.get_project_context, project_name),
+            ))
+        for stack in self.settings.prewarm_technology_stacks:
+            query = ScaffoldingAgent.FALLBACK_RESEARCH_QUERY.format(stack=stack)
+            lookups.append((
+                ResearchCacheKind.SEARCH, self._key(query),
+                partial(self.provider.retrieve_context, query),
+            ))
+        return lookups[:max(0, limit)]
+
+    def _list_project_names(self, limit: int) -> list[str]:
+        """Titles of the pages under the provider space's "projects" folder (the project names)."""
+        if limit <= 0:
+            return []
+        try:
+            roots = self.http_client.search(
+                f'space = "{self.provider.space_key}" AND title in ("projects", "Projects")',
+                limit=1, start=0, expand="version"
+            )
+            if not roots:
+                return []
+            children = self.http_client.search(
+                f'parent = {roots[0]["id"]} AND type = page',
+                limit=min(self.PAGE_LIST_BATCH, limit), start=0, expand="version"
+            )
+        except Exception as e:
+            logger.warning(f"Could not list the project folders of space '{self.provider.space_key}': {e}")
+            return []
+        return [page["title"] for page in children if page.get("title")]
+
+    def _warm_lookup(self, lookup: _Lookup) -> Optional[bool]:
+        kind, key, load = lookup
+        try:
+            self.cache.put(kind, key, load())
+        except Exception as e:
+            logger.warning(f"Pre-warm of {kind.value} '{key}' failed: {e}")
+            return None
+        return True
+
+    def _list_space_versions(self, space_key: str, max_pages: int) -> dict[str, Optional[int]]:
+        versions: dict[str, Optional[int]] = {}
+        cql = f'space = "{space_key}" AND type = page order by lastModified desc'
+        max_pages = min(max_pages, self.settings.prewarm_max_pages)
+        start = 0
+        while start < max_pages:
+            limit = min(self.PAGE_LIST_BATCH, max_pages - start)
+            try:
+                results = self.http_client.search(cql, limit=limit, start=start, expand="version")
+            except Exception as e:
+                logger.warning(f"Could not list pages of space '{space_key}': {e}")
+                break
+            for page in results:
+                versions[str(page["id"])] = page.get("version", {}).get("number")
+            if len(results) < limit:
+                break
+            start += len(results)
+        return versions
+
+    def _is_unchanged(self, page_id: str, version: Optional[int]) -> bool:
+        with self._state_lock:
+            known = self._versions.get(page_id)
+        if version is None or known is None or known != version:
+            return False
+        return self.cache.peek(ResearchCacheKind.PAGE, self._key(page_id)) is not None
+
+    def _touch(self, page_id: str) -> None:
+        key = self._key(page_id)
+        value = self.cache.peek(ResearchCacheKind.PAGE, key)
+        if value is not None:
+            self.cache.put(ResearchCacheKind.PAGE, key, value)
+
+    def _fetch_page(self, page_id: str) -> Optional[bool]:
+        """Returns True when a new body was cached, False when unchanged (304), None on failure."""
+        with self._state_lock:
+            etag = self._etags.get(page_id)
+        has_cached_body = self.cache.peek(ResearchCacheKind.PAGE, self._key(page_id)) is not None
+        try:
+            page, new_etag = self.http_client.get_page_if_modified(page_id, etag if has_cached_body else None)
+        except Exception as e:
+            logger.warning(f"Pre-warm fetch failed for page {page_id}: {e}")
+            return None
+
+        if page is None:
+            self._touch(page_id)
+            return False
+
+        self.cache.put(ResearchCacheKind.PAGE, self._key(page_id), self.provider.render_page(page))
+        with self._state_lock:
+            version = page.get("version", {}).get("number")
+            if version is not None:
+                self._versions[page_id] = version
+            if new_etag:
+                self._etags[page_id] = new_etag
+        return True
+
+    def _key(self, page_id: str) -> str:
+        return CachedResearchGateway.build_key(self.namespace, page_id)
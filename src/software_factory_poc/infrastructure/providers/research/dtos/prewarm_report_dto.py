@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PrewarmReportDTO:
+    """
+    Outcome of a single pre-warm sync.
+    """
+    listed: int = 0
+    fetched: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    duration_ms: float = 0.0
@@ -0,0 +1,216 @@
+import re
+from html.parser import HTMLParser
+from typing import Optional
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+_HEADING_LEVELS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+_BLOCK_TAGS = frozenset({"p", "div", "blockquote", "section", "ac:rich-text-body", "ac:layout-cell"})
+_SKIPPED_TAGS = frozenset({"script", "style", "ac:parameter", "ri:attachment", "ac:image"})
+_CODE_MACROS = frozenset({"code", "noformat"})
+
+
+class _StorageMarkdownParser(HTMLParser):
+    """
+    Streaming parser that writes compact Markdown while the storage body is fed.
+    Whitespace is normalised per data chunk, so the output is never re-scanned.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._pending_newlines = 0
+        self._last_char = "\n"
+        self._skip_depth = 0
+        self._list_stack: list[list] = []  # [ordered, counter]
+        self._cell_depth = 0
+        self._row_cells = 0
+        self._row_has_header = False
+        self._header_separator_written = False
+        self._pre_depth = 0
+        self._code_macro_depth = 0
+        self._macro_stack: list[Optional[str]] = []
+        self._capture_language = False
+        self._code_language = ""
+
+    # --- Emission helpers ---
+
+    def _break(self, newlines: int) -> None:
+        if self._cell_depth:
+            self._write_inline(" ")
+            return
+        self._pending_newlines = max(self._pending_newlines, newlines)
+
+    def _write(self, text: str) -> None:
+        if not text:
+            return
+        if self._pending_newlines and self.parts:
+            self.parts.append("\n" * self._pending_newlines)
+            self._last_char = "\n"
+        self._pending_newlines = 0
+        self.parts.append(text)
+        self._last_char = text[-1]
+
+    def _write_inline(self, text: str) -> None:
+        if text == " " and self._last_char in " \n":
+            return
+        self._write(text)
+
+    # --- HTMLParser callbacks ---
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "ac:structured-macro":
+            macro_name = dict(attrs).get("ac:name", "")
+            self._macro_stack.append(macro_name)
+            if macro_name in _CODE_MACROS:
+                self._code_macro_depth += 1
+                self._code_language = ""
+            return
+
+        if tag == "ac:parameter" and self._code_macro_depth and dict(attrs).get("ac:name") == "language":
+            self._capture_language = True
+            return
+
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+            return
+
+        if tag in _HEADING_LEVELS:
+            self._break(2)
+            self._write("#" * _HEADING_LEVELS[tag] + " ")
+        elif tag in _BLOCK_TAGS:
+            self._break(2)
+        elif tag == "br":
+            self._break(1)
+        elif tag == "hr":
+            self.handle_startendtag(tag, attrs)
+        elif tag in ("ul", "ol"):
+            self._break(1 if self._list_stack else 2)
+            self._list_stack.append([tag == "ol", 0])
+        elif tag == "li":
+            self._break(1)
+            indent = "  " * (len(self._list_stack) - 1)
+            if self._list_stack and self._list_stack[-1][0]:
+                self._list_stack[-1][1] += 1
+                self._write(f"{indent}{self._list_stack[-1][1]}. ")
+            else:
+                self._write(f"{indent}- ")
+        elif tag == "table":
+            self._break(2)
+            self._header_separator_written = False
+        elif tag == "tr":
+            self._break(1)
+            self._write("|")
+            self._row_cells = 0
+            self._row_has_header = False
+        elif tag in ("td", "th"):
+            self._cell_depth += 1
+            self._row_cells += 1
+            self._row_has_header = self._row_has_header or tag == "th"
+            self._write(" ")
+        elif tag == "pre":
+            self._break(2)
+            self._write("```\n")
+            self._pre_depth += 1
+        elif tag == "code" and not self._pre_depth:
+            self._write("`")
+        elif tag in ("strong", "b"):
+            self._write("**")
+        elif tag in ("em", "i"):
+            self._write("_")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br":
+            self._break(1)
+        elif tag == "hr":
+            self._break(2)
+            self._write("---")
+            self._break(2)
+
+    def handle_endtag(self, tag):
+        if tag == "ac:structured-macro":
+            macro_name = self._macro_stack.pop() if self._macro_stack else None
+            if macro_name in _CODE_MACROS:
+                self._code_macro_depth -= 1
+            return
+
+        if tag == "ac:parameter" and self._capture_language:
+            self._capture_language = False
+            return
+
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+
+        if tag in _HEADING_LEVELS or tag in _BLOCK_TAGS or tag == "table":
+            self._break(2)
+        elif tag in ("ul", "ol"):
+            if self._list_stack:
+                self._list_stack.pop()
+            self._break(1 if self._list_stack else 2)
+        elif tag in ("td", "th"):
+            self._cell_depth = max(0, self._cell_depth - 1)
+            self._write_inline(" ")
+            self._write("|")
+        elif tag == "tr":
+            if self._row_has_header and not self._header_separator_written:
+                self._break(1)
+                self._write("|" + " --- |" * self._row_cells)
+                self._header_separator_written = True
+            self._break(1)
+        elif tag == "pre":
+            self._pre_depth = max(0, self._pre_depth - 1)
+            self._write("\n```" if self._last_char != "\n" else "```")
+            self._break(2)
+        elif tag == "code" and not self._pre_depth:
+            self._write("`")
+        elif tag in ("strong", "b"):
+            self._write("**")
+        elif tag in ("em", "i"):
+            self._write("_")
+
+    def handle_data(self, data):
+        if self._capture_language:
+            self._code_language += data.strip()
+            return
+        if self._skip_depth:
+            return
+        if self._pre_depth:
+            self._write(data)
+            return
+
+        text = _WHITESPACE_PATTERN.sub(" ", data)
+        if self._last_char in " \n" or self._pending_newlines:
+            text = text.lstrip()
+        self._write(text)
+
+    def unknown_decl(self, data):
+        # CDATA sections carry the body of code macros (<ac:plain-text-body>)
+        if not data.startswith("CDATA["):
+            return
+        body = data[len("CDATA["):]
+        if self._code_macro_depth:
+            self._break(2)
+            self._write(f"```{self._code_language}\n{body.strip(chr(10))}\n```")
+            self._break(2)
+        elif not self._skip_depth:
+            self.handle_data(body)
+
+    def get_markdown(self) -> str:
+        return "".join(self.parts).strip()
+
+
+class ConfluenceStorageMapper:
+    """
+    Converts Confluence storage format (XHTML + ac: macros) into compact Markdown in a single pass.
+    Keeps headings, lists, tables and code macros so the LLM sees the document structure.
+    """
+
+    @staticmethod
+    def to_markdown(storage_html: str) -> str:
+        if not storage_html:
+            return ""
+        parser = _StorageMarkdownParser()
+        parser.feed(storage_html)
+        parser.close()
+        return parser.get_markdown()
@@ -1,21 +1,62 @@
+from typing import Optional
+
 from software_factory_poc.application.core.agents.research.config.research_provider_type import ResearchProviderType
 from software_factory_poc.application.core.agents.research.ports.research_gateway import ResearchGateway
 # from software_factory_poc.infrastructure.providers.research.filesystem_provider_impl import FileSystemProviderImpl # If we move it
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.shared_store.shared_store import SharedStore
+from software_factory_poc.infrastructure.common.shared_store.shared_store_factory import SharedStoreFactory
 from software_factory_poc.infrastructure.configuration.app_config import AppConfig
+from software_factory_poc.infrastructure.providers.research.cached_research_gateway import CachedResearchGateway
 from software_factory_poc.infrastructure.providers.research.confluence_provider_impl import ConfluenceProviderImpl
+from software_factory_poc.infrastructure.providers.research.confluence_space_prewarmer import ConfluenceSpacePrewarmer
 
 
 class ResearchProviderFactory:
     """
     Factory to build Research Providers based on configuration.
+    Every provider is wrapped with the process-wide research cache unless disabled.
     """
     @staticmethod
     def build_research_gateway(config: AppConfig, provider_type: ResearchProviderType) -> ResearchGateway:
         if provider_type == ResearchProviderType.CONFLUENCE:
-            return ConfluenceProviderImpl(config.confluence)
+            gateway: ResearchGateway = ConfluenceProviderImpl(config.confluence)
             
         # elif provider_type == ResearchProviderType.FILE_SYSTEM:
         #     return FileSystemProviderImpl(...)
             
         else:
              raise ValueError(f"Unsupported Research Provider: {provider_type}")
+
+        if not config.research_cache.enabled:
+            return gateway
+
+        return CachedResearchGateway(
+            inner=gateway,
+            cache=ResearchCache.shared(config.research_cache, ResearchProviderFactory._shared_tier(config)),
+            namespace=provider_type.value
+        )
+
+    @staticmethod
+    def _shared_tier(config: AppConfig) -> Optional[SharedStore]:
+        if not config.research_cache.shared_tier_enabled:
+            return None
+        return SharedStoreFactory.shared(config.shared_store)
+
+    @staticmethod
+    def build_prewarmer(config: AppConfig) -> Optional[ConfluenceSpacePrewarmer]:
+        """
+        Builds the background Confluence pre-warmer, or None when the cache or pre-warming is disabled.
+        """
+        cache_settings = config.research_cache
+        if not cache_settings.enabled or not cache_settings.prewarm_enabled:
+            return None
+
+        shared_tier = ResearchProviderFactory._shared_tier(config)
+        return ConfluenceSpacePrewarmer(
+            provider=ConfluenceProviderImpl(config.confluence),
+            cache=ResearchCache.shared(cache_settings, shared_tier),
+            settings=cache_settings,
+            architecture_page_id=config.confluence.architecture_doc_page_id,
+            leader_store=shared_tier
+        )
@@ -1,5 +1,6 @@
 import base64
-from typing import Any
+import threading
+from typing import Any, Optional
 
 import httpx
 
@@ -7,16 +8,56 @@ from software_factory_poc.infrastructure.configuration.jira_settings import Jira
 from software_factory_poc.infrastructure.observability.logger_factory_service import (
     LoggerFactoryService,
 )
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_rate_limit_metrics import (
+    JiraRateLimitMetrics,
+)
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_rate_limiter import JiraRateLimiter
 
 logger = LoggerFactoryService.build_logger(__name__)
 
 
 class JiraHttpClient:
-    def __init__(self, settings: JiraSettings):
+    """
+    Thin Jira REST client. Calls share one pooled httpx.Client, so consecutive requests
+    (and concurrent runs) reuse keep-alive connections instead of a new TLS handshake each.
+    Every call goes through the process-wide rate limiter; a throttled response is re-sent
+    after the wait Jira asked for, up to `max_throttle_retries` times and as long as that
+    wait does not exceed `max_retry_after_seconds`.
+    """
+
+    def __init__(
+        self,
+        settings: JiraSettings,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        rate_limiter: Optional[JiraRateLimiter] = None,
+        max_throttle_retries: int = 3,
+        max_retry_after_seconds: float = 60.0,
+    ):
         self.settings = settings
         self.base_url = settings.base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or JiraRateLimiter()
+        self.max_throttle_retries = max_throttle_retries
+        self.max_retry_after_seconds = max_retry_after_seconds
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
         # self._validate_config() # Pydantic validation happens on instantiation
 
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=self.max_connections,
+                            max_keepalive_connections=self.max_connections
+                        )
+                    )
+        return self._client
+
     def _get_headers(self) -> dict[str, str]:
         headers = {
             "Accept": "application/json",
@@ -46,16 +87,33 @@ class JiraHttpClient:
         return headers
 
     def get(self, path: str) -> httpx.Response:
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        with httpx.Client() as client:
-            return client.get(url, headers=self._get_headers(), timeout=10.0)
+        return self._send("GET", path)
 
     def post(self, path: str, json_data: dict[str, Any]) -> httpx.Response:
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        with httpx.Client() as client:
-            return client.post(url, headers=self._get_headers(), json=json_data, timeout=10.0)
+        return self._send("POST", path, json_data)
 
     def put(self, path: str, json_data: dict[str, Any]) -> httpx.Response:
+        return self._send("PUT", path, json_data)
+
+    def rate_limit_metrics(self) -> JiraRateLimitMetrics:
+        return self.rate_limiter.metrics()
+
+    def _send(self, method: str, path: str, json_data: Optional[dict[str, Any]] = None) -> httpx.Response:
         url = f"{self.base_url}/{path.lstrip('/')}"
-        with httpx.Client() as client:
-            return client.put(url, headers=self._get_headers(), json=json_data, timeout=10.0)
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            response = self._http().request(method, url, headers=self._get_headers(), json=json_data)
+            delay = self.rate_limiter.observe(response)
+            if delay is None or attempt >= self.max_throttle_retries or delay > self.max_retry_after_seconds:
+                return response
+            # The limiter pauses every caller until the Retry-After deadline; acquire() waits for it
+            attempt += 1
+            self.rate_limiter.record_retry()
+            logger.info(f"Re-sending throttled Jira {method} {path} (retry {attempt}/{self.max_throttle_retries})")
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class JiraRateLimitMetrics:
+    """
+    Point-in-time snapshot of the Jira rate limiter: requests sent, responses throttled by
+    Jira (429), requests re-sent after a throttle, time spent waiting for the bucket, the
+    current adaptive rate and the last `X-RateLimit-Remaining` Jira reported.
+    """
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    waited_seconds: float = 0.0
+    rate_per_second: float = 0.0
+    remaining: Optional[int] = None
+
+    @property
+    def throttle_ratio(self) -> float:
+        if not self.requests:
+            return 0.0
+        return self.throttled / self.requests
@@ -0,0 +1,141 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+import httpx
+
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_rate_limit_metrics import (
+    JiraRateLimitMetrics,
+)
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+# Wait applied to a 429 that carries neither Retry-After nor X-RateLimit-Reset
+DEFAULT_RETRY_AFTER_SECONDS = 5.0
+
+
+class JiraRateLimiter:
+    """
+    Token bucket shared by every Jira call of the process, adapted to what Jira reports:
+    - a throttled response (429, or 503 with Retry-After) pauses all calls until the time
+      Jira asked for and halves the rate (down to `min_rate_per_second`);
+    - `X-RateLimit-NearLimit: true` lowers the rate by a quarter;
+    - any other response raises it back by 5% of `rate_per_second`.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = 10.0,
+        burst: int = 20,
+        min_rate_per_second: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = rate_per_second
+        self.min_rate = min(min_rate_per_second, rate_per_second)
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._rate = rate_per_second
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._requests = 0
+        self._throttled = 0
+        self._retries = 0
+        self._waited = 0.0
+        self._remaining: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                delay = self._paused_until - now
+                if delay <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    self._requests += 1
+                    self._waited += waited
+                    return waited
+                if delay <= 0:
+                    delay = (1 - self._tokens) / self._rate
+            self._sleep(delay)
+            waited += delay
+
+    def observe(self, response: httpx.Response) -> Optional[float]:
+        """Reads the rate-limit headers. Returns the wait before re-sending a throttled response, else None."""
+        headers = response.headers
+        throttled = response.status_code == 429 or (response.status_code == 503 and "Retry-After" in headers)
+        with self._lock:
+            remaining = self._int(headers.get("X-RateLimit-Remaining"))
+            if remaining is not None:
+                self._remaining = remaining
+            if throttled:
+                delay = self.retry_after(headers)
+                if delay is None:
+                    delay = DEFAULT_RETRY_AFTER_SECONDS
+                self._paused_until = max(self._paused_until, self._clock() + delay)
+                self._rate = max(self.min_rate, self._rate / 2)
+                self._throttled += 1
+            elif headers.get("X-RateLimit-NearLimit", "").lower() == "true":
+                self._rate = max(self.min_rate, self._rate * 0.75)
+            else:
+                self._rate = min(self.max_rate, self._rate + self.max_rate * 0.05)
+            rate = self._rate
+        if throttled:
+            logger.warning(f"Jira throttled a request ({response.status_code}); pausing {delay:.1f}s at {rate:.2f} req/s")
+            return delay
+        return None
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._retries += 1
+
+    def metrics(self) -> JiraRateLimitMetrics:
+        with self._lock:
+            return JiraRateLimitMetrics(
+                requests=self._requests,
+                throttled=self._throttled,
+                retries=self._retries,
+                waited_seconds=self._waited,
+                rate_per_second=self._rate,
+                remaining=self._remaining,
+            )
+
+    @staticmethod
+    def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds to wait from Retry-After (delta or HTTP date), else from X-RateLimit-Reset (ISO 8601)."""
+        value = headers.get("Retry-After")
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+                except (TypeError, ValueError):
+                    pass
+        reset = headers.get("X-RateLimit-Reset")
+        if reset:
+            try:
+                at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+                return max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
+            except ValueError:
+                pass
+        return None
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    @staticmethod
+    def _int(value: Optional[str]) -> Optional[int]:
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+# Issues read by the agent run bound to the current context (None outside a run)
+_RUN_ISSUES: ContextVar[Optional[OrderedDict[str, tuple[float, dict[str, Any]]]]] = ContextVar(
+    "_RUN_ISSUES", default=None
+)
+
+
+class JiraIssueCache:
+    """
+    Short-lived copy of the issues the current agent run read, so the several reads a run makes
+    of the same issue cost one request. Entries live in the scope the job worker binds around
+    each run (`run_scope`): nothing is shared between runs, so an edit made in Jira is seen by
+    the next run, and outside a run every read goes to Jira. Writes made by the run are merged
+    into its copy instead of evicting it. Entries expire after `ttl_seconds` (0 disables the
+    cache) and the least recently used are dropped past `max_issues`. Cached issues are shared
+    within the run: callers must not mutate them.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_issues: int = 500, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_issues = max_issues
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    @contextmanager
+    def run_scope() -> Iterator[None]:
+        """Binds an empty issue cache to the current context for the duration of one run."""
+        token = _RUN_ISSUES.set(OrderedDict())
+        try:
+            yield
+        finally:
+            _RUN_ISSUES.reset(token)
+
+    def get(self, issue_key: str) -> Optional[dict[str, Any]]:
+        issues = _RUN_ISSUES.get()
+        if issues is None:
+            return None
+        with self._lock:
+            entry = issues.get(issue_key)
+            if entry is None:
+                return None
+            stored_at, issue = entry
+            if self._clock() - stored_at >= self.ttl_seconds:
+                del issues[issue_key]
+                return None
+            issues.move_to_end(issue_key)
+            return issue
+
+    def put(self, issue: dict[str, Any]) -> None:
+        issues = _RUN_ISSUES.get()
+        issue_key = issue.get("key")
+        if issues is None or not issue_key or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            issues[issue_key] = (self._clock(), issue)
+            issues.move_to_end(issue_key)
+            while len(issues) > self.max_issues:
+                issues.popitem(last=False)
+
+    def written(self, issue_key: str, fields: dict[str, Any]) -> None:
+        """Merges fields the run just wrote into its cached copy; the expiry is left as is."""
+        issues = _RUN_ISSUES.get()
+        if issues is None:
+            return
+        with self._lock:
+            entry = issues.get(issue_key)
+            if entry is not None:
+                stored_at, issue = entry
+                merged = {**issue, "fields": {**issue.get("fields", {}), **fields}}
+                issues[issue_key] = (stored_at, merged)
+
+    def invalidate(self, issue_key: str) -> None:
+        issues = _RUN_ISSUES.get()
+        if issues is None:
+            return
+        with self._lock:
+            issues.pop(issue_key, None)
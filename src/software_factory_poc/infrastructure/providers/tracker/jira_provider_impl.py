@@ -1,8 +1,11 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
+
 import yaml
-import re
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt
 
 from software_factory_poc.application.core.agents.common.config.task_status import TaskStatus
 from software_factory_poc.application.core.agents.common.exceptions.provider_error import (
@@ -11,6 +14,7 @@ from software_factory_poc.application.core.agents.common.exceptions.provider_err
 from software_factory_poc.application.core.agents.reporter.config.task_tracker_type import (
     TaskTrackerType,
 )
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_item_result_dto import TrackerItemResultDTO
 from software_factory_poc.application.core.agents.reporter.ports.task_tracker_gateway import TaskTrackerGateway
 from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
 from software_factory_poc.infrastructure.configuration.jira_settings import JiraSettings
@@ -19,6 +23,12 @@ from software_factory_poc.infrastructure.providers.tracker.clients.jira_http_cli
     JiraHttpClient,
 )
 from software_factory_poc.infrastructure.providers.tracker.dtos.jira_status_enum import JiraStatus
+from software_factory_poc.infrastructure.providers.tracker.jira_issue_cache import JiraIssueCache
+from software_factory_poc.infrastructure.providers.tracker.jira_retry_policy import JiraRetryPolicy
+from software_factory_poc.infrastructure.providers.tracker.jira_transition_cache import JiraTransitionCache
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_description_patcher import (
+    JiraAdfDescriptionPatcher,
+)
 from software_factory_poc.infrastructure.providers.tracker.mappers.jira_description_mapper import JiraDescriptionMapper
 
 logger = LoggerFactoryService.build_logger(__name__)
@@ -31,51 +41,165 @@ STATUS_MAPPING = {
     TaskStatus.DONE: JiraStatus.DONE,
 }
 
+# Issues per page of the JQL search API
+SEARCH_PAGE_SIZE = 100
+# Fields needed to build a Task; issue reads and bulk searches only return these
+TASK_FIELDS = ["summary", "status", "project", "issuetype", "description"]
+# Expansions requested on issue reads. None by default: renderedFields, changelog, transitions...
+# are only asked for by the calls that need them
+ISSUE_EXPAND: tuple[str, ...] = ()
+# Fallback cleaning of config blocks left in the human text when the description is rebuilt
+JIRA_CODE_MACRO_PATTERN = re.compile(r"\{code(?:[:|][^\}]*)?\}.*?\{code\}", re.DOTALL | re.IGNORECASE)
+MARKDOWN_FENCE_PATTERN = re.compile(r"```.*?```", re.DOTALL)
+
 
 class JiraProviderImpl(TaskTrackerGateway):
-    def __init__(self, http_client: JiraHttpClient, settings: JiraSettings):
+    def __init__(
+        self,
+        http_client: JiraHttpClient,
+        settings: JiraSettings,
+        transition_cache: Optional[JiraTransitionCache] = None,
+        issue_cache: Optional[JiraIssueCache] = None,
+        bulk_concurrency: int = 8,
+    ):
         self.client = http_client
         self.settings = settings
         self._logger = logger
         self.mapper = JiraDescriptionMapper()
+        self.transitions = transition_cache or JiraTransitionCache()
+        self.issues = issue_cache or JiraIssueCache()
+        self.bulk_concurrency = bulk_concurrency
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
     def get_task(self, issue_key: str) -> Task:
         """Retrieves a Domain Task entity."""
         self._logger.info(f"Fetching Task Entity: {issue_key}")
         try:
-            json_data = self.get_issue(issue_key)
-            fields = json_data.get("fields", {})
-
-            # Map Description using ADF Mapper
-            adf_desc = fields.get("description")
-            domain_desc = self.mapper.to_domain(adf_desc)
-
-            return Task(
-                id=json_data.get("id", "0"),
-                key=json_data.get("key"),
-                project_key=fields.get("project", {}).get("key", "UNKNOWN"),
-                issue_type=fields.get("issuetype", {}).get("name", "Task"),
-                summary=fields.get("summary", ""),
-                status=fields.get("status", {}).get("name", "Unknown"),
-                description=domain_desc
-            )
+            return self._to_task(self.get_issue(issue_key))
         except Exception as e:
             self._handle_error(e, f"get_task({issue_key})")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    def _to_task(self, json_data: dict[str, Any]) -> Task:
+        fields = json_data.get("fields", {})
+
+        # Map Description using ADF Mapper
+        adf_desc = fields.get("description")
+        domain_desc = self.mapper.to_domain(adf_desc)
+        self._remember_state(json_data.get("key"), fields)
+
+        return Task(
+            id=json_data.get("id", "0"),
+            key=json_data.get("key"),
+            project_key=fields.get("project", {}).get("key", "UNKNOWN"),
+            issue_type=fields.get("issuetype", {}).get("name", "Task"),
+            summary=fields.get("summary", ""),
+            status=fields.get("status", {}).get("name", "Unknown"),
+            description=domain_desc
+        )
+
+    def get_tasks(self, issue_keys: list[str]) -> list[Task]:
+        """
+        Retrieves many tasks with one JQL search per 100 keys instead of one request per issue.
+        Keys that do not exist are left out.
+        """
+        self._logger.info(f"Fetching {len(issue_keys)} Task Entities in bulk")
+        tasks = []
+        try:
+            for start in range(0, len(issue_keys), SEARCH_PAGE_SIZE):
+                chunk = issue_keys[start:start + SEARCH_PAGE_SIZE]
+                try:
+                    issues = self._search(f"key in ({', '.join(chunk)})", TASK_FIELDS, len(chunk))
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code != 400:
+                        raise
+                    # Jira rejects the whole JQL when one of the keys does not exist
+                    issues = self._get_existing_issues(chunk)
+                for issue in issues:
+                    self.issues.put(issue)
+                    tasks.append(self._to_task(issue))
+        except Exception as e:
+            self._handle_error(e, f"get_tasks({len(issue_keys)} keys)")
+            raise
+        return tasks
+
+    def _get_existing_issues(self, issue_keys: list[str]) -> list[dict[str, Any]]:
+        issues = []
+        for issue_key in issue_keys:
+            response = self.client.get(self._issue_path(issue_key, TASK_FIELDS))
+            if response.status_code == 404:
+                self._logger.warning(f"Jira issue {issue_key} not found")
+                continue
+            response.raise_for_status()
+            issues.append(response.json())
+        return issues
+
+    def search_task_ids(self, query: str, limit: int = 100) -> list[str]:
+        """Returns the keys of the issues matching the JQL query (at most `limit`)."""
+        self._logger.info(f"Searching Jira issues: {query}")
+        try:
+            return [issue["key"] for issue in self._search(query, ["summary"], limit)]
+        except Exception as e:
+            self._handle_error(e, f"search_task_ids({query})")
+            raise
+
+    def search_task_versions(self, query: str, limit: int = 100, page_size: int = SEARCH_PAGE_SIZE) -> dict[str, str]:
+        """Returns {issue key: `updated` timestamp} for the issues matching the JQL query; no other field is read."""
+        self._logger.debug(f"Polling Jira issues: {query}")
+        try:
+            issues = self._search(query, ["updated"], limit, page_size)
+        except Exception as e:
+            self._handle_error(e, f"search_task_versions({query})")
+            raise
+        return {issue["key"]: issue.get("fields", {}).get("updated", "") for issue in issues}
+
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
+    def _search(
+        self, jql: str, fields: list[str], limit: int, page_size: int = SEARCH_PAGE_SIZE
+    ) -> list[dict[str, Any]]:
+        """Pages through the enhanced JQL search API (nextPageToken) until `limit` issues."""
+        issues: list[dict[str, Any]] = []
+        next_page_token: Optional[str] = None
+        while len(issues) < limit:
+            payload: dict[str, Any] = {
+                "jql": jql,
+                "fields": fields,
+                "maxResults": min(page_size, SEARCH_PAGE_SIZE, limit - len(issues)),
+            }
+            if next_page_token:
+                payload["nextPageToken"] = next_page_token
+            response = self.client.post("rest/api/3/search/jql", payload)
+            response.raise_for_status()
+            data = response.json()
+            issues.extend(data.get("issues", []))
+            next_page_token = data.get("nextPageToken")
+            if data.get("isLast", False) or not next_page_token:
+                break
+        return issues[:limit]
+
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
     def get_issue(self, issue_key: str) -> dict[str, Any]:
+        """Issue JSON limited to TASK_FIELDS, served from the issue cache while it is fresh."""
+        cached = self.issues.get(issue_key)
+        if cached is not None:
+            self._logger.debug(f"Jira issue {issue_key} served from cache")
+            return cached
         self._logger.info(f"Fetching Jira issue JSON: {issue_key}")
         try:
-            response = self.client.get(f"rest/api/3/issue/{issue_key}")
+            response = self.client.get(self._issue_path(issue_key, TASK_FIELDS))
             response.raise_for_status()
-            return response.json()
+            issue = response.json()
+            self.issues.put(issue)
+            return issue
         except Exception as e:
             self._handle_error(e, f"get_issue({issue_key})")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
     def add_comment(self, issue_key: str, body: Any) -> dict[str, Any]:
         self._logger.info(f"Adding comment to Jira issue: {issue_key}")
         try:
@@ -91,56 +215,118 @@ class JiraProviderImpl(TaskTrackerGateway):
             self._handle_error(e, f"add_comment({issue_key})")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
     def transition_issue(self, issue_key: str, transition_id: str) -> None:
         self._logger.info(f"Transitioning issue: {issue_key} to state matching: {transition_id}")
         try:
-            final_id = self._resolve_transition_id(issue_key, transition_id)
-
-            self._logger.info(f"Transitioning issue {issue_key} to (ID: {final_id})")
-            payload = {
-                "transition": {
-                    "id": final_id
-                }
-            }
-            resp = self.client.post(f"rest/api/3/issue/{issue_key}/transitions", payload)
+            transition, cached = self._resolve_transition(issue_key, transition_id)
+            resp = self._post_transition(issue_key, transition)
+            if cached and resp.status_code in (400, 404, 409):
+                # The issue moved since its state was cached (or the workflow changed): ask Jira again
+                self._logger.info(f"Cached transition rejected for {issue_key}; refreshing transitions")
+                self.transitions.invalidate(issue_key)
+                transition, _ = self._resolve_transition(issue_key, transition_id, refresh=True)
+                resp = self._post_transition(issue_key, transition)
             resp.raise_for_status()
+            to_status = transition.get("to", {}).get("name")
+            if to_status:
+                self.transitions.moved(issue_key, to_status)
+                self.issues.written(issue_key, {"status": {"name": to_status}})
+            else:
+                self.issues.invalidate(issue_key)
         except Exception as e:
             self._handle_error(e, f"transition_issue({issue_key}, {transition_id})")
             raise
 
+    def _post_transition(self, issue_key: str, transition: dict[str, Any]) -> httpx.Response:
+        self._logger.info(f"Transitioning issue {issue_key} to (ID: {transition['id']})")
+        payload = {
+            "transition": {
+                "id": transition["id"]
+            }
+        }
+        return self.client.post(f"rest/api/3/issue/{issue_key}/transitions", payload)
+
     def _resolve_transition_id(self, issue_key: str, target_keyword: str) -> str:
         """Resolves transition ID from keyword using Exact, then Partial matching."""
-        response = self.client.get(f"rest/api/3/issue/{issue_key}/transitions")
+        transition, _ = self._resolve_transition(issue_key, target_keyword)
+        return transition["id"]
+
+    def _resolve_transition(
+        self, issue_key: str, target_keyword: str, refresh: bool = False
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Returns the matching transition and whether it came from the cache.
+        Transitions are cached per (project, issue type, status); on a miss, one GET returns
+        both the issue state and its transitions.
+        """
+        transitions = None if refresh else self.transitions.transitions_for(issue_key)
+        if transitions is not None:
+            match = self._match_transition(transitions, target_keyword)
+            if match is not None:
+                return match, True
+
+        transitions = self._fetch_transitions(issue_key)
+        match = self._match_transition(transitions, target_keyword)
+        if match is not None:
+            return match, False
+
+        # 3. Not Found
+        available_names = [t["name"] for t in transitions]
+        error_msg = f"Transition '{target_keyword}' not found. Available: {available_names}"
+        self._logger.error(error_msg)
+        raise ProviderError(
+            provider=TaskTrackerType.JIRA,
+            message=error_msg,
+            retryable=False
+        )
+
+    def _fetch_transitions(self, issue_key: str) -> list[dict[str, Any]]:
+        response = self.client.get(
+            self._issue_path(issue_key, ["project", "issuetype", "status"], expand=("transitions",))
+        )
         try:
             response.raise_for_status()
         except Exception as e:
             self._logger.error(f"Failed to fetch transitions for {issue_key}: {e}")
             raise e
 
-        transitions = response.json().get("transitions", [])
-        available_names = [t["name"] for t in transitions]
+        data = response.json()
+        transitions = data.get("transitions", [])
+        state = self._state_of(data.get("fields", {}))
+        if state is not None:
+            self.transitions.put(issue_key, *state, transitions)
+        return transitions
 
+    @staticmethod
+    def _match_transition(transitions: list[dict[str, Any]], target_keyword: str) -> Optional[dict[str, Any]]:
         keyword_lower = target_keyword.lower()
 
         # 2a. Exact Match
         for t in transitions:
             if t["name"].lower() == keyword_lower:
-                return t["id"]
+                return t
 
         # 2b. Partial Match
         for t in transitions:
             if keyword_lower in t["name"].lower() or keyword_lower in t["to"]["name"].lower():
-                return t["id"]
-
-        # 3. Not Found
-        error_msg = f"Transition '{target_keyword}' not found. Available: {available_names}"
-        self._logger.error(error_msg)
-        raise ProviderError(
-            provider=TaskTrackerType.JIRA,
-            message=error_msg,
-            retryable=False
-        )
+                return t
+        return None
+
+    def _remember_state(self, issue_key: Optional[str], fields: dict[str, Any]) -> None:
+        state = self._state_of(fields)
+        if issue_key and state is not None:
+            self.transitions.remember(issue_key, *state)
+
+    @staticmethod
+    def _state_of(fields: dict[str, Any]) -> Optional[tuple[str, str, str]]:
+        project = (fields.get("project") or {}).get("key")
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        status = (fields.get("status") or {}).get("name")
+        if not (project and issue_type and status):
+            return None
+        return project, issue_type, status
 
     def transition_status(self, task_id: str, status: TaskStatus) -> None:
         """Adapts TaskTrackerGatewayPort.transition_status to internal transition_issue logic."""
@@ -158,6 +344,48 @@ class JiraProviderImpl(TaskTrackerGateway):
             self._logger.warning(f"No explicit mapping for TaskStatus '{status}'. Using value directly.")
             self.transition_issue(task_id, status.value)
 
+    def add_comments(self, comments: dict[str, Any]) -> list[TrackerItemResultDTO]:
+        """Posts the comments with up to `bulk_concurrency` requests in flight; one result per issue."""
+        self._logger.info(f"Adding comments to {len(comments)} Jira issue(s)")
+        return self._run_bulk(list(comments.items()), self.add_comment)
+
+    def transition_statuses(self, statuses: dict[str, TaskStatus]) -> list[TrackerItemResultDTO]:
+        """
+        Transitions many issues concurrently. The workflow states of the issues not known yet
+        are read with one search, and the transitions of each distinct state are fetched once,
+        so every issue is then moved with a single POST.
+        """
+        self._logger.info(f"Transitioning {len(statuses)} Jira issue(s)")
+        self._prime_transitions(list(statuses))
+        return self._run_bulk(list(statuses.items()), self.transition_status)
+
+    def _prime_transitions(self, issue_keys: list[str]) -> None:
+        unknown = [key for key in issue_keys if self.transitions.transitions_for(key) is None]
+        if not unknown:
+            return
+        representatives: dict[tuple[str, str, str], str] = {}
+        try:
+            for start in range(0, len(unknown), SEARCH_PAGE_SIZE):
+                chunk = unknown[start:start + SEARCH_PAGE_SIZE]
+                for issue in self._search(f"key in ({', '.join(chunk)})", ["project", "issuetype", "status"], len(chunk)):
+                    state = self._state_of(issue.get("fields", {}))
+                    if state is not None:
+                        self.transitions.remember(issue["key"], *state)
+                        representatives.setdefault(state, issue["key"])
+            for issue_key in representatives.values():
+                if self.transitions.transitions_for(issue_key) is None:
+                    self._fetch_transitions(issue_key)
+        except Exception as e:
+            # Priming only saves requests: each issue still resolves its transitions on its own
+            self._logger.warning(f"Transition priming skipped: {e}")
+
+    def _run_bulk(self, items: list[tuple[str, Any]], operation) -> list[TrackerItemResultDTO]:
+        if not items:
+            return []
+        workers = max(1, min(self.bulk_concurrency, len(items)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-bulk") as executor:
+            return list(executor.map(lambda item: self._bulk_item(item[0], operation, *item), items))
+
     def _handle_error(self, error: Exception, context: str) -> None:
         """Centralized error handling and logging."""
         self._logger.error(f"Error in JiraProviderImpl [{context}]: {str(error)}", exc_info=True)
@@ -165,67 +393,73 @@ class JiraProviderImpl(TaskTrackerGateway):
         if isinstance(error, ProviderError):
             return
 
-        msg = str(error)
-        retryable = False
-        if "500" in msg or "502" in msg or "503" in msg or "504" in msg:
-            retryable = True
-        elif "Connection" in msg or "Timeout" in msg:
-            retryable = True
-
         raise ProviderError(
             provider=TaskTrackerType.JIRA,
             message=f"Jira operation failed: {error}",
-            retryable=retryable
+            retryable=JiraRetryPolicy.is_retryable(error),
+            status_code=JiraRetryPolicy.status_code(error),
         ) from error
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
     def update_task_description(self, task_id: str, description: TaskDescription) -> None:
         """
-        Updates the task description in Jira.
-        1. Cleans old code blocks from the raw text.
-        2. Uses Mapper to generate the structured ADF payload.
-        3. Sends the payload to Jira.
+        Updates the automation config of the task description in Jira.
+        When the stored ADF document is known, only its YAML codeBlock is replaced and the
+        rest of the document is sent back untouched; an unchanged block skips the write.
+        Without a stored document, the description is rebuilt from the domain text.
         """
         self._logger.info(f"Updating description for task: {task_id}")
-        
+
         try:
-            # 1. Defensive Cleaning: Remove any existing code blocks from the human text
-            # This prevents duplication if the mapper extraction wasn't perfect previously
-            clean_raw_content = description.raw_content
-            
-            # Regex to strip Jira {code}...{code} blocks
-            clean_raw_content = re.sub(r'\{code(?:[:|][^\}]*)?\}.*?\{code\}', '', clean_raw_content, flags=re.DOTALL | re.IGNORECASE)
-            # Regex to strip Markdown ```...``` blocks
-            clean_raw_content = re.sub(r'```.*?```', '', clean_raw_content, flags=re.DOTALL)
-            
-            clean_raw_content = clean_raw_content.strip()
-
-            # 2. Create a clean DTO
-            clean_description = TaskDescription(
-                raw_content=clean_raw_content,
-                config=description.config
-            )
-
-            # 3. Map to ADF (Atlassian Document Format)
-            # The mapper handles creating the "codeBlock" node.
-            adf_payload = self.mapper.to_adf(clean_description)
-            
-            self._logger.info("✅ Generated ADF payload with native codeBlock.")
-
-            # 4. Send Request
-            payload = {
-                "fields": {
-                    "description": adf_payload
-                }
-            }
-            response = self.client.put(f"rest/api/3/issue/{task_id}", payload)
+            document = self._stored_description(task_id) if description.config else None
+            if document is not None:
+                yaml_text = self.mapper.render_config(description.config)
+                adf_payload, changed = JiraAdfDescriptionPatcher.patch(document, yaml_text)
+                if not changed:
+                    self._logger.info(f"Description config of {task_id} unchanged; update skipped.")
+                    return
+            else:
+                adf_payload = self.mapper.to_adf(TaskDescription(
+                    raw_content=self._strip_code_blocks(description.raw_content),
+                    config=description.config,
+                ))
+
+            response = self.client.put(f"rest/api/3/issue/{task_id}", {"fields": {"description": adf_payload}})
             response.raise_for_status()
-            
+            self.issues.written(task_id, {"description": adf_payload})
+
         except Exception as e:
             self._handle_error(e, f"update_task_description({task_id})")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+    def _stored_description(self, task_id: str) -> Optional[dict[str, Any]]:
+        cached = self.issues.get(task_id)
+        if cached is not None:
+            document = cached.get("fields", {}).get("description")
+        else:
+            response = self.client.get(self._issue_path(task_id, ["description"]))
+            response.raise_for_status()
+            document = (response.json() or {}).get("fields", {}).get("description")
+        return document if self._is_adf_doc(document) else None
+
+    @staticmethod
+    def _issue_path(issue_key: str, fields: list[str], expand: tuple[str, ...] = ISSUE_EXPAND) -> str:
+        path = f"rest/api/3/issue/{issue_key}?fields={','.join(fields)}"
+        return f"{path}&expand={','.join(expand)}" if expand else path
+
+    @staticmethod
+    def _is_adf_doc(document: Any) -> bool:
+        return isinstance(document, dict) and document.get("type") == "doc"
+
+    @staticmethod
+    def _strip_code_blocks(raw_content: str) -> str:
+        # Defensive cleaning: a block the mapper did not extract must not be written twice
+        cleaned = JIRA_CODE_MACRO_PATTERN.sub("", raw_content or "")
+        return MARKDOWN_FENCE_PATTERN.sub("", cleaned).strip()
+
+    @retry(stop=stop_after_attempt(3), wait=JiraRetryPolicy.wait, retry=retry_if_exception(JiraRetryPolicy.is_retryable),
+           reraise=True)
     def append_issue_description(self, task_id: str, content: str) -> None:
         self._logger.info(f"Appending content to task: {task_id}")
         try:
@@ -244,8 +478,8 @@ class JiraProviderImpl(TaskTrackerGateway):
                     "content": [new_paragraph]
                 }
             elif current_desc.get("type") == "doc" and isinstance(current_desc.get("content"), list):
-                current_desc["content"].append(new_paragraph)
-                updated_desc = current_desc
+                # The issue may be the cached copy: build a new document instead of appending in place
+                updated_desc = {**current_desc, "content": [*current_desc["content"], new_paragraph]}
             else:
                 self._logger.warning(f"Unknown description format for {task_id}. Resetting to valid ADF.")
                 updated_desc = {
@@ -257,6 +491,7 @@ class JiraProviderImpl(TaskTrackerGateway):
             payload = {"fields": {"description": updated_desc}}
             response = self.client.put(f"rest/api/3/issue/{task_id}", payload)
             response.raise_for_status()
+            self.issues.written(task_id, {"description": updated_desc})
 
         except Exception as e:
             self._handle_error(e, f"append_issue_description({task_id})")
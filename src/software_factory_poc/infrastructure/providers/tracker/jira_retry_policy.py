@@ -0,0 +1,55 @@
+from typing import Optional
+
+import httpx
+from tenacity import RetryCallState
+
+from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_rate_limiter import JiraRateLimiter
+
+# Statuses worth another attempt: throttling and transient server-side failures
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Exponential wait between attempts when Jira does not say how long to wait
+MIN_WAIT_SECONDS = 2.0
+MAX_WAIT_SECONDS = 10.0
+# Longest Retry-After honored between provider-level attempts
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class JiraRetryPolicy:
+    """
+    Classifies Jira failures from the HTTP status and transport error type rather than the
+    message text, and paces provider-level retries: the `Retry-After` Jira sent wins over the
+    default exponential wait. Errors that will not improve on retry (4xx other than 429,
+    ProviderErrors marked non-retryable) are not retried.
+    """
+
+    @classmethod
+    def is_retryable(cls, error: BaseException) -> bool:
+        if isinstance(error, ProviderError):
+            return error.retryable
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, httpx.TransportError)
+
+    @classmethod
+    def status_code(cls, error: BaseException) -> Optional[int]:
+        response = cls._response(error)
+        return response.status_code if response is not None else None
+
+    @classmethod
+    def wait(cls, retry_state: RetryCallState) -> float:
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        response = cls._response(error) if error is not None else None
+        if response is not None:
+            retry_after = JiraRateLimiter.retry_after(response.headers)
+            if retry_after is not None:
+                return min(retry_after, MAX_RETRY_AFTER_SECONDS)
+        return min(MAX_WAIT_SECONDS, max(MIN_WAIT_SECONDS, 2 ** (retry_state.attempt_number - 1)))
+
+    @staticmethod
+    def _response(error: BaseException) -> Optional[httpx.Response]:
+        # Provider methods wrap the httpx error in a ProviderError: look at its cause too
+        for candidate in (error, error.__cause__):
+            if isinstance(candidate, httpx.HTTPStatusError):
+                return candidate.response
+        return None
@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+_State = tuple[str, str, str]
+
+
+class JiraTransitionCache:
+    """
+    Transition ids are stable per workflow state, so the transitions Jira offers are cached by
+    (project, issue type, status) for `ttl_seconds`. To use the cache without reading the issue
+    first, the last known state of the issues this process read or transitioned is kept too
+    (the most recent `max_issues`).
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_issues: int = 2000, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_issues = max_issues
+        self._clock = clock
+        self._tables: dict[_State, tuple[float, list[dict[str, Any]]]] = {}
+        self._issues: "OrderedDict[str, _State]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def transitions_for(self, issue_key: str) -> Optional[list[dict[str, Any]]]:
+        """Cached transitions for the issue's last known state, or None."""
+        with self._lock:
+            state = self._issues.get(issue_key)
+            if state is None:
+                return None
+            entry = self._tables.get(state)
+            if entry is None:
+                return None
+            stored_at, transitions = entry
+            if self._clock() - stored_at >= self.ttl_seconds:
+                del self._tables[state]
+                return None
+            return transitions
+
+    def remember(self, issue_key: str, project: str, issue_type: str, status: str) -> None:
+        with self._lock:
+            self._remember(issue_key, (project, issue_type, status))
+
+    def put(self, issue_key: str, project: str, issue_type: str, status: str, transitions: list[dict[str, Any]]) -> None:
+        state = (project, issue_type, status)
+        with self._lock:
+            self._remember(issue_key, state)
+            self._tables[state] = (self._clock(), transitions)
+
+    def moved(self, issue_key: str, status: str) -> None:
+        """Records the status an issue reached through a transition made by this process."""
+        with self._lock:
+            state = self._issues.get(issue_key)
+            if state is not None:
+                self._remember(issue_key, (state[0], state[1], status))
+
+    def invalidate(self, issue_key: str) -> None:
+        """Forgets the issue's state and the table it pointed to (e.g. after Jira rejected a cached id)."""
+        with self._lock:
+            state = self._issues.pop(issue_key, None)
+            if state is not None:
+                self._tables.pop(state, None)
+
+    def _remember(self, issue_key: str, state: _State) -> None:
+        self._issues[issue_key] = state
+        self._issues.move_to_end(issue_key)
+        while len(self._issues) > self.max_issues:
+            self._issues.popitem(last=False)
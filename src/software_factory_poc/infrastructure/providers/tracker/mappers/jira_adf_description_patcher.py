@@ -0,0 +1,64 @@
+import re
+from typing import Any, Optional
+
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_primitives import JiraAdfPrimitives
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_text_walker import (
+    CONFIG_LANGUAGES,
+    TEXT_BLOCKS,
+    JiraAdfTextWalker,
+)
+
+# A node whose own text opens a Markdown or Jira wiki fence (config pasted by hand)
+FENCE_START_PATTERN = re.compile(r"\s*(?:```|\{code(?:[:|][^\}]*)?\})", re.IGNORECASE)
+
+
+class JiraAdfDescriptionPatcher:
+    """
+    Replaces the automation config inside a stored ADF description without rebuilding it.
+    Only the node holding the YAML block is swapped (and the containers above it copied);
+    every other node is reused as is, so human formatting survives and no full-text regex
+    pass is needed.
+    """
+
+    @classmethod
+    def patch(cls, document: dict[str, Any], yaml_text: str) -> tuple[dict[str, Any], bool]:
+        """Returns the patched document and whether it differs from the stored one."""
+        block = JiraAdfPrimitives.create_code_block(yaml_text, language="yaml")
+        path = cls.find_config_node(document)
+        if path is None:
+            return {**document, "content": [*(document.get("content") or []), block]}, True
+        if cls._node_at(document, path) == block:
+            return document, False
+        return cls._replace(document, path, block), True
+
+    @classmethod
+    def find_config_node(cls, document: dict[str, Any]) -> Optional[list[int]]:
+        """
+        Path (child indexes) to the first YAML codeBlock, nested ones included, as the mapper
+        reads it; otherwise to the first top-level node that opens a fence.
+        """
+        stack: list[tuple[list[int], dict[str, Any]]] = [([], document)]
+        while stack:
+            path, node = stack.pop()
+            if node.get("type") == "codeBlock" and (node.get("attrs") or {}).get("language") in CONFIG_LANGUAGES:
+                return path
+            children = node.get("content") or []
+            if node.get("type") not in TEXT_BLOCKS:
+                stack.extend((path + [index], child) for index, child in reversed(list(enumerate(children))))
+        for index, node in enumerate(document.get("content") or []):
+            if node.get("type") in ("paragraph", "codeBlock") and FENCE_START_PATTERN.match(JiraAdfTextWalker.block_text(node)):
+                return [index]
+        return None
+
+    @staticmethod
+    def _node_at(node: dict[str, Any], path: list[int]) -> dict[str, Any]:
+        for index in path:
+            node = node["content"][index]
+        return node
+
+    @classmethod
+    def _replace(cls, node: dict[str, Any], path: list[int], block: dict[str, Any]) -> dict[str, Any]:
+        content = list(node["content"])
+        index = path[0]
+        content[index] = block if len(path) == 1 else cls._replace(content[index], path[1:], block)
+        return {**node, "content": content}
@@ -0,0 +1,53 @@
+from typing import Any, Iterator, Optional
+
+# Languages the automation config block is written with
+CONFIG_LANGUAGES = frozenset({"yaml", "yml", "scaffolding"})
+# Blocks whose children are inline nodes: each one yields a single piece of text
+TEXT_BLOCKS = frozenset({"paragraph", "heading", "codeBlock"})
+# Inline nodes that render their text from attrs instead of a `text` field
+INLINE_ATTR_TEXT = {"mention": "text", "emoji": "text", "status": "text", "inlineCard": "url", "date": "timestamp"}
+
+
+class JiraAdfTextWalker:
+    """
+    Single-pass, depth-first walk over an ADF document. Text blocks are yielded as they are
+    reached, including those nested in lists, tables, panels, quotes and expands, without
+    building intermediate copies of the tree.
+    """
+
+    @classmethod
+    def iter_blocks(cls, node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yields every text block (paragraph, heading, codeBlock) in document order."""
+        stack = [iter(node.get("content") or ())]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+            elif child.get("type") in TEXT_BLOCKS:
+                yield child
+            elif child.get("content"):
+                stack.append(iter(child["content"]))
+
+    @classmethod
+    def block_text(cls, block: dict[str, Any]) -> str:
+        inlines: list[dict[str, Any]] = block.get("content") or []
+        if len(inlines) == 1 and inlines[0].get("type") == "text":
+            return inlines[0].get("text", "")
+        return "".join([cls._inline_text(inline) for inline in inlines])
+
+    @staticmethod
+    def _inline_text(inline: dict[str, Any]) -> str:
+        inline_type = inline.get("type")
+        if inline_type == "text":
+            return inline.get("text", "")
+        if inline_type == "hardBreak":
+            return "\n"
+        if inline_type in INLINE_ATTR_TEXT:
+            return str((inline.get("attrs") or {}).get(INLINE_ATTR_TEXT[inline_type], ""))
+        return ""
+
+    @staticmethod
+    def language(block: dict[str, Any]) -> Optional[str]:
+        if block.get("type") != "codeBlock":
+            return None
+        return (block.get("attrs") or {}).get("language")
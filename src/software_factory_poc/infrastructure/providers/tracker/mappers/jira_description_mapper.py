@@ -5,9 +5,16 @@ from typing import Any, Dict, Optional
 from software_factory_poc.application.core.domain.entities.task import TaskDescription
 from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
 from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_primitives import JiraAdfPrimitives
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_text_walker import (
+    CONFIG_LANGUAGES,
+    JiraAdfTextWalker,
+)
 
 logger = LoggerFactoryService.build_logger(__name__)
 
+# libyaml emitter when available; the pure-Python one produces the same text, only slower
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class JiraDescriptionMapper:
     """
@@ -26,61 +33,60 @@ class JiraDescriptionMapper:
 
     def to_domain(self, adf_json: Optional[Dict[str, Any]]) -> TaskDescription:
         """
-        Parses a Jira ADF JSON object into a domain TaskDescription using a robust Regex strategy.
-        1. Flattens ADF to raw text.
-        2. Applies Regex to find YAML/Code block.
-        3. Returns strictly typed TaskDescription.
+        Parses a Jira ADF JSON object into a domain TaskDescription in a single walk:
+        1. Collects the text of every block, nested ones included.
+        2. Takes the config from the first YAML codeBlock node, left out of the text.
+        3. Without such a node (config pasted as plain text), falls back to the fence regex,
+           run from the first block that may open a fence and skipped when none does.
         """
         if not adf_json or "content" not in adf_json:
             return TaskDescription(raw_content="", config={})
 
-        # 1. Flatten ADF to Raw Text
-        # Iterate over all content nodes to reconstruct the full textual representation
-        raw_text_parts = []
-        for node in adf_json.get("content", []):
-            # Extract text from any node that has content (paragraphs, codeBlocks, headings, etc.)
-            if "content" in node:
-                node_text = "".join(
-                    [chunk.get("text", "") for chunk in node.get("content", []) if chunk.get("type") == "text"]
-                )
-                if node_text:
-                    raw_text_parts.append(node_text)
-        
-        
+        text_parts = []
+        config_yaml = None
+        offset, fence_at = 0, None
+        for block in JiraAdfTextWalker.iter_blocks(adf_json):
+            if config_yaml is None and JiraAdfTextWalker.language(block) in CONFIG_LANGUAGES:
+                config_yaml = JiraAdfTextWalker.block_text(block)
+                continue
+            block_text = JiraAdfTextWalker.block_text(block)
+            if block_text:
+                if fence_at is None and ("```" in block_text or "{" in block_text):
+                    fence_at = offset
+                text_parts.append(block_text)
+                offset += len(block_text) + 2
+
         # Join with double newlines to separate blocks clearly
-        original_cleaned_text = "\n\n".join(raw_text_parts)
-        
-        logger.info(f"🔎 Scanning Description ({len(original_cleaned_text)} chars) for Config Block...")
+        raw_text = "\n\n".join(text_parts)
 
-        # 2. Extract Config using Robust Regex
-        extracted_config = {}
-        match = self.CODE_BLOCK_PATTERN.search(original_cleaned_text)
-        logger.info(f"🧩 Match Found: {bool(match)}")
+        if config_yaml is not None:
+            logger.info("🧩 Config taken from YAML codeBlock node.")
+            return TaskDescription(raw_content=raw_text.strip(), config=self._parse_config(config_yaml))
 
-        if match:
-            raw_yaml = match.group(1)
-            # Sanitize invisible chars (common in Jira copy-paste)
-            clean_yaml = raw_yaml.replace(u'\xa0', ' ').strip()
-            
-            try:
-                parsed = yaml.safe_load(clean_yaml)
-                if isinstance(parsed, dict):
-                    extracted_config = parsed
-                else:
-                    logger.warning("Parsed YAML matches pattern but is not a dictionary.")
-            except yaml.YAMLError as e:
-                logger.warning(f"Failed to parse YAML block in description: {e}")
-            
-            # Remove the configuration block from the raw text
-            original_cleaned_text = original_cleaned_text.replace(match.group(0), "").strip()
-            logger.info("✂️  Config Block STRIPPED successfully.")
-
-        # 3. Return Domain Entity
-        # Critical: Must match TaskDescription(raw_content=..., config=...)
-        return TaskDescription(
-            raw_content=original_cleaned_text,
-            config=extracted_config or {}
-        )
+        logger.info(f"🔎 Scanning Description ({len(raw_text)} chars) for Config Block...")
+        match = self.CODE_BLOCK_PATTERN.search(raw_text, fence_at) if fence_at is not None else None
+        logger.info(f"🧩 Match Found: {bool(match)}")
+        if not match:
+            return TaskDescription(raw_content=raw_text, config={})
+
+        # Remove the configuration block from the raw text
+        raw_text = raw_text.replace(match.group(0), "").strip()
+        logger.info("✂️  Config Block STRIPPED successfully.")
+        return TaskDescription(raw_content=raw_text, config=self._parse_config(match.group(1)))
+
+    @staticmethod
+    def _parse_config(raw_yaml: str) -> Dict[str, Any]:
+        # Sanitize invisible chars (common in Jira copy-paste)
+        clean_yaml = raw_yaml.replace(u'\xa0', ' ').strip()
+        try:
+            parsed = yaml.safe_load(clean_yaml)
+        except yaml.YAMLError as e:
+            logger.warning(f"Failed to parse YAML block in description: {e}")
+            return {}
+        if not isinstance(parsed, dict):
+            logger.warning("Parsed YAML matches pattern but is not a dictionary.")
+            return {}
+        return parsed
 
     def to_adf(self, description: TaskDescription) -> Dict[str, Any]:
         """
@@ -103,13 +109,7 @@ class JiraDescriptionMapper:
         # 2. YAML Configuration (Native Code Block Node)
         if description.config:
             try:
-                # Dump YAML preserving order
-                yaml_str = yaml.dump(
-                    description.config, 
-                    sort_keys=False, 
-                    default_flow_style=False, 
-                    allow_unicode=True
-                ).strip()
+                yaml_str = self.render_config(description.config)
 
                 # Add spacing paragraph if text exists
                 if content_nodes:
@@ -128,4 +128,13 @@ class JiraDescriptionMapper:
                 ]))
 
         # Return the full ADF Document
-        return JiraAdfPrimitives.create_doc(content_nodes)
\ No newline at end of file
+        return JiraAdfPrimitives.create_doc(content_nodes)
+
+    @staticmethod
+    def render_config(config: Dict[str, Any]) -> str:
+        """Dumps the config to the YAML text of its codeBlock, preserving key order."""
+        try:
+            return yaml.dump(config, Dumper=_YAML_DUMPER, sort_keys=False, default_flow_style=False, allow_unicode=True).strip()
+        except yaml.representer.RepresenterError:
+            # Values that are not plain YAML types still go through the full dumper
+            return yaml.dump(config, sort_keys=False, default_flow_style=False, allow_unicode=True).strip()
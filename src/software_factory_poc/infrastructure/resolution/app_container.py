@@ -0,0 +1,129 @@
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import (
+    ScaffoldingAgentConfig,
+)
+from software_factory_poc.application.usecases.code_review.perform_code_review_usecase import (
+    PerformCodeReviewUseCase,
+)
+from software_factory_poc.application.usecases.scaffolding.create_scaffolding_usecase import (
+    CreateScaffoldingUseCase,
+)
+from software_factory_poc.application.core.agents.common.ports.flow_checkpoint_store import FlowCheckpointStore
+from software_factory_poc.application.core.agents.common.tools.null_flow_checkpoint_store import NullFlowCheckpointStore
+from software_factory_poc.infrastructure.checkpoints.sqlite_flow_checkpoint_store import SqliteFlowCheckpointStore
+from software_factory_poc.infrastructure.common.async_bridge.background_event_loop import BackgroundEventLoop
+from software_factory_poc.infrastructure.configuration.app_config import AppConfig
+from software_factory_poc.infrastructure.configuration.main_settings import Settings
+from software_factory_poc.infrastructure.configuration.scaffolding_config_loader import ScaffoldingConfigLoader
+from software_factory_poc.infrastructure.jobs.registry_run_phase_tracker import RegistryRunPhaseTracker
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+from software_factory_poc.infrastructure.observability.logger_factory_service import LoggerFactoryService
+from software_factory_poc.infrastructure.resolution.provider_resolver import ProviderResolver
+
+logger = LoggerFactoryService.build_logger(__name__)
+
+T = TypeVar("T")
+
+
+class AppContainer:
+    """
+    Application-scoped dependencies, created once by the FastAPI lifespan and shared by
+    every request and job worker. Configuration is read from the environment a single time;
+    gateways, HTTP and LLM SDK clients are built on first use and reused afterwards.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        app_config: Optional[AppConfig] = None,
+        scaffolding_config: Optional[ScaffoldingAgentConfig] = None,
+    ):
+        self.event_loop = BackgroundEventLoop(name="llm-event-loop")
+        self.run_registry = RunRegistry()
+        self._instances: dict[str, Any] = {}
+        if settings is not None:
+            self._instances["settings"] = settings
+        if app_config is not None:
+            self._instances["app_config"] = app_config
+        if scaffolding_config is not None:
+            self._instances["scaffolding_config"] = scaffolding_config
+        self._lock = threading.RLock()
+
+    def _single(self, name: str, factory: Callable[[], T]) -> T:
+        with self._lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return cast(T, self._instances[name])
+
+    @property
+    def settings(self) -> Settings:
+        return self._single("settings", lambda: Settings())  # type: ignore[call-arg]  # values come from the environment
+
+    @property
+    def app_config(self) -> AppConfig:
+        return self._single("app_config", AppConfig)
+
+    @property
+    def scaffolding_config(self) -> ScaffoldingAgentConfig:
+        return self._single("scaffolding_config", ScaffoldingConfigLoader.load_config)
+
+    @property
+    def resolver(self) -> ProviderResolver:
+        return self._single("resolver", lambda: ProviderResolver(
+            self.scaffolding_config,
+            app_config=self.app_config,
+            settings=self.settings,
+            shared=True,
+            event_loop=self.event_loop,
+            phase_tracker=RegistryRunPhaseTracker(self.run_registry),
+            checkpoint_store=self.checkpoint_store,
+        ))
+
+    @property
+    def checkpoint_store(self) -> FlowCheckpointStore:
+        return self._single("checkpoint_store", self._build_checkpoint_store)
+
+    def _build_checkpoint_store(self) -> FlowCheckpointStore:
+        settings = self.app_config.checkpoints
+        if not settings.enabled:
+            return NullFlowCheckpointStore()
+        store = SqliteFlowCheckpointStore(settings.db_path, ttl_seconds=settings.ttl_seconds)
+        purged = store.purge_expired()
+        if purged:
+            logger.info(f"Purged {purged} expired flow checkpoint(s)")
+        return store
+
+    def scaffolding_usecase(self) -> CreateScaffoldingUseCase:
+        return self._single("scaffolding_usecase", lambda: CreateScaffoldingUseCase(
+            config=self.scaffolding_config,
+            resolver=self.resolver,
+        ))
+
+    def code_review_usecase(self) -> PerformCodeReviewUseCase:
+        return self._single("code_review_usecase", self.resolver.create_perform_code_review_usecase)
+
+    def warm_up(self) -> float:
+        """Builds configuration and every shared gateway up front. Returns the elapsed milliseconds."""
+        started = time.perf_counter()
+        resolver = self.resolver
+        resolver.resolve_tracker()
+        resolver.resolve_vcs()
+        resolver.resolve_research()
+        resolver.resolve_llm_gateway()
+        self.scaffolding_usecase()
+        self.code_review_usecase()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Application container ready in {elapsed_ms:.0f} ms")
+        return elapsed_ms
+
+    def close(self) -> None:
+        resolver = self._instances.get("resolver")
+        if resolver is not None:
+            resolver.close()
+        self.event_loop.close()
+        store = self._instances.get("checkpoint_store")
+        if isinstance(store, SqliteFlowCheckpointStore):
+            store.close()
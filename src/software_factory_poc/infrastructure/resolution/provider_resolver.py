@@ -1,9 +1,14 @@
-from typing import cast, Optional
+import threading
+from typing import Any, Callable, cast, Optional
 
 from software_factory_poc.application.core.agents.code_reviewer.code_reviewer_agent import CodeReviewerAgent
 from software_factory_poc.application.core.agents.code_reviewer.config.code_reviewer_agent_config import (
     CodeReviewerAgentConfig,
 )
+from software_factory_poc.application.core.agents.common.ports.flow_checkpoint_store import FlowCheckpointStore
+from software_factory_poc.application.core.agents.common.ports.run_phase_tracker import RunPhaseTracker
+from software_factory_poc.application.core.agents.common.tools.null_flow_checkpoint_store import NullFlowCheckpointStore
+from software_factory_poc.application.core.agents.common.tools.null_run_phase_tracker import NullRunPhaseTracker
 from software_factory_poc.application.core.agents.reasoner.ports.llm_gateway import LlmGateway
 from software_factory_poc.application.core.agents.reasoner.reasoner_agent import ReasonerAgent
 from software_factory_poc.application.core.agents.reporter.config.task_tracker_type import (
@@ -11,6 +16,8 @@ from software_factory_poc.application.core.agents.reporter.config.task_tracker_t
 )
 from software_factory_poc.application.core.agents.reporter.ports.task_tracker_gateway import TaskTrackerGateway
 from software_factory_poc.application.core.agents.reporter.reporter_agent import ReporterAgent
+from software_factory_poc.application.core.agents.reporter.tracker_channel import TrackerChannel
+from software_factory_poc.application.core.agents.reporter.tracker_outbox import TrackerOutbox
 from software_factory_poc.application.core.agents.research.ports.research_gateway import ResearchGateway
 from software_factory_poc.application.core.agents.research.research_agent import ResearchAgent
 from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import (
@@ -25,6 +32,7 @@ from software_factory_poc.application.core.agents.vcs.vcs_agent import VcsAgent
 from software_factory_poc.application.usecases.code_review.perform_code_review_usecase import (
     PerformCodeReviewUseCase,
 )
+from software_factory_poc.infrastructure.common.async_bridge.background_event_loop import BackgroundEventLoop
 from software_factory_poc.infrastructure.common.retry.retry_policy import RetryPolicy
 from software_factory_poc.infrastructure.configuration.app_config import AppConfig
 from software_factory_poc.infrastructure.configuration.main_settings import Settings  # Legacy or remove
@@ -44,6 +52,9 @@ from software_factory_poc.infrastructure.providers.tracker.clients.jira_http_cli
 from software_factory_poc.infrastructure.providers.tracker.jira_provider_impl import (
     JiraProviderImpl,
 )
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_rate_limiter import JiraRateLimiter
+from software_factory_poc.infrastructure.providers.tracker.jira_issue_cache import JiraIssueCache
+from software_factory_poc.infrastructure.providers.tracker.jira_transition_cache import JiraTransitionCache
 from software_factory_poc.infrastructure.providers.vcs.clients.gitlab_http_client import (
     GitLabHttpClient,
 )
@@ -68,17 +79,45 @@ class ProviderResolver:
     """
     Factory responsible for resolving and instantiating the correct infrastructure adapters
     based on the domain configuration.
+    With `shared=True` each gateway is built once and reused by every run (see AppContainer);
+    otherwise every call builds fresh instances.
     """
-    def __init__(self, config: ScaffoldingAgentConfig, app_config:Optional[ AppConfig] = None):
+    def __init__(
+        self,
+        config: ScaffoldingAgentConfig,
+        app_config: Optional[AppConfig] = None,
+        settings: Optional[Settings] = None,
+        shared: bool = False,
+        event_loop: Optional[BackgroundEventLoop] = None,
+        phase_tracker: Optional[RunPhaseTracker] = None,
+        checkpoint_store: Optional[FlowCheckpointStore] = None,
+    ):
         self.config = config
         self.app_config = app_config or AppConfig()
         # Legacy settings for components not yet using AppConfig
-        self.settings = Settings()
+        self.settings = settings or Settings()
+        self.shared = shared
+        self.event_loop = event_loop
+        self.phase_tracker = phase_tracker or NullRunPhaseTracker()
+        self.checkpoint_store = checkpoint_store or NullFlowCheckpointStore()
+        self._instances: dict[str, Any] = {}
+        self._instances_lock = threading.Lock()
+
+    def _reuse(self, name: str, factory: Callable[[], Any]) -> Any:
+        if not self.shared:
+            return factory()
+        with self._instances_lock:
+            if name not in self._instances:
+                self._instances[name] = factory()
+            return self._instances[name]
 
     def resolve_vcs(self) -> VcsGateway:
         """
         Resolves the configured VCS provider.
         """
+        return self._reuse("vcs", self._build_vcs)
+
+    def _build_vcs(self) -> VcsGateway:
         if self.config.vcs_provider == VcsProviderType.GITLAB:
             http_client = GitLabHttpClient(self.settings)
             
@@ -105,9 +144,24 @@ class ProviderResolver:
         """
         Resolves the configured Tracker provider.
         """
+        return self._reuse("tracker", self._build_tracker)
+
+    def _build_tracker(self) -> TaskTrackerGateway:
         if self.config.tracker_provider == TaskTrackerType.JIRA:
-            http_client = JiraHttpClient(self.app_config.jira)
-            return JiraProviderImpl(http_client, self.app_config.jira)
+            jira = self.app_config.jira
+            http_client = JiraHttpClient(
+                jira,
+                rate_limiter=JiraRateLimiter(rate_per_second=jira.rate_limit_per_second, burst=jira.rate_limit_burst),
+                max_throttle_retries=jira.max_throttle_retries,
+                max_retry_after_seconds=jira.max_retry_after_seconds,
+            )
+            return JiraProviderImpl(
+                http_client,
+                self.app_config.jira,
+                transition_cache=JiraTransitionCache(ttl_seconds=self.app_config.jira.transition_cache_ttl_seconds),
+                issue_cache=JiraIssueCache(ttl_seconds=self.app_config.jira.issue_cache_ttl_seconds),
+                bulk_concurrency=self.app_config.jira.bulk_concurrency,
+            )
             
         elif self.config.tracker_provider == TaskTrackerType.AZURE_DEVOPS:
             raise NotImplementedError("Azure DevOps adapter is not yet implemented.")
@@ -119,8 +173,23 @@ class ProviderResolver:
         """
         Resolves the configured Research provider using ResearchProviderFactory.
         """
+        return self._reuse("research", self._build_research)
+
+    def _build_research(self) -> ResearchGateway:
         return ResearchProviderFactory.build_research_gateway(self.app_config, self.config.research_provider)
 
+    def resolve_phase_tracker(self) -> RunPhaseTracker:
+        """
+        Resolves the tracker that publishes run phases (the run registry when wired by AppContainer).
+        """
+        return self.phase_tracker
+
+    def resolve_checkpoint_store(self) -> FlowCheckpointStore:
+        """
+        Resolves the store of phase checkpoints used to resume failed flows (disabled unless wired by AppContainer).
+        """
+        return self.checkpoint_store
+
     def resolve_knowledge(self) -> ResearchGateway:
         """
         Deprecated: Use resolve_research. Kept for backward compatibility.
@@ -131,6 +200,12 @@ class ProviderResolver:
         """
         Resolves the configured LLM Composite Gateway.
         """
+        # The async SDK clients can only be shared when every call runs on the same event loop
+        if self.event_loop is None:
+            return self._build_llm_gateway()
+        return self._reuse("llm", self._build_llm_gateway)
+
+    def _build_llm_gateway(self) -> LlmGateway:
         # 1. Prepare dependencies for Factory
         correlation = CorrelationIdContext()
         # Default retry policy of 3 attempts with exponential backoff
@@ -141,7 +216,7 @@ class ProviderResolver:
         clients = LlmProviderFactory.build_providers(self.settings, retry, correlation)
         
         # 3. Return Composite Gateway
-        return CompositeLlmGateway(self.config, clients)
+        return CompositeLlmGateway(self.config, clients, event_loop=self.event_loop)
 
     # ---------------------------------------------------------
     # Domain Agent Factory Methods (Clean Code / DI Encapsulation)
@@ -149,13 +224,34 @@ class ProviderResolver:
 
     def create_reporter_agent(self) -> ReporterAgent:
         tracker_gateway = cast(TaskTrackerGateway, self.resolve_tracker())
+        outbox = self._reuse("tracker_outbox", lambda: TrackerOutbox(tracker_gateway))
         return ReporterAgent(
             name="Reporter", 
             role="Communicator", 
             goal="Report status to Issue Tracker", 
-            tracker=tracker_gateway
+            tracker=tracker_gateway,
+            outbox=outbox,
+            # Only a shared resolver owns a channel: its delivery threads outlive a single run
+            channel=self._reuse("tracker_channel", lambda: self._build_tracker_channel(outbox)) if self.shared else None
+        )
+
+    def _build_tracker_channel(self, outbox: TrackerOutbox) -> Optional[TrackerChannel]:
+        settings = self.app_config.reporter
+        if not settings.async_enabled:
+            return None
+        return TrackerChannel(
+            outbox,
+            lanes=settings.channel_lanes,
+            max_pending=settings.max_pending_operations,
+            flush_timeout_seconds=settings.flush_timeout_seconds,
         )
 
+    def close(self) -> None:
+        """Delivers the tracker writes still queued by the shared reporter channel."""
+        channel = self._instances.get("tracker_channel")
+        if channel is not None:
+            channel.close()
+
     def create_vcs_agent(self) -> VcsAgent:
         vcs_gateway = self.resolve_vcs()
         return VcsAgent(
@@ -1,8 +1,10 @@
 import logging
+import os
 
 import uvicorn
 
 from software_factory_poc.infrastructure.configuration.main_settings import Settings
+from software_factory_poc.infrastructure.configuration.server_settings import ServerSettings
 from software_factory_poc.infrastructure.entrypoints.api.app_factory import create_app
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,22 @@ def dev():
         log_level=log_level
     )
 
+
+def serve():
+    """Entry point for production: several worker processes, no reload."""
+    settings = Settings()
+    server = ServerSettings()
+    workers = server.workers or os.cpu_count() or 1
+    logger.info(f"Starting {workers} server worker process(es) on {server.host}:{server.port}")
+
+    uvicorn.run(
+        "software_factory_poc.main:app",
+        host=server.host,
+        port=server.port,
+        workers=workers,
+        log_level=settings.log_level.lower() if hasattr(settings, "log_level") else "info"
+    )
+
 # Instantiate global app for ASGI
 settings = Settings()
 app = create_app(settings)
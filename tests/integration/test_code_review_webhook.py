@@ -2,6 +2,8 @@
 from unittest.mock import MagicMock, patch
 import pytest
 from fastapi.testclient import TestClient
+from software_factory_poc.infrastructure.entrypoints.api.mappers.jira_payload_mapper import JiraPayloadMapper
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
 from software_factory_poc.main import app
 
 client = TestClient(app)
@@ -18,15 +20,18 @@ def test_code_review_webhook_success(mock_settings):
     """
     Verifies:
     1. POST /api/v1/webhooks/jira/code-review-trigger returns 202.
-    2. Payload is parsed correctly (Regex fixed).
-    3. UseCase.execute is called with the correct Task configuration.
+    2. The raw payload is queued for a code review job.
+    3. The queued body maps to a Task with the correct configuration (Regex fixed).
     """
-    # 1. Setup Mock UseCase
-    mock_use_case = MagicMock()
+    # 1. Setup Mock Job Pool (routers only enqueue)
+    mock_job_pool = MagicMock()
+    mock_job_pool.admit.return_value.admitted = True
+    mock_job_pool.submit_webhook.return_value.job.id = "job-1"
+    mock_job_pool.submit_webhook.return_value.created = True
     
     # 2. Override Dependency
-    from software_factory_poc.infrastructure.entrypoints.api.code_review_router import get_code_review_usecase
-    app.dependency_overrides[get_code_review_usecase] = lambda: mock_use_case
+    from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
+    app.dependency_overrides[get_job_pool] = lambda: mock_job_pool
     
     # 3. Define Payload
     import textwrap
@@ -67,12 +72,18 @@ def test_code_review_webhook_success(mock_settings):
         assert response.status_code == 202
         assert response.json()["message"] == "Code Review request queued."
         
-        # 6. Assert Use Case Invocation
-        assert mock_use_case.execute.called, "UseCase.execute should have been called"
+        assert response.json()["job_id"] == "job-1"
         
-        # Capture the Task argument passed to execute(task)
-        call_args = mock_use_case.execute.call_args
-        task_arg = call_args[0][0]
+        # 6. Assert Job Submission (raw body queued as is)
+        assert mock_job_pool.submit_webhook.called, "A code review job should have been queued"
+        
+        # Capture the arguments passed to submit_webhook(kind, trigger, body)
+        kind, trigger, body = mock_job_pool.submit_webhook.call_args[0]
+        assert kind == JobKind.CODE_REVIEW
+        assert trigger.issue_key == "CR-TEST-1"
+        
+        # The worker maps the queued body to the Task
+        task_arg = JiraPayloadMapper.from_json(body)
         
         # 7. Assert Configuration Extraction
         # The 'gitlab_project_id' should be strings or ints depending on YAML parsing. 
@@ -0,0 +1,185 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.application.core.agents.common.config.task_status import TaskStatus
+from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+from software_factory_poc.application.core.agents.reporter.config.tracker_operation_kind import TrackerOperationKind
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_operation_dto import TrackerOperationDTO
+from software_factory_poc.application.core.agents.reporter.reporter_agent import ReporterAgent
+from software_factory_poc.application.core.agents.reporter.tracker_channel import TrackerChannel
+from software_factory_poc.application.core.agents.reporter.tracker_outbox import TrackerOutbox
+
+
+@pytest.fixture
+def tracker():
+    return MagicMock()
+
+
+@pytest.fixture
+def outbox(tracker):
+    outbox = TrackerOutbox(tracker, backoff_base_seconds=0.01, sleep=lambda _: None)
+    yield outbox
+    outbox.close(wait=True)
+
+
+@pytest.fixture
+def reporter(tracker, outbox):
+    return ReporterAgent(name="Reporter", role="Communicator", goal="Report", tracker=tracker, outbox=outbox)
+
+
+def _op(kind, payload, task_id="KAN-1"):
+    return TrackerOperationDTO(kind=kind, task_id=task_id, payload=payload)
+
+
+def test_collapse_keeps_last_description_and_transition_and_unique_comments():
+    operations = [
+        _op(TrackerOperationKind.DESCRIPTION, "v1"),
+        _op(TrackerOperationKind.COMMENT, "done"),
+        _op(TrackerOperationKind.TRANSITION, TaskStatus.IN_PROGRESS),
+        _op(TrackerOperationKind.DESCRIPTION, "v2"),
+        _op(TrackerOperationKind.COMMENT, "done"),
+        _op(TrackerOperationKind.TRANSITION, TaskStatus.IN_REVIEW),
+    ]
+
+    collapsed = TrackerOutbox.collapse(operations)
+
+    assert [(op.kind, op.payload) for op in collapsed] == [
+        (TrackerOperationKind.COMMENT, "done"),
+        (TrackerOperationKind.DESCRIPTION, "v2"),
+        (TrackerOperationKind.TRANSITION, TaskStatus.IN_REVIEW),
+    ]
+
+
+def test_batch_buffers_writes_until_the_block_ends(reporter, tracker):
+    with reporter.batch():
+        reporter.update_task_description("KAN-1", "description")
+        reporter.report_success("KAN-1", {"type": "scaffolding_success"})
+        reporter.transition_task("KAN-1", TaskStatus.IN_REVIEW)
+        tracker.add_comment.assert_not_called()
+
+    tracker.update_task_description.assert_called_once_with("KAN-1", "description")
+    tracker.add_comment.assert_called_once_with("KAN-1", {"type": "scaffolding_success"})
+    tracker.transition_status.assert_called_once_with("KAN-1", TaskStatus.IN_REVIEW)
+
+
+def test_batch_is_dropped_when_the_block_raises(reporter, tracker):
+    with pytest.raises(RuntimeError):
+        with reporter.batch():
+            reporter.transition_task("KAN-1", TaskStatus.IN_REVIEW)
+            raise RuntimeError("boom")
+
+    tracker.transition_status.assert_not_called()
+
+
+def test_failed_operations_are_retried_in_background(outbox, tracker):
+    tracker.add_comment.side_effect = [ConnectionError("down"), None]
+
+    failed = outbox.flush([_op(TrackerOperationKind.COMMENT, "done"), _op(TrackerOperationKind.TRANSITION, "x")])
+    outbox.close(wait=True)
+
+    assert [op.kind for op in failed] == [TrackerOperationKind.COMMENT, TrackerOperationKind.TRANSITION]
+    assert tracker.add_comment.call_count == 2
+    tracker.transition_status.assert_called_once()
+
+
+def test_permanent_errors_are_dropped_without_retrying(outbox, tracker):
+    tracker.transition_status.side_effect = ProviderError(provider="Jira", message="no transition", retryable=False)
+
+    failed = outbox.flush([_op(TrackerOperationKind.TRANSITION, "x")])
+    outbox.close(wait=True)
+
+    assert failed == []
+    tracker.transition_status.assert_called_once()
+
+
+def test_transition_waits_for_the_failed_description_update_of_its_issue(outbox, tracker):
+    calls = []
+    failures = iter([ProviderError(provider="Jira", message="throttled", retryable=True, status_code=429)])
+
+    def update_description(task_id, body):
+        error = next(failures, None)
+        if error:
+            raise error
+        calls.append(("description", task_id))
+
+    tracker.update_task_description.side_effect = update_description
+    tracker.transition_status.side_effect = lambda task_id, status: calls.append(("transition", task_id))
+
+    outbox.flush([
+        _op(TrackerOperationKind.DESCRIPTION, "v1"),
+        _op(TrackerOperationKind.TRANSITION, TaskStatus.IN_REVIEW),
+        _op(TrackerOperationKind.TRANSITION, TaskStatus.IN_REVIEW, task_id="KAN-2"),
+    ])
+    outbox.close(wait=True)
+
+    assert calls == [("transition", "KAN-2"), ("description", "KAN-1"), ("transition", "KAN-1")]
+    assert tracker.update_task_description.call_count == 2
+
+
+def test_without_batch_writes_go_straight_to_the_tracker(reporter, tracker):
+    reporter.report_start("KAN-1", "starting")
+
+    tracker.add_comment.assert_called_once_with("KAN-1", "starting")
+
+
+def test_channel_delivers_in_background_in_order_and_flush_waits(tracker, outbox):
+    release = threading.Event()
+    delivered = []
+    tracker.add_comment.side_effect = lambda task_id, body: release.wait(2) and delivered.append(body)
+    channel = TrackerChannel(outbox, lanes=2, max_pending=10)
+    reporter = ReporterAgent(name="Reporter", role="Communicator", goal="Report", tracker=tracker,
+                             outbox=outbox, channel=channel)
+
+    reporter.report_start("KAN-1", "started")
+    reporter.report_success("KAN-1", {"type": "done"})
+    assert delivered == []
+    assert not channel.flush("KAN-1", timeout=0.05)
+
+    release.set()
+    reporter.flush("KAN-1")
+    assert delivered == ["started", {"type": "done"}]
+    channel.close()
+
+
+def test_channel_retries_stay_ahead_of_later_writes_of_the_issue(tracker, outbox):
+    delivered = []
+    failures = iter([ConnectionError("down")])
+
+    def add_comment(task_id, body):
+        if body == "first":
+            error = next(failures, None)
+            if error:
+                raise error
+        delivered.append(body)
+
+    tracker.add_comment.side_effect = add_comment
+    channel = TrackerChannel(outbox, lanes=1, max_pending=10)
+
+    channel.post([_op(TrackerOperationKind.COMMENT, "first")])
+    channel.post([_op(TrackerOperationKind.COMMENT, "second")])
+    channel.flush("KAN-1", timeout=2)
+
+    assert delivered == ["first", "second"]
+    channel.close()
+
+
+def test_an_issue_waiting_for_a_retry_does_not_block_the_others(tracker):
+    outbox = TrackerOutbox(tracker, backoff_base_seconds=0.2)
+
+    def add_comment(task_id, body):
+        if task_id == "KAN-1":
+            raise ConnectionError("down")
+
+    tracker.add_comment.side_effect = add_comment
+    channel = TrackerChannel(outbox, lanes=1, max_pending=10)
+
+    channel.post([_op(TrackerOperationKind.COMMENT, "failing")])
+    channel.post([_op(TrackerOperationKind.COMMENT, "other", task_id="KAN-2")])
+
+    assert channel.flush("KAN-2", timeout=0.1)
+    assert not channel.flush("KAN-1", timeout=0)
+    assert channel.flush("KAN-1", timeout=5)
+    assert tracker.add_comment.call_count == 1 + outbox.max_attempts
+    channel.close()
@@ -1,9 +1,11 @@
 
+import time
 from unittest.mock import MagicMock
 
 import pytest
 
 from software_factory_poc.application.core.agents.research.research_agent import ResearchAgent
+from software_factory_poc.application.core.agents.research.value_objects.research_layer import ResearchLayer
 from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import \
     ScaffoldingAgentConfig
 
@@ -42,3 +44,53 @@ def test_research_agent_empty_response(mock_gateway, mock_config):
     
     result = agent.investigate("query")
     assert result == "No context found."
+
+
+def _slow(value, delay):
+    def loader():
+        time.sleep(delay)
+        return value
+    return loader
+
+
+def test_fan_out_runs_layers_concurrently_and_keeps_order(mock_gateway, mock_config):
+    mock_config.research_layer_timeout_seconds = 5.0
+    agent = ResearchAgent(name="Res", role="Res", goal="Test", gateway=mock_gateway, config=mock_config)
+    layers = [ResearchLayer("a", _slow("A", 0.2)), ResearchLayer("b", _slow("B", 0.05)), ResearchLayer("c", _slow("C", 0.1))]
+
+    started = time.monotonic()
+    results = agent.fan_out(layers)
+    elapsed = time.monotonic() - started
+
+    assert [r.content for r in results] == ["A", "B", "C"]
+    assert elapsed < 0.3  # max, not sum (0.35s)
+
+
+def test_fan_out_isolates_failures_and_timeouts(mock_gateway, mock_config):
+    mock_config.research_layer_timeout_seconds = 5.0
+    agent = ResearchAgent(name="Res", role="Res", goal="Test", gateway=mock_gateway, config=mock_config)
+
+    def boom():
+        raise RuntimeError("confluence down")
+
+    results = agent.fan_out([
+        ResearchLayer("broken", boom),
+        ResearchLayer("slow", _slow("late", 1.0), timeout_seconds=0.05),
+        ResearchLayer("ok", lambda: "fine"),
+    ])
+
+    assert [r.content for r in results] == [None, None, "fine"]
+    assert results[0].error == "confluence down"
+    assert "timed out" in results[1].error
+    assert results[2].succeeded
+
+
+def test_fan_out_reraises_required_layer_failure(mock_gateway, mock_config):
+    mock_config.research_layer_timeout_seconds = 5.0
+    agent = ResearchAgent(name="Res", role="Res", goal="Test", gateway=mock_gateway, config=mock_config)
+
+    def boom():
+        raise RuntimeError("search failed")
+
+    with pytest.raises(RuntimeError, match="search failed"):
+        agent.fan_out([ResearchLayer("optional", lambda: "x"), ResearchLayer("required", boom, required=True)])
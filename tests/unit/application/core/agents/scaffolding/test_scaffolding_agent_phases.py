@@ -0,0 +1,172 @@
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.agents.common.dtos.file_content_dto import FileContentDTO
+from software_factory_poc.application.core.agents.common.exceptions.flow_failed_error import FlowFailedError
+from software_factory_poc.application.core.agents.common.ports.flow_checkpoint_store import FlowCheckpointStore
+from software_factory_poc.application.core.agents.common.ports.run_phase_tracker import RunPhaseTracker
+from software_factory_poc.application.core.agents.reporter.config.task_tracker_type import TaskTrackerType
+from software_factory_poc.application.core.agents.research.config.research_provider_type import ResearchProviderType
+from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import \
+    ScaffoldingAgentConfig
+from software_factory_poc.application.core.agents.scaffolding.scaffolding_agent import ScaffoldingAgent
+from software_factory_poc.application.core.agents.vcs.config.vcs_provider_type import VcsProviderType
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
+
+
+class RecordingTracker(RunPhaseTracker):
+    def __init__(self):
+        self.events = []
+
+    @contextmanager
+    def phase(self, phase):
+        self.events.append(("start", phase))
+        try:
+            yield
+        except Exception:
+            self.events.append(("failed", phase))
+            raise
+        self.events.append(("end", phase))
+
+
+def _agent(tracker):
+    config = ScaffoldingAgentConfig(
+        vcs_provider=VcsProviderType.GITLAB,
+        tracker_provider=TaskTrackerType.JIRA,
+        research_provider=ResearchProviderType.CONFLUENCE,
+        work_dir=Path("/tmp"),
+        model_name="test-model",
+    )
+    reporter, vcs, researcher, reasoner = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    vcs.resolve_project_id.return_value = 1
+    vcs.validate_branch.return_value = None
+    vcs.create_merge_request.return_value.web_url = "https://gitlab/mr/1"
+    researcher.fan_out.return_value = []
+    agent = ScaffoldingAgent(config, reporter, vcs, researcher, reasoner, phase_tracker=tracker)
+    agent.prompt_builder_tool = MagicMock()
+    agent.artifact_parser_tool = MagicMock()
+    agent.artifact_parser_tool.parse_response.return_value = [FileContentDTO(path="main.py", content="x")]
+    return agent
+
+
+def _task():
+    return Task(
+        id="1", key="KAN-1", summary="Scaffold", status="To Do", project_key="KAN", issue_type="Task",
+        description=TaskDescription(raw_content="", config={"parameters": {"service_name": "cart"}}),
+    )
+
+
+def test_execute_flow_reports_every_phase_in_order():
+    tracker = RecordingTracker()
+    _agent(tracker).execute_flow(_task())
+
+    assert [phase for kind, phase in tracker.events if kind == "end"] == [
+        RunPhase.VALIDATE, RunPhase.RESEARCH, RunPhase.REASON, RunPhase.COMMIT, RunPhase.MERGE_REQUEST, RunPhase.REPORT
+    ]
+
+
+def test_failing_phase_is_reported_and_flow_stops():
+    tracker = RecordingTracker()
+    agent = _agent(tracker)
+    agent.reasoner.reason.side_effect = RuntimeError("llm down")
+
+    with pytest.raises(FlowFailedError) as failure:
+        agent.execute_flow(_task())
+
+    assert tracker.events[-1] == ("failed", RunPhase.REASON)
+    agent.reporter.report_failure.assert_called_once()
+    assert failure.value.retryable
+
+
+class InMemoryCheckpoints(FlowCheckpointStore):
+    def __init__(self, saved=None):
+        self.saved = dict(saved or {})
+        self.cleared = False
+
+    def load(self, flow, task):
+        return dict(self.saved)
+
+    def save(self, flow, task, phase, output):
+        self.saved[phase.value] = output
+
+    def clear(self, flow, task):
+        self.saved, self.cleared = {}, True
+
+
+def test_failed_merge_request_keeps_the_expensive_phases_checkpointed():
+    checkpoints = InMemoryCheckpoints()
+    agent = _agent(RecordingTracker())
+    agent.checkpoints = checkpoints
+    agent.vcs.commit_files.return_value.id = "abc123"
+    agent.vcs.create_merge_request.side_effect = RuntimeError("gitlab down")
+
+    with pytest.raises(FlowFailedError):
+        agent.execute_flow(_task())
+
+    assert set(checkpoints.saved) == {"research", "reason", "branch", "commit"}
+    assert checkpoints.saved["reason"] == [{"path": "main.py", "content": "x"}]
+    assert checkpoints.saved["commit"] == {"branch_name": "feature/kan-1-scaffolding", "commit_id": "abc123"}
+
+
+def test_rerun_resumes_after_the_last_successful_phase():
+    checkpoints = InMemoryCheckpoints({
+        "research": "context",
+        "reason": [{"path": "main.py", "content": "x"}],
+        "commit": {"branch_name": "feature/kan-1-scaffolding", "commit_id": "abc123"},
+    })
+    agent = _agent(RecordingTracker())
+    agent.checkpoints = checkpoints
+    # The branch created by the failed run exists and must not stop the flow
+    agent.vcs.validate_branch.return_value = "https://gitlab/branch"
+
+    agent.execute_flow(_task())
+
+    agent.researcher.fan_out.assert_not_called()
+    agent.reasoner.reason.assert_not_called()
+    agent.vcs.create_branch.assert_not_called()
+    agent.vcs.commit_files.assert_not_called()
+    agent.vcs.create_merge_request.assert_called_once()
+    assert checkpoints.cleared
+
+
+def test_deleted_branch_redoes_the_commit_from_the_checkpointed_artifacts():
+    checkpoints = InMemoryCheckpoints({
+        "research": "context",
+        "reason": [{"path": "main.py", "content": "x"}],
+        "commit": {"branch_name": "feature/kan-1-scaffolding", "commit_id": "abc123"},
+    })
+    agent = _agent(RecordingTracker())
+    agent.checkpoints = checkpoints
+
+    agent.execute_flow(_task())
+
+    agent.reasoner.reason.assert_not_called()
+    agent.vcs.create_branch.assert_called_once()
+    assert agent.vcs.commit_files.call_args.kwargs["files_map"] == {"main.py": "x"}
+
+
+def test_failed_commit_resumes_on_the_branch_it_created():
+    checkpoints = InMemoryCheckpoints()
+    agent = _agent(RecordingTracker())
+    agent.checkpoints = checkpoints
+    agent.vcs.commit_files.side_effect = RuntimeError("gitlab down")
+
+    with pytest.raises(FlowFailedError):
+        agent.execute_flow(_task())
+    assert set(checkpoints.saved) == {"research", "reason", "branch"}
+
+    # The re-run finds the branch of the failed run: it commits there instead of stopping
+    agent.vcs.validate_branch.return_value = "https://gitlab/branch"
+    agent.vcs.commit_files.side_effect = None
+    agent.vcs.commit_files.return_value.id = "abc123"
+    agent.execute_flow(_task())
+
+    agent.vcs.create_branch.assert_called_once()
+    assert agent.vcs.commit_files.call_count == 2
+    agent.vcs.create_merge_request.assert_called_once()
+    assert agent.vcs.commit_files.call_args.kwargs["branch_name"] == "feature/kan-1-scaffolding"
+    assert checkpoints.cleared
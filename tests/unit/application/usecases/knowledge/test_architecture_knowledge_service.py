@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from software_factory_poc.application.usecases.knowledge.architecture_knowledge_service import (
+    ArchitectureKnowledgeService,
+)
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.configuration.research_cache_settings import ResearchCacheSettings
+
+
+def _build_service(enabled: bool) -> tuple[ArchitectureKnowledgeService, MagicMock]:
+    provider = MagicMock()
+    provider.get_page_content.return_value = "guidelines"
+    service = ArchitectureKnowledgeService(
+        provider,
+        SimpleNamespace(architecture_doc_page_id="42"),
+        cache=ResearchCache(ttl_by_kind={kind: 60.0 for kind in ResearchCacheKind}),
+        cache_settings=ResearchCacheSettings(enabled=enabled),
+    )
+    return service, provider
+
+
+def test_guidelines_are_cached_when_the_cache_is_enabled():
+    service, provider = _build_service(enabled=True)
+
+    for _ in range(3):
+        assert service.get_architecture_guidelines() == "guidelines"
+
+    provider.get_page_content.assert_called_once_with("42")
+
+
+def test_disabled_cache_reads_the_page_every_time():
+    service, provider = _build_service(enabled=False)
+
+    for _ in range(3):
+        assert service.get_architecture_guidelines() == "guidelines"
+
+    assert provider.get_page_content.call_count == 3
@@ -0,0 +1,153 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
+from software_factory_poc.infrastructure.batch.batch_scaffolding_service import BatchScaffoldingService
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+
+
+def _task(key: str) -> Task:
+    return Task(
+        id=key, key=key, summary="Scaffold", status="To Do", project_key=key.split("-")[0], issue_type="Task",
+        description=TaskDescription(raw_content="", config={"parameters": {"service_name": key.lower()}}),
+    )
+
+
+@pytest.fixture
+def tracker():
+    tracker = MagicMock()
+    tracker.get_tasks.side_effect = lambda keys: [_task(key) for key in keys if key != "KAN-404"]
+    return tracker
+
+
+@pytest.fixture
+def research():
+    return MagicMock()
+
+
+@pytest.fixture
+def handled():
+    return []
+
+
+@pytest.fixture
+def pool(tmp_path, handled):
+    queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    handlers = {JobKind.SCAFFOLDING: lambda task: handled.append(task.key)}
+    pool = JobWorkerPool(
+        queue, handlers, JobQueueSettings(tenant_max_concurrency=10), run_registry=RunRegistry()
+    )
+    yield pool
+    queue.close()
+
+
+@pytest.fixture
+def service(tracker, research, pool):
+    return BatchScaffoldingService(
+        tracker=lambda: tracker,
+        research=lambda: research,
+        job_pool=pool,
+        architecture_page_id=lambda: "arch-1",
+    )
+
+
+def test_issues_are_fetched_in_bulk_and_queued_as_jobs(service, tracker, research, pool, handled):
+    report = service.submit(issue_keys=["KAN-1", "kan-2", "KAN-1", "OPS-7"])
+
+    tracker.get_tasks.assert_called_once_with(["KAN-1", "KAN-2", "OPS-7"])
+    tracker.get_task.assert_not_called()
+    research.get_page_content.assert_called_once_with("arch-1")
+    assert [item.issue_key for item in report.items] == ["KAN-1", "KAN-2", "OPS-7"]
+    assert report.counts == {"queued": 3}
+    assert not report.done
+
+    pool.run_pending()
+
+    final = service.report(report.batch_id)
+    assert sorted(handled) == ["KAN-1", "KAN-2", "OPS-7"]
+    assert final.done
+    assert final.counts == {"succeeded": 3}
+    assert all(item.elapsed_ms is not None for item in final.items)
+
+
+def test_invalid_and_unknown_issues_are_reported_as_rejected(service):
+    report = service.submit(issue_keys=["KAN-1", "KAN-404", "not a key) OR (1=1"])
+
+    statuses = {item.issue_key: (item.status, item.error) for item in report.items}
+    assert statuses["KAN-404"] == ("rejected", "Issue not found")
+    assert statuses["not a key) OR (1=1"] == ("rejected", "Invalid issue key")
+    assert statuses["KAN-1"][0] == "queued"
+
+
+def test_jql_selects_the_issues(service, tracker):
+    tracker.search_task_ids.return_value = ["KAN-1", "KAN-2"]
+
+    report = service.submit(jql="project = KAN AND labels = wave-1")
+
+    tracker.search_task_ids.assert_called_once_with("project = KAN AND labels = wave-1", limit=200)
+    assert len(report.items) == 2
+
+
+def test_failed_run_is_reported_with_its_error(service, pool):
+    pool.handlers[JobKind.SCAFFOLDING] = MagicMock(side_effect=RuntimeError("gitlab down"))
+    pool.settings = JobQueueSettings(max_attempts=1, tenant_max_concurrency=10)
+    report = service.submit(issue_keys=["KAN-1"])
+
+    pool.run_pending()
+
+    item = service.report(report.batch_id).items[0]
+    assert item.status == JobStatus.FAILED.value
+    assert "gitlab down" in item.error
+
+
+def test_exactly_one_source_is_required(service):
+    with pytest.raises(ValueError):
+        service.submit()
+    with pytest.raises(ValueError):
+        service.submit(issue_keys=["KAN-1"], jql="project = KAN")
+
+
+def test_batches_are_reported_from_the_shared_store(tmp_path, tracker, research, pool):
+    from software_factory_poc.infrastructure.common.shared_store.sqlite_shared_store import SqliteSharedStore
+
+    path = tmp_path / "shared.sqlite3"
+    submitter = BatchScaffoldingService(
+        tracker=lambda: tracker, research=lambda: research, job_pool=pool, store=SqliteSharedStore(path)
+    )
+    reader = BatchScaffoldingService(
+        tracker=lambda: tracker, research=lambda: research, job_pool=pool, store=SqliteSharedStore(path)
+    )
+
+    report = submitter.submit(issue_keys=["KAN-1", "bad key"])
+
+    shared = reader.report(report.batch_id)
+    assert [item.issue_key for item in shared.items] == [item.issue_key for item in report.items]
+    assert reader.report("unknown") is None
+
+
+def test_outcome_of_a_run_failed_in_another_process_is_reported(tmp_path, tracker, research, service, pool):
+    from software_factory_poc.infrastructure.common.shared_store.sqlite_shared_store import SqliteSharedStore
+
+    store = SqliteSharedStore(tmp_path / "shared.sqlite3")
+    service.store = store
+    pool.handlers[JobKind.SCAFFOLDING] = MagicMock(side_effect=RuntimeError("gitlab down"))
+    pool.settings = JobQueueSettings(max_attempts=1, tenant_max_concurrency=10)
+    report = service.submit(issue_keys=["KAN-1"])
+    pool.run_pending()
+
+    other_queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    other_process = BatchScaffoldingService(
+        tracker=lambda: tracker, research=lambda: research,
+        job_pool=JobWorkerPool(other_queue, {}, JobQueueSettings()), store=store,
+    )
+    item = other_process.report(report.batch_id).items[0]
+    other_queue.close()
+
+    assert (item.status, item.error) == (JobStatus.FAILED.value, "RuntimeError: gitlab down")
+    assert item.elapsed_ms is not None
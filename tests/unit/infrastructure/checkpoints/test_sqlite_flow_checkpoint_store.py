@@ -0,0 +1,83 @@
+import pytest
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
+from software_factory_poc.infrastructure.checkpoints.sqlite_flow_checkpoint_store import SqliteFlowCheckpointStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _task(config=None, key="KAN-1") -> Task:
+    return Task(
+        id="1", key=key, summary="Scaffold", status="To Do", project_key="KAN", issue_type="Task",
+        description=TaskDescription(raw_content="", config=config or {"parameters": {"service_name": "cart"}}),
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    s = SqliteFlowCheckpointStore(tmp_path / "checkpoints.sqlite3", ttl_seconds=60.0, clock=clock)
+    yield s
+    s.close()
+
+
+def test_saved_phases_are_loaded_back(store):
+    task = _task()
+    store.save("scaffolding", task, RunPhase.RESEARCH, "context")
+    store.save("scaffolding", task, RunPhase.REASON, [{"path": "main.py", "content": "x"}])
+
+    assert store.load("scaffolding", task) == {
+        "research": "context",
+        "reason": [{"path": "main.py", "content": "x"}],
+    }
+    assert store.load("code_review", task) == {}
+    assert store.load("scaffolding", _task(key="KAN-2")) == {}
+
+
+def test_checkpoints_survive_a_restart(tmp_path, clock):
+    first = SqliteFlowCheckpointStore(tmp_path / "checkpoints.sqlite3", clock=clock)
+    first.save("scaffolding", _task(), RunPhase.RESEARCH, "context")
+    first.close()
+
+    second = SqliteFlowCheckpointStore(tmp_path / "checkpoints.sqlite3", clock=clock)
+    assert second.load("scaffolding", _task()) == {"research": "context"}
+    second.close()
+
+
+def test_a_changed_config_does_not_resume_and_drops_the_old_checkpoints(store):
+    store.save("scaffolding", _task(), RunPhase.RESEARCH, "context")
+    edited = _task(config={"parameters": {"service_name": "orders"}})
+
+    assert store.load("scaffolding", edited) == {}
+    store.save("scaffolding", edited, RunPhase.RESEARCH, "other context")
+    assert store.load("scaffolding", _task()) == {}
+
+
+def test_expired_checkpoints_are_ignored_and_purged(store, clock):
+    store.save("scaffolding", _task(), RunPhase.RESEARCH, "context")
+    clock.now += 61
+
+    assert store.load("scaffolding", _task()) == {}
+    assert store.purge_expired() == 1
+
+
+def test_clear_forgets_the_flow(store):
+    store.save("scaffolding", _task(), RunPhase.RESEARCH, "context")
+    store.clear("scaffolding", _task())
+    assert store.load("scaffolding", _task()) == {}
+
+
+def test_unserializable_output_is_skipped(store):
+    store.save("scaffolding", _task(), RunPhase.RESEARCH, object())
+    assert store.load("scaffolding", _task()) == {}
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+import pytest
+
+from software_factory_poc.infrastructure.common.async_bridge.background_event_loop import BackgroundEventLoop
+
+
+async def _current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_runs_every_coroutine_on_the_same_loop():
+    event_loop = BackgroundEventLoop()
+    try:
+        assert event_loop.run(_current_loop()) is event_loop.run(_current_loop())
+        assert event_loop.is_running
+    finally:
+        event_loop.close()
+
+
+def test_can_be_called_from_many_threads():
+    event_loop = BackgroundEventLoop()
+    results = []
+
+    async def double(value):
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    threads = [threading.Thread(target=lambda v=v: results.append(event_loop.run(double(v)))) for v in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == [v * 2 for v in range(8)]
+    finally:
+        event_loop.close()
+
+
+def test_propagates_exceptions_to_the_caller():
+    event_loop = BackgroundEventLoop()
+
+    async def boom():
+        raise ValueError("bad request")
+
+    try:
+        with pytest.raises(ValueError, match="bad request"):
+            event_loop.run(boom())
+    finally:
+        event_loop.close()
+
+
+def test_close_stops_the_thread_and_allows_restart():
+    event_loop = BackgroundEventLoop()
+    first = event_loop.run(_current_loop())
+    event_loop.close()
+    assert not event_loop.is_running
+
+    second = event_loop.run(_current_loop())
+    event_loop.close()
+    assert first is not second
@@ -0,0 +1,170 @@
+import threading
+
+import pytest
+
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def refresh_jobs():
+    return []
+
+
+@pytest.fixture
+def cache(clock, refresh_jobs):
+    return ResearchCache(
+        ttl_by_kind={ResearchCacheKind.PAGE: 10.0, ResearchCacheKind.SEARCH: 5.0},
+        stale_window_seconds=20.0,
+        max_entries=2,
+        clock=clock,
+        submit_refresh=refresh_jobs.append,
+    )
+
+
+def test_fresh_entry_is_served_from_cache(cache):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "content"
+
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", loader) == "content"
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", loader) == "content"
+
+    assert len(calls) == 1
+    metrics = cache.metrics()
+    assert metrics.misses == 1
+    assert metrics.hits == 1
+
+
+def test_ttl_is_applied_per_kind(cache, clock):
+    cache.get_or_load(ResearchCacheKind.PAGE, "k", lambda: "page")
+    cache.get_or_load(ResearchCacheKind.SEARCH, "k", lambda: "search")
+
+    clock.now = 7.0
+    cache.get_or_load(ResearchCacheKind.PAGE, "k", lambda: "page-new")
+    cache.get_or_load(ResearchCacheKind.SEARCH, "k", lambda: "search-new")
+
+    metrics = cache.metrics()
+    assert metrics.hits == 1
+    assert metrics.stale_hits == 1
+
+
+def test_stale_entry_is_served_and_refreshed_once(cache, clock, refresh_jobs):
+    cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v1")
+    clock.now = 15.0
+
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v2") == "v1"
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v2") == "v1"
+    assert len(refresh_jobs) == 1
+
+    refresh_jobs[0]()
+
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v3") == "v2"
+    assert cache.metrics().refreshes == 1
+
+
+def test_failed_refresh_keeps_stale_value(cache, clock, refresh_jobs):
+    cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v1")
+    clock.now = 15.0
+
+    def broken():
+        raise RuntimeError("Confluence down")
+
+    cache.get_or_load(ResearchCacheKind.PAGE, "1", broken)
+    refresh_jobs[0]()
+
+    assert cache.peek(ResearchCacheKind.PAGE, "1") == "v1"
+    assert cache.metrics().refresh_failures == 1
+
+
+def test_entry_past_stale_window_is_reloaded(cache, clock, refresh_jobs):
+    cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v1")
+    clock.now = 31.0
+
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "v2") == "v2"
+    assert not refresh_jobs
+
+
+def test_loader_error_is_not_cached(cache):
+    def broken():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load(ResearchCacheKind.PAGE, "1", broken)
+
+    assert cache.get_or_load(ResearchCacheKind.PAGE, "1", lambda: "ok") == "ok"
+
+
+def test_concurrent_misses_share_a_single_load(cache):
+    release = threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return "architecture"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load(ResearchCacheKind.PAGE, "arch", slow_loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.metrics().coalesced < 4:
+        threading.Event().wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["architecture"] * 5
+    assert len(calls) == 1
+
+
+def test_lru_eviction_respects_size_bound(cache):
+    cache.get_or_load(ResearchCacheKind.PAGE, "a", lambda: "a")
+    cache.get_or_load(ResearchCacheKind.PAGE, "b", lambda: "b")
+    cache.get_or_load(ResearchCacheKind.PAGE, "a", lambda: "a")
+    cache.get_or_load(ResearchCacheKind.PAGE, "c", lambda: "c")
+
+    assert cache.peek(ResearchCacheKind.PAGE, "b") is None
+    assert cache.peek(ResearchCacheKind.PAGE, "a") == "a"
+    assert cache.metrics().evictions == 1
+    assert cache.metrics().size == 2
+
+
+def test_shared_tier_serves_entries_loaded_by_another_process(clock):
+    from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+
+    store = InMemorySharedStore(clock=clock)
+    ttl = {ResearchCacheKind.PAGE: 10.0}
+    first = ResearchCache(ttl_by_kind=ttl, stale_window_seconds=20.0, clock=clock, shared_store=store, wall_clock=clock)
+    second = ResearchCache(ttl_by_kind=ttl, stale_window_seconds=20.0, clock=clock, shared_store=store, wall_clock=clock)
+    calls = []
+
+    first.get_or_load(ResearchCacheKind.PAGE, "p1", lambda: calls.append(1) or "content")
+    clock.now += 4
+    value = second.get_or_load(ResearchCacheKind.PAGE, "p1", lambda: calls.append(2) or "reloaded")
+
+    assert value == "content"
+    assert calls == [1]
+    assert second.metrics().shared_hits == 1
+    # The entry keeps the age it had in the shared tier
+    clock.now += 7
+    assert second.get_or_load(ResearchCacheKind.PAGE, "p1", lambda: "late") == "content"
+    assert second.metrics().stale_hits == 1
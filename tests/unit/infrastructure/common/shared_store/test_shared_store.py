@@ -0,0 +1,66 @@
+import pytest
+
+from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+from software_factory_poc.infrastructure.common.shared_store.sqlite_shared_store import SqliteSharedStore
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path, clock):
+    if request.param == "memory":
+        store = InMemorySharedStore(clock=clock)
+    else:
+        store = SqliteSharedStore(tmp_path / "shared.sqlite3", clock=clock)
+    yield store
+    store.close()
+
+
+def test_values_expire(store, clock):
+    store.set("a", "1", ex=10)
+    store.set("b", "2")
+    clock.now += 11
+
+    assert store.get("a") is None
+    assert store.get("b") == "2"
+
+
+def test_set_nx_only_takes_missing_or_expired_keys(store, clock):
+    assert store.set("lease", "p1", ex=10, nx=True)
+    assert not store.set("lease", "p2", ex=10, nx=True)
+    assert store.get("lease") == "p1"
+
+    clock.now += 11
+    assert store.set("lease", "p2", ex=10, nx=True)
+    assert store.get("lease") == "p2"
+
+
+def test_incr_counts_from_zero_and_delete_resets(store):
+    assert store.incr("hits") == 1
+    assert store.incr("hits", 4) == 5
+
+    store.delete("hits")
+    assert store.incr("hits") == 1
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path, clock):
+    first = SqliteSharedStore(tmp_path / "shared.sqlite3", clock=clock)
+    second = SqliteSharedStore(tmp_path / "shared.sqlite3", clock=clock)
+
+    first.set("page", "content", ex=60)
+
+    assert second.get("page") == "content"
+    assert not second.set("page", "other", nx=True)
+    first.close()
+    second.close()
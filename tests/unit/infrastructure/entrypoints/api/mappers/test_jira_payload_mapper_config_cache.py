@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+
+import yaml
+
+from software_factory_poc.infrastructure.entrypoints.api.mappers.jira_payload_mapper import JiraPayloadMapper
+
+DESCRIPTION = "Build it.\n{code:yaml}\nparameters:\n  service_name: billing\nlabels: [a, b]\n{code}"
+
+
+class TestJiraPayloadMapperConfigCache(unittest.TestCase):
+
+    def setUp(self):
+        JiraPayloadMapper._parsed.clear()
+
+    def test_identical_descriptions_are_parsed_once(self):
+        with patch("software_factory_poc.infrastructure.entrypoints.api.mappers.jira_payload_mapper.yaml.load",
+                   wraps=yaml.load) as load:
+            first = JiraPayloadMapper._parse_description_config(DESCRIPTION)
+            second = JiraPayloadMapper._parse_description_config(DESCRIPTION)
+
+        load.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(second.raw_content, "Build it.")
+        self.assertEqual(second.config, {"parameters": {"service_name": "billing"}, "labels": ["a", "b"]})
+
+    def test_callers_cannot_mutate_the_cached_config(self):
+        first = JiraPayloadMapper._parse_description_config(DESCRIPTION)
+        first.config["parameters"]["service_name"] = "changed"
+        first.config["labels"].append("c")
+
+        second = JiraPayloadMapper._parse_description_config(DESCRIPTION)
+
+        self.assertEqual(second.config["parameters"]["service_name"], "billing")
+        self.assertEqual(second.config["labels"], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
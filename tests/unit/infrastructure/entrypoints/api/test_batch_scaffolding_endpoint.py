@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from software_factory_poc.infrastructure.batch.batch_item import BatchItem
+from software_factory_poc.infrastructure.batch.batch_report import BatchReport
+from software_factory_poc.infrastructure.entrypoints.api.batch_dependencies import get_batch_service
+from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
+from software_factory_poc.infrastructure.entrypoints.api.scaffolding_router import router
+from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.jobs.admission_decision import AdmissionDecision
+from software_factory_poc.infrastructure.jobs.admission_outcome import AdmissionOutcome
+
+REPORT = BatchReport(batch_id="b1", created_at=0.0, items=[BatchItem(issue_key="KAN-1", status="queued", job_id="j1")])
+
+
+@pytest.fixture
+def job_pool():
+    pool = MagicMock()
+    pool.admit.return_value = AdmissionDecision(AdmissionOutcome.ADMITTED)
+    return pool
+
+
+@pytest.fixture
+def batch_service():
+    service = MagicMock()
+    service.submit.return_value = REPORT
+    service.report.side_effect = lambda batch_id: REPORT if batch_id == "b1" else None
+    return service
+
+
+@pytest.fixture
+def client(job_pool, batch_service):
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_job_pool] = lambda: job_pool
+    app.dependency_overrides[get_batch_service] = lambda: batch_service
+    app.dependency_overrides[validate_api_key] = lambda: "secret"
+    return TestClient(app)
+
+
+def test_batch_is_accepted_with_its_report(client, batch_service):
+    response = client.post("/api/v1/scaffolding/batch", json={"issue_keys": ["KAN-1"]})
+
+    assert response.status_code == 202
+    assert response.json()["batch_id"] == "b1"
+    assert response.json()["counts"] == {"queued": 1}
+    batch_service.submit.assert_called_once_with(issue_keys=["KAN-1"], jql=None)
+
+
+def test_batch_needs_keys_or_jql(client):
+    assert client.post("/api/v1/scaffolding/batch", json={}).status_code == 422
+    assert client.post("/api/v1/scaffolding/batch", json={"issue_keys": ["KAN-1"], "jql": "x"}).status_code == 422
+
+
+def test_saturated_queue_refuses_the_batch(client, job_pool, batch_service):
+    job_pool.admit.return_value = AdmissionDecision(AdmissionOutcome.SATURATED, queued=10, retry_after_seconds=30)
+
+    response = client.post("/api/v1/scaffolding/batch", json={"jql": "project = KAN"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "30"
+    batch_service.submit.assert_not_called()
+
+
+def test_batch_report_is_served_until_evicted(client):
+    assert client.get("/api/v1/scaffolding/batch/b1").json()["items"][0]["job_id"] == "j1"
+    assert client.get("/api/v1/scaffolding/batch/unknown").status_code == 404
@@ -0,0 +1,104 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
+from software_factory_poc.infrastructure.entrypoints.api.run_dependencies import get_run_registry
+from software_factory_poc.infrastructure.entrypoints.api.runs_router import router
+from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    yield q
+    q.close()
+
+
+@pytest.fixture
+def registry():
+    return RunRegistry()
+
+
+@pytest.fixture
+def client(queue, registry):
+    pool = JobWorkerPool(queue, {}, JobQueueSettings())
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_job_pool] = lambda: pool
+    app.dependency_overrides[get_run_registry] = lambda: registry
+    app.dependency_overrides[validate_api_key] = lambda: "secret"
+    return TestClient(app)
+
+
+def _finished_run(queue, registry) -> str:
+    job = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    registry.start(job.id, "scaffolding", "KAN-1")
+    registry.phase_started(job.id, "validate")
+    registry.phase_finished(job.id, "validate")
+    registry.finish(job.id, JobStatus.SUCCEEDED)
+    queue.complete(job.id)
+    return job.id
+
+
+def test_get_run_returns_status_and_phase_timings(client, queue, registry):
+    run_id = _finished_run(queue, registry)
+
+    body = client.get(f"/api/v1/runs/{run_id}").json()
+
+    assert body["status"] == "succeeded"
+    assert body["issue_key"] == "KAN-1"
+    assert [phase["phase"] for phase in body["phases"]] == ["validate"]
+    assert body["phases"][0]["elapsed_ms"] >= 0
+
+
+def test_unknown_run_is_404(client):
+    assert client.get("/api/v1/runs/missing").status_code == 404
+    assert client.get("/api/v1/runs/missing/events").status_code == 404
+
+
+def test_event_stream_replays_events_and_closes_when_run_ends(client, queue, registry):
+    run_id = _finished_run(queue, registry)
+
+    response = client.get(f"/api/v1/runs/{run_id}/events")
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [line.split(": ", 1)[1] for line in response.text.splitlines() if line.startswith("event: ")]
+    assert events == ["run_started", "phase_started", "phase_finished", "run_finished"]
+
+
+def test_event_stream_resumes_after_last_event_id(client, queue, registry):
+    run_id = _finished_run(queue, registry)
+
+    response = client.get(f"/api/v1/runs/{run_id}/events", headers={"Last-Event-ID": "3"})
+
+    assert "event: run_finished" in response.text
+    assert "event: phase_started" not in response.text
+
+
+def test_event_stream_of_a_run_this_process_never_saw(client, queue):
+    job = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    queue.fail(job.id, "boom")
+
+    response = client.get(f"/api/v1/runs/{job.id}/events")
+
+    assert '"status": "failed"' in response.text
+
+
+def test_run_executed_by_another_process_reports_the_stored_outcome(client, queue):
+    job = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    queue.claim()
+    queue.fail(job.id, "FlowFailedError: RuntimeError: gitlab down")
+
+    body = client.get(f"/api/v1/runs/{job.id}").json()
+
+    assert body["status"] == "failed"
+    assert body["last_error"] == "FlowFailedError: RuntimeError: gitlab down"
+    assert body["elapsed_ms"] is not None
+    assert body["phases"] == []
@@ -0,0 +1,57 @@
+import hashlib
+import hmac
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.entrypoints.api.webhook_authenticator import WebhookAuthenticator
+
+BODY = b'{"webhookEvent": "jira:issue_updated"}'
+
+
+def _signature(secret: str, body: bytes = BODY) -> str:
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def _client(authenticator: WebhookAuthenticator) -> TestClient:
+    app = FastAPI()
+    app.state.webhook_authenticator = authenticator
+
+    @app.post("/hook", dependencies=[Depends(validate_api_key)])
+    async def hook():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_current_and_rotated_secrets_are_accepted():
+    authenticator = WebhookAuthenticator(["new-secret", "old-secret"])
+
+    assert authenticator.verify_api_key("new-secret")
+    assert authenticator.verify_api_key("old-secret")
+    assert not authenticator.verify_api_key("other")
+    assert not authenticator.verify_api_key(None)
+
+
+def test_body_signature_is_verified_against_every_secret():
+    authenticator = WebhookAuthenticator(["new-secret", "old-secret"])
+
+    assert authenticator.verify_signature(BODY, _signature("old-secret"))
+    assert not authenticator.verify_signature(BODY + b" ", _signature("old-secret"))
+    assert not authenticator.verify_signature(BODY, _signature("old-secret").replace("sha256", "sha1"))
+
+
+def test_endpoint_accepts_api_key_or_signature():
+    client = _client(WebhookAuthenticator(["secret"]))
+
+    assert client.post("/hook", content=BODY, headers={"X-API-KEY": "secret"}).status_code == 200
+    assert client.post("/hook", content=BODY, headers={"X-Hub-Signature": _signature("secret")}).status_code == 200
+    assert client.post("/hook", content=BODY, headers={"X-API-KEY": "wrong"}).status_code == 403
+
+
+def test_required_signature_rejects_the_api_key_alone():
+    client = _client(WebhookAuthenticator(["secret"], require_signature=True))
+
+    assert client.post("/hook", content=BODY, headers={"X-API-KEY": "secret"}).status_code == 403
+    assert client.post("/hook", content=BODY, headers={"X-Hub-Signature": _signature("secret")}).status_code == 200
@@ -0,0 +1,109 @@
+import json
+from typing import Union
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.entrypoints.api.job_dependencies import get_job_pool
+from software_factory_poc.infrastructure.entrypoints.api.parsers.jira_webhook_sniffer import JiraWebhookSniffer
+from software_factory_poc.infrastructure.entrypoints.api.scaffolding_router import router
+from software_factory_poc.infrastructure.entrypoints.api.security import validate_api_key
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+
+URL = "/api/v1/webhooks/jira/scaffolding-trigger"
+BODY = b'{"webhookEvent": "jira:issue_updated", "issue": {"id": "10", "key": "KAN-7", "fields": {"project": {"key": "KAN"}}}}'
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    yield q
+    q.close()
+
+
+def _client(queue, **settings) -> TestClient:
+    pool = JobWorkerPool(queue, {}, JobQueueSettings(**settings))
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_job_pool] = lambda: pool
+    app.dependency_overrides[validate_api_key] = lambda: "secret"
+    return TestClient(app)
+
+
+def test_raw_body_is_queued_without_parsing(queue):
+    response = _client(queue).post(URL, content=BODY)
+
+    assert response.status_code == 202
+    assert response.json()["issue_key"] == "KAN-7"
+    job = queue.get(response.json()["job_id"])
+    assert (job.kind, job.tenant) == (JobKind.SCAFFOLDING, "KAN")
+    assert job.payload == {"webhook_body": BODY.decode()}
+
+
+def test_full_queue_answers_429_with_retry_after(queue):
+    client = _client(queue, max_queued_jobs=1, admission_retry_after_seconds=15)
+    assert client.post(URL, content=BODY).status_code == 202
+
+    response = client.post(URL, content=BODY.replace(b"KAN-7", b"KAN-8"))
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "15"
+
+
+def test_payload_without_issue_is_ignored(queue):
+    response = _client(queue).post(URL, content=b'{"webhookEvent": "jira:issue_updated"}')
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ignored"
+    assert queue.queued_count() == 0
+
+
+def test_sniffer_reads_issue_key_not_nested_keys():
+    body = b'{"issue": {"fields": {"parent": {"key": "KAN-1"}, "project": {"key": "OPS"}}, "key": "KAN-12"}}'
+    trigger = JiraWebhookSniffer.sniff(body)
+
+    assert (trigger.issue_key, trigger.project_key) == ("KAN-12", "OPS")
+    assert JiraWebhookSniffer.sniff(b'{"issue": {}}') is None
+    assert JiraWebhookSniffer.sniff(b'{"user": {"key": "KAN-3"}}') is None
+
+
+def test_redelivery_with_new_timestamp_reuses_the_job(queue):
+    client = _client(queue)
+    description = "Please build it\n```yaml\nservice: api\n```"
+    first = client.post(URL, content=_body(timestamp=1, description=description))
+    second = client.post(URL, content=_body(timestamp=2, description=description))
+    job = queue.get(first.json()["job_id"])
+
+    assert second.json()["deduplicated"] is True
+    assert second.json()["job_id"] == job.id
+    assert job.dedup_key == "scaffolding:KAN-7:jira:issue_updated:block:" + JiraWebhookSniffer.config_block_hash(description)
+
+
+def _body(timestamp: int, description: Union[str, dict]) -> bytes:
+    return json.dumps({
+        "timestamp": timestamp,
+        "webhookEvent": "jira:issue_updated",
+        "changelog": {"id": str(timestamp)},
+        "issue": {"key": "KAN-7", "fields": {"project": {"key": "KAN"}, "description": description}},
+    }).encode()
+
+
+def test_config_edit_in_an_adf_description_is_a_new_trigger(queue):
+    client = _client(queue)
+    first = client.post(URL, content=_body(timestamp=1, description=_adf("service: api")))
+    queue.claim()
+    edited = client.post(URL, content=_body(timestamp=2, description=_adf("service: billing")))
+
+    assert JiraWebhookSniffer.config_block_hash(_adf("service: api")) != ""
+    assert edited.json()["deduplicated"] is False
+    assert edited.json()["job_id"] != first.json()["job_id"]
+
+
+def _adf(config: str) -> dict:
+    return {"type": "doc", "version": 1, "content": [
+        {"type": "paragraph", "content": [{"type": "text", "text": "Please build it"}]},
+        {"type": "codeBlock", "attrs": {"language": "yaml"}, "content": [{"type": "text", "text": config}]},
+    ]}
@@ -0,0 +1,100 @@
+import pytest
+
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.fair_job_scheduler import FairJobScheduler
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        self.now += 0.001  # strictly increasing creation times keep FIFO deterministic
+        return self.now
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = SqliteJobQueue(tmp_path / "jobs.sqlite3", clock=FakeClock())
+    yield q
+    q.close()
+
+
+def _fill(queue, tenant: str, count: int, kind: JobKind = JobKind.SCAFFOLDING):
+    for i in range(count):
+        queue.enqueue(kind, f"{tenant}-{i}", {})
+
+
+def _drain(scheduler, queue, n):
+    order = []
+    for _ in range(n):
+        job = scheduler.next_job()
+        order.append(job.tenant)
+        queue.complete(job.id)
+    return order
+
+
+def test_busy_project_does_not_starve_others(queue):
+    _fill(queue, "BIG", 50)
+    _fill(queue, "SMALL", 2)
+    scheduler = FairJobScheduler(queue, JobQueueSettings())
+
+    order = _drain(scheduler, queue, 4)
+
+    assert order.count("SMALL") == 2
+
+
+def test_weights_share_dispatches_proportionally(queue):
+    _fill(queue, "A", 30)
+    _fill(queue, "B", 30)
+    scheduler = FairJobScheduler(queue, JobQueueSettings(tenant_weights={"A": 2.0}))
+
+    order = _drain(scheduler, queue, 30)
+
+    assert order.count("A") == 20
+    assert order.count("B") == 10
+
+
+def test_tenant_cap_limits_running_jobs(queue):
+    _fill(queue, "KAN", 5)
+    scheduler = FairJobScheduler(queue, JobQueueSettings(tenant_max_concurrency=2))
+
+    first, second = scheduler.next_job(), scheduler.next_job()
+
+    assert first and second
+    assert scheduler.next_job() is None
+    queue.complete(first.id)
+    assert scheduler.next_job() is not None
+
+
+def test_code_review_lane_goes_before_scaffolding(queue):
+    _fill(queue, "KAN", 3, JobKind.SCAFFOLDING)
+    queue.enqueue(JobKind.CODE_REVIEW, "OPS-1", {})
+    scheduler = FairJobScheduler(queue, JobQueueSettings())
+
+    assert scheduler.next_job().kind == JobKind.CODE_REVIEW
+
+
+def test_capped_tenant_in_high_lane_lets_lower_lane_run(queue):
+    _fill(queue, "KAN", 2, JobKind.CODE_REVIEW)
+    queue.enqueue(JobKind.SCAFFOLDING, "OPS-1", {})
+    scheduler = FairJobScheduler(queue, JobQueueSettings(tenant_max_concurrency=1))
+
+    assert scheduler.next_job().kind == JobKind.CODE_REVIEW
+    assert scheduler.next_job().issue_key == "OPS-1"
+
+
+def test_metrics_report_queue_depths(queue):
+    _fill(queue, "KAN", 3)
+    queue.enqueue(JobKind.CODE_REVIEW, "OPS-1", {})
+    scheduler = FairJobScheduler(queue, JobQueueSettings())
+    scheduler.next_job()
+
+    metrics = scheduler.metrics()
+
+    assert metrics.total_queued == 3
+    assert metrics.running_by_tenant == {"OPS": 1}
+    assert metrics.queued_by_lane == {"scaffolding": 3}
+    assert metrics.dispatched_by_tenant == {"OPS": 1}
@@ -0,0 +1,240 @@
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.application.core.agents.common.dtos.file_content_dto import FileContentDTO
+from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+from software_factory_poc.application.core.agents.reporter.config.task_tracker_type import TaskTrackerType
+from software_factory_poc.application.core.agents.research.config.research_provider_type import ResearchProviderType
+from software_factory_poc.application.core.agents.scaffolding.config.scaffolding_agent_config import \
+    ScaffoldingAgentConfig
+from software_factory_poc.application.core.agents.scaffolding.scaffolding_agent import ScaffoldingAgent
+from software_factory_poc.application.core.agents.vcs.config.vcs_provider_type import VcsProviderType
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription, TaskUser
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.admission_outcome import AdmissionOutcome
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+from software_factory_poc.infrastructure.jobs.webhook_trigger import WebhookTrigger
+
+
+def _task(key: str = "KAN-1") -> Task:
+    return Task(
+        id="1", key=key, summary="Scaffold", status="To Do", project_key="KAN", issue_type="Task",
+        description=TaskDescription(raw_content="desc", config={"parameters": {"service_name": "cart"}}),
+        reporter=TaskUser(name="dev", display_name="Dev", active=True),
+    )
+
+
+@pytest.fixture
+def settings():
+    return JobQueueSettings(workers=2, max_attempts=2, backoff_base_seconds=0.0, poll_interval_seconds=0.05)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    yield q
+    q.close()
+
+
+def test_submitted_task_is_rebuilt_and_handled(queue, settings):
+    handler = MagicMock()
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: handler}, settings)
+
+    job = pool.submit(JobKind.SCAFFOLDING, _task()).job
+    assert pool.run_pending() == 1
+
+    assert handler.call_args.args[0] == _task()
+    assert queue.get(job.id).status == JobStatus.SUCCEEDED
+
+
+def test_failing_job_is_retried_then_marked_failed(queue, settings):
+    handler = MagicMock(side_effect=RuntimeError("gitlab down"))
+    pool = JobWorkerPool(queue, {JobKind.CODE_REVIEW: handler}, settings)
+
+    job = pool.submit(JobKind.CODE_REVIEW, _task()).job
+    pool.run_pending()
+
+    stored = queue.get(job.id)
+    assert handler.call_count == 2
+    assert stored.status == JobStatus.FAILED
+    assert stored.last_error == "RuntimeError: gitlab down"
+
+
+def _scaffolding_agent() -> ScaffoldingAgent:
+    config = ScaffoldingAgentConfig(
+        vcs_provider=VcsProviderType.GITLAB,
+        tracker_provider=TaskTrackerType.JIRA,
+        research_provider=ResearchProviderType.CONFLUENCE,
+        work_dir=Path("/tmp"),
+        model_name="test-model",
+    )
+    vcs, researcher = MagicMock(), MagicMock()
+    vcs.resolve_project_id.return_value = 1
+    vcs.validate_branch.return_value = None
+    researcher.fan_out.return_value = []
+    agent = ScaffoldingAgent(config, MagicMock(), vcs, researcher, MagicMock())
+    agent.prompt_builder_tool = MagicMock()
+    agent.artifact_parser_tool = MagicMock()
+    agent.artifact_parser_tool.parse_response.return_value = [FileContentDTO(path="main.py", content="x")]
+    return agent
+
+
+def test_agent_run_that_fails_on_the_vcs_is_retried_then_failed(queue, settings):
+    agent = _scaffolding_agent()
+    agent.vcs.commit_files.side_effect = RuntimeError("gitlab down")
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: agent.execute_flow}, settings)
+
+    job = pool.submit(JobKind.SCAFFOLDING, _task()).job
+    pool.run_pending()
+
+    stored = queue.get(job.id)
+    assert agent.vcs.commit_files.call_count == 2
+    assert agent.reporter.report_failure.call_count == 2
+    assert stored.status == JobStatus.FAILED
+    assert stored.last_error == "FlowFailedError: RuntimeError: gitlab down"
+
+
+def test_agent_run_rejected_by_a_provider_fails_without_retry(queue, settings):
+    agent = _scaffolding_agent()
+    agent.vcs.commit_files.side_effect = ProviderError(provider="gitlab", message="forbidden", status_code=403)
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: agent.execute_flow}, settings)
+
+    job = pool.submit(JobKind.SCAFFOLDING, _task()).job
+    pool.run_pending()
+
+    assert agent.vcs.commit_files.call_count == 1
+    assert queue.get(job.id).status == JobStatus.FAILED
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    settings = JobQueueSettings(backoff_base_seconds=5.0, backoff_max_seconds=12.0)
+    pool = JobWorkerPool(MagicMock(), {}, settings)
+
+    assert [pool.backoff_seconds(n) for n in (1, 2, 3)] == [5.0, 10.0, 12.0]
+
+
+def test_workers_process_jobs_and_drain_waits_for_running_job(queue, settings):
+    started, release = threading.Event(), threading.Event()
+    handled = []
+
+    def handler(task):
+        started.set()
+        release.wait(2)
+        handled.append(task.key)
+
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: handler}, settings)
+    pool.start()
+    job = pool.submit(JobKind.SCAFFOLDING, _task()).job
+    assert started.wait(2)
+
+    release.set()
+    assert pool.drain(timeout=2)
+
+    assert handled == ["KAN-1"]
+    assert queue.get(job.id).status == JobStatus.SUCCEEDED
+
+
+def test_duplicate_webhook_is_acknowledged_with_existing_job(queue, settings):
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: MagicMock()}, settings)
+
+    first = pool.submit(JobKind.SCAFFOLDING, _task())
+    second = pool.submit(JobKind.SCAFFOLDING, _task())
+
+    assert first.created
+    assert not second.created
+    assert second.job.id == first.job.id
+    assert pool.run_pending() == 1
+
+
+def test_webhook_body_is_decoded_on_the_worker(queue, settings):
+    handler = MagicMock()
+    decoder = MagicMock(return_value=_task())
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: handler}, settings, webhook_decoder=decoder)
+
+    job = pool.submit_webhook(JobKind.SCAFFOLDING, WebhookTrigger("KAN-1", project_key="OPS"), b'{"issue": {"key": "KAN-1"}}').job
+    assert job.tenant == "OPS"
+    decoder.assert_not_called()
+
+    pool.run_pending()
+    decoder.assert_called_once_with('{"issue": {"key": "KAN-1"}}')
+    handler.assert_called_once_with(_task())
+    assert queue.get(job.id).status == JobStatus.SUCCEEDED
+
+
+def test_redelivered_webhook_body_reuses_the_job(queue, settings):
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: MagicMock()}, settings, webhook_decoder=MagicMock())
+
+    trigger = WebhookTrigger("KAN-1", event_type="jira:issue_updated", config_hash="abc")
+    first = pool.submit_webhook(JobKind.SCAFFOLDING, trigger, b'{"timestamp": 1}')
+    second = pool.submit_webhook(JobKind.SCAFFOLDING, trigger, b'{"timestamp": 2}')
+
+    assert not second.created
+    assert second.job.id == first.job.id
+
+
+def test_webhook_redelivered_while_running_reuses_the_run(queue, settings):
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: MagicMock()}, settings, webhook_decoder=MagicMock())
+    trigger = WebhookTrigger("KAN-1", event_type="jira:issue_updated", config_hash="abc")
+
+    first = pool.submit_webhook(JobKind.SCAFFOLDING, trigger, b'{"timestamp": 1}')
+    assert queue.claim().id == first.job.id
+    second = pool.submit_webhook(JobKind.SCAFFOLDING, trigger, b'{"timestamp": 2}')
+
+    assert not second.created
+    assert second.job.id == first.job.id
+
+
+def test_undecodable_webhook_fails_without_retry(queue, settings):
+    handler = MagicMock()
+    decoder = MagicMock(side_effect=ValueError("no config block"))
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: handler}, settings, webhook_decoder=decoder)
+
+    job = pool.submit_webhook(JobKind.SCAFFOLDING, WebhookTrigger("KAN-1"), b"{}").job
+    pool.run_pending()
+
+    stored = queue.get(job.id)
+    handler.assert_not_called()
+    assert stored.attempts == 1
+    assert stored.status == JobStatus.FAILED
+    assert stored.last_error == "Ignored webhook: no config block"
+
+
+def test_admission_refuses_when_backlog_is_full_or_draining(queue):
+    settings = JobQueueSettings(max_queued_jobs=2, admission_retry_after_seconds=7)
+    pool = JobWorkerPool(queue, {}, settings)
+
+    assert pool.admit().admitted
+    pool.submit(JobKind.SCAFFOLDING, _task("KAN-1"))
+    pool.submit(JobKind.SCAFFOLDING, _task("KAN-2"))
+
+    saturated = pool.admit()
+    assert saturated.outcome == AdmissionOutcome.SATURATED
+    assert (saturated.queued, saturated.retry_after_seconds) == (2, 7)
+
+    pool.drain(timeout=0)
+    assert pool.admit().outcome == AdmissionOutcome.UNAVAILABLE
+
+
+def test_run_scopes_wrap_each_attempt(queue, settings):
+    events = []
+
+    @contextmanager
+    def scope():
+        events.append("enter")
+        yield
+        events.append("exit")
+
+    pool = JobWorkerPool(
+        queue, {JobKind.SCAFFOLDING: lambda task: events.append("run")}, settings, run_scopes=(scope,)
+    )
+    pool.submit(JobKind.SCAFFOLDING, _task())
+    pool.run_pending()
+
+    assert events == ["enter", "run", "exit"]
@@ -0,0 +1,119 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.application.core.agents.common.config.run_phase import RunPhase
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.registry_run_phase_tracker import RegistryRunPhaseTracker
+from software_factory_poc.infrastructure.jobs.run_event_type import RunEventType
+from software_factory_poc.infrastructure.jobs.run_registry import RunRegistry
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+from software_factory_poc.infrastructure.jobs.webhook_trigger import WebhookTrigger
+
+
+@pytest.fixture
+def registry():
+    return RunRegistry()
+
+
+def test_phases_of_the_bound_run_are_recorded_with_timings(registry):
+    tracker = RegistryRunPhaseTracker(registry)
+    registry.start("run-1", "scaffolding", "KAN-1")
+
+    with registry.bind("run-1"):
+        with tracker.phase(RunPhase.VALIDATE):
+            pass
+        with tracker.phase(RunPhase.RESEARCH):
+            pass
+    registry.finish("run-1", JobStatus.SUCCEEDED)
+
+    snapshot = registry.get("run-1")
+    assert snapshot.status == JobStatus.SUCCEEDED
+    assert [p.phase for p in snapshot.phases] == ["validate", "research"]
+    assert all(p.elapsed_ms is not None and p.elapsed_ms >= 0 for p in snapshot.phases)
+    assert [e.type for e in registry.events_after("run-1")] == [
+        RunEventType.RUN_STARTED,
+        RunEventType.PHASE_STARTED, RunEventType.PHASE_FINISHED,
+        RunEventType.PHASE_STARTED, RunEventType.PHASE_FINISHED,
+        RunEventType.RUN_FINISHED,
+    ]
+
+
+def test_phase_outside_a_bound_run_is_ignored(registry):
+    with RegistryRunPhaseTracker(registry).phase(RunPhase.REASON):
+        pass
+    assert registry.get("run-1") is None
+
+
+def test_failed_phase_marks_the_run_failed_even_if_the_agent_swallowed_it(registry):
+    tracker = RegistryRunPhaseTracker(registry)
+    registry.start("run-1", "scaffolding", "KAN-1")
+
+    with registry.bind("run-1"):
+        with pytest.raises(RuntimeError):
+            with tracker.phase(RunPhase.REASON):
+                raise RuntimeError("llm down")
+    registry.finish("run-1", JobStatus.SUCCEEDED)
+
+    snapshot = registry.get("run-1")
+    assert snapshot.status == JobStatus.FAILED
+    assert snapshot.error == "reason: RuntimeError: llm down"
+    assert registry.events_after("run-1", 2)[0].type == RunEventType.PHASE_FAILED
+
+
+def test_oldest_runs_are_evicted():
+    registry = RunRegistry(max_runs=2)
+    for run_id in ("a", "b", "c"):
+        registry.start(run_id, "scaffolding", "KAN-1")
+
+    assert registry.get("a") is None
+    assert registry.get("c") is not None
+
+
+def test_worker_pool_records_each_attempt(tmp_path, registry):
+    queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    tracker = RegistryRunPhaseTracker(registry)
+
+    def handler(task):
+        with tracker.phase(RunPhase.VALIDATE):
+            pass
+
+    decoder = MagicMock()
+    settings = JobQueueSettings(workers=1, backoff_base_seconds=0.0)
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: handler}, settings, webhook_decoder=decoder, run_registry=registry)
+    try:
+        job = pool.submit_webhook(JobKind.SCAFFOLDING, WebhookTrigger("KAN-1"), b"{}").job
+        pool.run_pending()
+    finally:
+        queue.close()
+
+    snapshot = registry.get(job.id)
+    assert (snapshot.status, snapshot.kind, snapshot.issue_key) == (JobStatus.SUCCEEDED, "scaffolding", "KAN-1")
+    assert [p.phase for p in snapshot.phases] == ["validate"]
+
+
+def test_phase_failure_the_handler_swallowed_is_stored_in_the_queue(tmp_path, registry):
+    queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    tracker = RegistryRunPhaseTracker(registry)
+
+    def handler(task):
+        try:
+            with tracker.phase(RunPhase.REASON):
+                raise RuntimeError("llm down")
+        except RuntimeError:
+            pass
+
+    settings = JobQueueSettings(workers=1, max_attempts=1)
+    pool = JobWorkerPool(queue, {JobKind.SCAFFOLDING: handler}, settings, webhook_decoder=MagicMock(), run_registry=registry)
+    try:
+        job = pool.submit_webhook(JobKind.SCAFFOLDING, WebhookTrigger("KAN-1"), b"{}").job
+        pool.run_pending()
+        stored = queue.get(job.id)
+    finally:
+        queue.close()
+
+    assert (stored.status, stored.last_error) == (JobStatus.FAILED, "reason: RuntimeError: llm down")
+    assert registry.get(job.id).status == JobStatus.FAILED
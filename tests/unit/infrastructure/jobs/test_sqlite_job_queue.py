@@ -0,0 +1,176 @@
+import pytest
+
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_status import JobStatus
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def queue(tmp_path, clock):
+    q = SqliteJobQueue(tmp_path / "jobs.sqlite3", clock=clock)
+    yield q
+    q.close()
+
+
+def test_claim_returns_jobs_in_fifo_order(queue, clock):
+    first = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {"key": "KAN-1"})
+    clock.now += 1
+    queue.enqueue(JobKind.CODE_REVIEW, "KAN-2", {"key": "KAN-2"})
+
+    claimed = queue.claim()
+
+    assert claimed.id == first.id
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.attempts == 1
+    assert claimed.payload == {"key": "KAN-1"}
+    assert queue.claim().issue_key == "KAN-2"
+    assert queue.claim() is None
+
+
+def test_retry_later_hides_job_until_backoff_elapses(queue, clock):
+    job = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    queue.claim()
+
+    queue.retry_later(job.id, "boom", delay_seconds=30)
+
+    assert queue.claim() is None
+    clock.now += 31
+    retried = queue.claim()
+    assert retried.id == job.id
+    assert retried.attempts == 2
+    assert retried.last_error == "boom"
+
+
+def test_jobs_survive_restart_and_interrupted_runs_are_requeued(tmp_path, clock):
+    path = tmp_path / "jobs.sqlite3"
+    queue = SqliteJobQueue(path, clock=clock)
+    running = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    waiting = queue.enqueue(JobKind.SCAFFOLDING, "KAN-2", {})
+    queue.claim()
+    queue.close()
+
+    reopened = SqliteJobQueue(path, clock=clock)
+    assert reopened.requeue_interrupted() == 1
+    assert {reopened.claim().id, reopened.claim().id} == {running.id, waiting.id}
+    reopened.close()
+
+
+def test_counts_by_status(queue):
+    done = queue.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    queue.enqueue(JobKind.SCAFFOLDING, "KAN-2", {})
+    queue.claim()
+    queue.complete(done.id)
+
+    counts = queue.counts()
+
+    assert counts["succeeded"] == 1
+    assert counts["queued"] == 1
+    assert counts["running"] == 0
+
+
+def test_identical_trigger_within_window_reuses_finished_run(queue, clock):
+    first = queue.enqueue_unique(JobKind.CODE_REVIEW, "KAN-1", {"v": 1}, dedup_key="k1", window_seconds=60)
+    queue.claim()
+    queue.complete(first.job.id)
+    clock.now += 30
+
+    duplicate = queue.enqueue_unique(JobKind.CODE_REVIEW, "KAN-1", {"v": 1}, dedup_key="k1", window_seconds=60)
+    clock.now += 60
+    later = queue.enqueue_unique(JobKind.CODE_REVIEW, "KAN-1", {"v": 1}, dedup_key="k1", window_seconds=60)
+
+    assert first.created
+    assert not duplicate.created and duplicate.job.id == first.job.id
+    assert later.created and later.job.id != first.job.id
+
+
+def test_pending_run_absorbs_newer_trigger_for_same_issue(queue):
+    first = queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {"v": 1}, dedup_key="k1", window_seconds=60)
+
+    coalesced = queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {"v": 2}, dedup_key="k2", window_seconds=60)
+
+    assert not coalesced.created
+    assert coalesced.job.id == first.job.id
+    assert coalesced.job.payload == {"v": 2}
+    assert queue.counts()["queued"] == 1
+
+
+def test_changed_config_while_running_queues_a_follow_up(queue):
+    first = queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {"v": 1}, dedup_key="k1", window_seconds=60)
+    queue.claim()
+
+    same = queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {"v": 1}, dedup_key="k1", window_seconds=60)
+    changed = queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {"v": 2}, dedup_key="k2", window_seconds=60)
+
+    assert same.job.id == first.job.id
+    assert changed.created
+
+
+def test_failed_run_does_not_suppress_a_retrigger(queue):
+    first = queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {}, dedup_key="k1", window_seconds=60)
+    queue.claim()
+    queue.fail(first.job.id, "boom")
+
+    assert queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {}, dedup_key="k1", window_seconds=60).created
+
+
+def test_queue_files_without_dedup_column_are_migrated(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "old.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jobs (id TEXT PRIMARY KEY, kind TEXT NOT NULL, issue_key TEXT NOT NULL, payload TEXT NOT NULL, "
+        "status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL, "
+        "available_at REAL NOT NULL, created_at REAL NOT NULL, updated_at REAL NOT NULL, last_error TEXT)"
+    )
+    conn.commit()
+    conn.close()
+
+    queue = SqliteJobQueue(path)
+    assert queue.enqueue_unique(JobKind.SCAFFOLDING, "KAN-1", {}, dedup_key="k", window_seconds=1).created
+    queue.close()
+
+
+def test_running_jobs_of_live_owners_are_kept_and_stale_ones_requeued(tmp_path, clock):
+    path = tmp_path / "jobs.sqlite3"
+    worker_a = SqliteJobQueue(path, clock=clock, owner_id="a", stale_after_seconds=60)
+    worker_b = SqliteJobQueue(path, clock=clock, owner_id="b", stale_after_seconds=60)
+    worker_a.heartbeat()
+    worker_b.heartbeat()
+    job = worker_a.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    worker_a.claim()
+
+    assert worker_b.requeue_interrupted() == 0
+
+    clock.now += 61
+    worker_b.heartbeat()
+    assert worker_b.requeue_interrupted() == 1
+    assert worker_b.get(job.id).status == JobStatus.QUEUED
+    worker_a.close()
+    worker_b.close()
+
+
+def test_claim_enforces_the_tenant_cap_across_processes(tmp_path, clock):
+    path = tmp_path / "jobs.sqlite3"
+    worker_a = SqliteJobQueue(path, clock=clock, owner_id="a")
+    worker_b = SqliteJobQueue(path, clock=clock, owner_id="b")
+    worker_a.enqueue(JobKind.SCAFFOLDING, "KAN-1", {})
+    worker_a.enqueue(JobKind.SCAFFOLDING, "KAN-2", {})
+
+    assert worker_a.claim(tenant="KAN", max_running=1) is not None
+    assert worker_b.claim(tenant="KAN", max_running=1) is None
+    worker_a.close()
+    worker_b.close()
@@ -0,0 +1,25 @@
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.task_fingerprint import TaskFingerprint
+
+
+def _task(config: dict, event: str = "jira:issue_updated") -> Task:
+    return Task(
+        id="1", key="KAN-1", summary="s", status="To Do", project_key="KAN", issue_type="Task",
+        description=TaskDescription(raw_content="ignored", config=config), event_type=event,
+    )
+
+
+def test_config_hash_ignores_key_order():
+    a = _task({"version": "1", "parameters": {"service_name": "cart", "lang": "py"}})
+    b = _task({"parameters": {"lang": "py", "service_name": "cart"}, "version": "1"})
+
+    assert TaskFingerprint.config_hash(a) == TaskFingerprint.config_hash(b)
+
+
+def test_dedup_key_changes_with_config_event_and_kind():
+    base = TaskFingerprint.dedup_key(JobKind.SCAFFOLDING, _task({"v": 1}))
+
+    assert TaskFingerprint.dedup_key(JobKind.SCAFFOLDING, _task({"v": 2})) != base
+    assert TaskFingerprint.dedup_key(JobKind.SCAFFOLDING, _task({"v": 1}, event="jira:issue_created")) != base
+    assert TaskFingerprint.dedup_key(JobKind.CODE_REVIEW, _task({"v": 1})) != base
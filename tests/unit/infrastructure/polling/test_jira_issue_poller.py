@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.application.core.domain.entities.task import Task, TaskDescription
+from software_factory_poc.infrastructure.common.shared_store.in_memory_shared_store import InMemorySharedStore
+from software_factory_poc.infrastructure.configuration.jira_polling_settings import JiraPollingSettings
+from software_factory_poc.infrastructure.configuration.job_queue_settings import JobQueueSettings
+from software_factory_poc.infrastructure.jobs.job_kind import JobKind
+from software_factory_poc.infrastructure.jobs.job_worker_pool import JobWorkerPool
+from software_factory_poc.infrastructure.jobs.sqlite_job_queue import SqliteJobQueue
+from software_factory_poc.infrastructure.polling.jira_issue_poller import JiraIssuePoller
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _task(key: str) -> Task:
+    return Task(
+        id=key, key=key, summary="Scaffold", status="To Do", project_key=key.split("-")[0], issue_type="Task",
+        description=TaskDescription(raw_content="", config={"parameters": {"service_name": key.lower()}}),
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker():
+    tracker = MagicMock()
+    tracker.get_tasks.side_effect = lambda keys: [_task(key) for key in keys]
+    return tracker
+
+
+@pytest.fixture
+def pool(tmp_path):
+    queue = SqliteJobQueue(tmp_path / "jobs.sqlite3")
+    yield JobWorkerPool(queue, {}, JobQueueSettings())
+    queue.close()
+
+
+def _poller(tracker, pool, clock, **settings):
+    settings = JiraPollingSettings(scaffolding_jql="project = KAN ORDER BY created DESC", page_size=2, **settings)
+    return JiraIssuePoller(lambda: tracker, pool, settings, store=InMemorySharedStore(clock=clock), clock=clock)
+
+
+def test_changed_issues_are_fetched_in_pages_and_queued(tracker, pool, clock):
+    tracker.search_task_versions.return_value = {"KAN-1": "t1", "KAN-2": "t1", "KAN-3": "t1"}
+    poller = _poller(tracker, pool, clock, initial_lookback_minutes=30)
+
+    [report] = poller.poll_once()
+
+    query = tracker.search_task_versions.call_args.args[0]
+    assert query == "(project = KAN) AND updated >= -30m ORDER BY updated ASC"
+    assert [call.args[0] for call in tracker.get_tasks.call_args_list] == [["KAN-1", "KAN-2"], ["KAN-3"]]
+    assert (report.kind, report.matched, report.changed, report.queued) == ("scaffolding", 3, 3, 3)
+    assert pool.queue.counts()["queued"] == 3
+
+
+def test_next_poll_only_reads_the_window_since_the_cursor_and_skips_unchanged(tracker, pool, clock):
+    tracker.search_task_versions.return_value = {"KAN-1": "t1", "KAN-2": "t1"}
+    poller = _poller(tracker, pool, clock, overlap_seconds=120)
+    poller.poll_once()
+    tracker.get_tasks.reset_mock()
+
+    clock.now += 60
+    tracker.search_task_versions.return_value = {"KAN-1": "t1", "KAN-2": "t2"}
+    [report] = poller.poll_once()
+
+    assert "updated >= -3m" in tracker.search_task_versions.call_args.args[0]
+    tracker.get_tasks.assert_called_once_with(["KAN-2"])
+    assert (report.changed, report.queued, report.deduplicated) == (1, 0, 1)
+
+
+def test_poll_is_skipped_while_the_queue_refuses_work(tracker, pool, clock):
+    pool.settings = JobQueueSettings(max_queued_jobs=1)
+    pool.queue.enqueue(JobKind.SCAFFOLDING, "OPS-1", {})
+    poller = _poller(tracker, pool, clock)
+
+    [report] = poller.poll_once()
+
+    assert report.throttled
+    tracker.search_task_versions.assert_not_called()
+
+
+def test_only_one_process_holds_the_polling_lease(tracker, pool, clock):
+    store = InMemorySharedStore(clock=clock)
+    settings = JiraPollingSettings(scaffolding_jql="project = KAN")
+    first = JiraIssuePoller(lambda: tracker, pool, settings, store=store, clock=clock)
+    second = JiraIssuePoller(lambda: tracker, pool, settings, store=store, clock=clock)
+    second.owner_id = "other-process"
+
+    assert first.is_leader()
+    assert not second.is_leader()
+    assert first.is_leader()
@@ -0,0 +1,83 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.infrastructure.providers.research.clients.confluence_http_client import ConfluenceHttpClient
+
+
+def _response(payload: dict) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+@pytest.fixture
+def client():
+    settings = MagicMock()
+    settings.base_url = "https://wiki.example.com"
+    settings.user_email = "bot@example.com"
+    settings.api_token.get_secret_value.return_value = "secret"
+    return ConfluenceHttpClient(settings)
+
+
+def _fake_children(total: int, report_total: bool):
+    calls = []
+    lock = threading.Lock()
+
+    def fake_get(path, params=None, headers=None):
+        with lock:
+            calls.append(params)
+        start, limit = params["start"], params["limit"]
+        results = [{"id": str(i)} for i in range(start, min(start + limit, total))]
+        payload = {"results": results, "size": len(results), "start": start, "limit": limit}
+        if report_total:
+            payload["totalSize"] = total
+        return _response(payload)
+
+    return fake_get, calls
+
+
+def test_all_child_pages_uses_total_size_to_fetch_remaining_offsets(client):
+    client.get, calls = _fake_children(total=120, report_total=True)
+
+    pages = client.get_all_child_pages("root", limit=50)
+
+    assert [p["id"] for p in pages] == [str(i) for i in range(120)]
+    assert sorted(c["start"] for c in calls) == [0, 50, 100]
+
+
+def test_all_child_pages_probes_in_waves_without_total_size(client):
+    client.get, calls = _fake_children(total=130, report_total=False)
+
+    pages = client.get_all_child_pages("root", limit=10, max_workers=4)
+
+    assert [p["id"] for p in pages] == [str(i) for i in range(130)]
+    # 1 initial batch + 4 waves of 4 requests; the last wave stops at the short batch
+    assert len(calls) == 17
+
+
+def test_single_short_batch_makes_a_single_request(client):
+    client.get, calls = _fake_children(total=3, report_total=True)
+
+    pages = client.get_all_child_pages("root")
+
+    assert len(pages) == 3
+    assert len(calls) == 1
+
+
+def test_metadata_only_does_not_expand_bodies(client):
+    client.get, calls = _fake_children(total=2, report_total=True)
+
+    client.get_all_child_pages("root", metadata_only=True)
+
+    assert calls[0]["expand"] == ConfluenceHttpClient.METADATA_EXPAND
+
+
+def test_get_pages_preserves_requested_order(client):
+    client.get_page = lambda page_id: {"id": page_id}
+
+    pages = client.get_pages(["c", "a", "b"])
+
+    assert [p["id"] for p in pages] == ["c", "a", "b"]
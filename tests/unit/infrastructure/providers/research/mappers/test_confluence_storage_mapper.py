@@ -0,0 +1,77 @@
+from software_factory_poc.infrastructure.providers.research.mappers.confluence_storage_mapper import (
+    ConfluenceStorageMapper,
+)
+
+
+def _build_storage_page(sections: int) -> str:
+    """Builds a storage-format body shaped like our real architecture pages."""
+    return "".join(_build_section(i) for i in range(sections))
+
+
+def _build_section(i: int) -> str:
+    return (
+        f"<h2>Sección {i}</h2>"
+        f"<p>El servicio <strong>orders-{i}</strong> expone   una API REST &amp; publica eventos.\n"
+        f"Las capas siguen Clean Architecture.</p>"
+        "<ul><li>Dominio sin I/O</li><li>Infraestructura<ul><li>Adaptadores</li></ul></li></ul>"
+        "<table><tbody><tr><th>Capa</th><th>Regla</th></tr>"
+        "<tr><td><p>Dominio</p></td><td>Sin dependencias</td></tr></tbody></table>"
+        '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python</ac:parameter>'
+        f"<ac:plain-text-body><![CDATA[class Order{i}:\n    total = 1 < 2]]></ac:plain-text-body>"
+        "</ac:structured-macro>"
+    )
+
+
+def test_headings_and_inline_text_are_compacted():
+    md = ConfluenceStorageMapper.to_markdown("<h1>Arquitectura   base</h1><p>Uno &amp;\n  <b>dos</b></p>")
+
+    assert md == "# Arquitectura base\n\nUno & **dos**"
+
+
+def test_nested_and_ordered_lists_keep_structure():
+    md = ConfluenceStorageMapper.to_markdown(
+        "<ul><li>A<ul><li>A.1</li></ul></li><li>B</li></ul><ol><li>Uno</li><li>Dos</li></ol>"
+    )
+
+    assert md == "- A\n  - A.1\n- B\n\n1. Uno\n2. Dos"
+
+
+def test_tables_render_as_markdown_rows():
+    md = ConfluenceStorageMapper.to_markdown(
+        "<table><tr><th>Capa</th><th>Regla</th></tr><tr><td><p>Dominio</p></td><td>Sin I/O</td></tr></table>"
+    )
+
+    assert md == "| Capa | Regla |\n| --- | --- |\n| Dominio | Sin I/O |"
+
+
+def test_code_macro_becomes_fenced_block_with_language():
+    storage = (
+        '<p>Ejemplo:</p><ac:structured-macro ac:name="code">'
+        '<ac:parameter ac:name="language">yaml</ac:parameter>'
+        "<ac:plain-text-body><![CDATA[service:\n  name: cart]]></ac:plain-text-body>"
+        "</ac:structured-macro>"
+    )
+
+    md = ConfluenceStorageMapper.to_markdown(storage)
+
+    assert md == "Ejemplo:\n\n```yaml\nservice:\n  name: cart\n```"
+
+
+def test_macro_parameters_are_not_leaked_into_text():
+    storage = (
+        '<ac:structured-macro ac:name="info"><ac:parameter ac:name="title">Hidden</ac:parameter>'
+        "<ac:rich-text-body><p>Visible</p></ac:rich-text-body></ac:structured-macro>"
+    )
+
+    assert ConfluenceStorageMapper.to_markdown(storage) == "Visible"
+
+
+def test_large_page_converts_like_its_sections():
+    """Output check only; conversion speed is measured by scripts/benchmark_confluence_storage_conversion.py."""
+    storage = _build_storage_page(sections=400)  # ~250 KB, in line with our largest pages
+
+    md = ConfluenceStorageMapper.to_markdown(storage)
+
+    assert len(storage) > 200_000
+    assert md == "\n\n".join(ConfluenceStorageMapper.to_markdown(_build_section(i)) for i in range(400))
+    assert md.count("```python") == 400
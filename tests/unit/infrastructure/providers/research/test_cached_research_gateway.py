@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock
+
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.providers.research.cached_research_gateway import CachedResearchGateway
+
+
+def _build_cache() -> ResearchCache:
+    return ResearchCache(
+        ttl_by_kind={kind: 60.0 for kind in ResearchCacheKind},
+        max_entries=10,
+    )
+
+
+def test_gateway_calls_are_cached_per_kind():
+    inner = MagicMock()
+    inner.get_page_content.return_value = "page"
+    inner.retrieve_context.return_value = "search"
+    gateway = CachedResearchGateway(inner, _build_cache(), namespace="confluence")
+
+    for _ in range(3):
+        assert gateway.get_page_content("123") == "page"
+        assert gateway.retrieve_context("python standards") == "search"
+        gateway.get_project_context("shopping-cart")
+
+    inner.get_page_content.assert_called_once_with("123")
+    inner.retrieve_context.assert_called_once_with("python standards")
+    inner.get_project_context.assert_called_once_with("shopping-cart")
+
+
+def test_cache_survives_new_gateway_instances():
+    cache = _build_cache()
+    first_inner, second_inner = MagicMock(), MagicMock()
+    first_inner.get_page_content.return_value = "page"
+
+    CachedResearchGateway(first_inner, cache, namespace="confluence").get_page_content("1")
+    result = CachedResearchGateway(second_inner, cache, namespace="confluence").get_page_content("1")
+
+    assert result == "page"
+    second_inner.get_page_content.assert_not_called()
@@ -16,3 +16,30 @@ def test_confluence_html_cleaning():
     assert "Clean Text & More" in clean
     assert "<p>" not in clean
     assert "&amp;" not in clean
+
+
+def _child(page_id: str, version: int) -> dict:
+    return {"id": page_id, "title": f"Doc {page_id}", "version": {"number": version}, "_links": {"webui": f"/{page_id}"}}
+
+
+def _page(page_id: str, text: str) -> dict:
+    return {"id": page_id, "body": {"storage": {"value": f"<p>{text} " + "padding " * 10 + "</p>"}}}
+
+
+def test_project_context_downloads_only_new_or_changed_documents():
+    settings = MagicMock()
+    settings.base_url = "http://confluence.com"
+    provider = ConfluenceProviderImpl(settings)
+    provider.http_client = MagicMock()
+    provider._traverse_path = MagicMock(return_value="folder-1")
+    provider.http_client.get_pages.side_effect = lambda ids: [_page(page_id, f"v-{page_id}") for page_id in ids]
+
+    provider.http_client.get_all_child_pages.return_value = [_child("a", 1), _child("b", 1)]
+    first = provider.get_project_context("cart")
+    provider.http_client.get_all_child_pages.return_value = [_child("a", 1), _child("b", 2)]
+    second = provider.get_project_context("cart")
+
+    provider.http_client.get_all_child_pages.assert_called_with("folder-1", metadata_only=True)
+    assert [call.args[0] for call in provider.http_client.get_pages.call_args_list] == [["a", "b"], ["b"]]
+    assert [doc.content for doc in second.documents] == [doc.content for doc in first.documents]
+    assert second.documents[0].content.startswith("v-a")
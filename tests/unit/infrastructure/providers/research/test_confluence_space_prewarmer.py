@@ -0,0 +1,125 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from software_factory_poc.infrastructure.common.cache.research_cache import ResearchCache
+from software_factory_poc.infrastructure.common.cache.research_cache_kind import ResearchCacheKind
+from software_factory_poc.infrastructure.configuration.research_cache_settings import ResearchCacheSettings
+from software_factory_poc.infrastructure.providers.research.confluence_space_prewarmer import (
+    ConfluenceSpacePrewarmer,
+)
+
+
+@pytest.fixture
+def cache():
+    return ResearchCache(ttl_by_kind={kind: 600.0 for kind in ResearchCacheKind}, max_entries=50)
+
+
+@pytest.fixture
+def provider():
+    provider = MagicMock()
+    provider.space_key = "DDS"
+    provider.render_page.side_effect = lambda page: f"text-{page['id']}-v{page['version']['number']}"
+    return provider
+
+
+@pytest.fixture
+def versions():
+    return {"1": 1, "2": 1}
+
+
+@pytest.fixture
+def prewarmer(provider, cache, versions):
+    provider.http_client.search.side_effect = lambda cql, limit, start, expand: [
+        {"id": pid, "version": {"number": v}} for pid, v in versions.items()
+    ]
+    provider.http_client.get_page_if_modified.side_effect = lambda pid, etag: (
+        {"id": pid, "version": {"number": versions.get(pid, 7)}},
+        f"etag-{pid}",
+    )
+    settings = ResearchCacheSettings(prewarm_enabled=True, prewarm_concurrency=2)
+    return ConfluenceSpacePrewarmer(provider, cache, settings, architecture_page_id="99")
+
+
+def test_first_sync_fetches_space_pages_and_architecture_page(prewarmer, cache, provider):
+    report = prewarmer.sync_once()
+
+    assert report.listed == 3
+    assert report.fetched == 3
+    assert cache.peek(ResearchCacheKind.PAGE, "confluence:1") == "text-1-v1"
+    assert cache.peek(ResearchCacheKind.PAGE, "confluence:99") == "text-99-v7"
+    # Half of the 50-entry cache, one slot kept for the architecture page
+    provider.http_client.search.assert_any_call(
+        'space = "DDS" AND type = page order by lastModified desc', limit=24, start=0, expand="version"
+    )
+
+
+def test_second_sync_only_downloads_changed_pages(prewarmer, cache, provider, versions):
+    prewarmer.sync_once()
+    provider.http_client.get_page_if_modified.reset_mock()
+    versions["2"] = 2
+
+    report = prewarmer.sync_once()
+
+    fetched_ids = sorted(c.args[0] for c in provider.http_client.get_page_if_modified.call_args_list)
+    assert fetched_ids == ["2", "99"]
+    assert report.unchanged == 1
+    assert cache.peek(ResearchCacheKind.PAGE, "confluence:2") == "text-2-v2"
+
+
+def test_not_modified_response_keeps_cached_body(prewarmer, cache, provider):
+    prewarmer.sync_once()
+    provider.http_client.get_page_if_modified.side_effect = lambda pid, etag: (None, etag)
+
+    report = prewarmer.sync_once()
+
+    assert report.fetched == 0
+    assert report.failed == 0
+    last_call = provider.http_client.get_page_if_modified.call_args
+    assert last_call.args == ("99", "etag-99")
+    assert cache.peek(ResearchCacheKind.PAGE, "confluence:99") == "text-99-v7"
+
+
+def test_failed_downloads_are_reported_not_raised(prewarmer, provider):
+    provider.http_client.get_page_if_modified.side_effect = RuntimeError("timeout")
+
+    report = prewarmer.sync_once()
+
+    assert report.failed == 3
+
+
+def test_project_contexts_and_fallback_searches_are_warmed(provider, cache):
+    def search(cql, limit, start, expand):
+        if "title in" in cql:
+            return [{"id": "10"}]
+        if cql.startswith("parent = 10"):
+            return [{"id": "11", "title": "cart"}, {"id": "12", "title": "billing"}]
+        return []
+
+    provider.http_client.search.side_effect = search
+    provider.get_project_context.side_effect = lambda name: f"context-{name}"
+    provider.retrieve_context.side_effect = lambda query: f"search-{query}"
+    settings = ResearchCacheSettings(prewarm_enabled=True, prewarm_technology_stacks=["java"])
+
+    report = ConfluenceSpacePrewarmer(provider, cache, settings).sync_once()
+
+    assert report.fetched == 3
+    assert cache.peek(ResearchCacheKind.PROJECT_CONTEXT, "confluence:cart") == "context-cart"
+    assert cache.peek(ResearchCacheKind.PROJECT_CONTEXT, "confluence:billing") == "context-billing"
+    query = "Architecture standards for java enterprise projects"
+    assert cache.peek(ResearchCacheKind.SEARCH, f"confluence:{query}") == f"search-{query}"
+
+
+def test_sync_fills_at_most_its_share_of_the_cache(provider, versions):
+    versions.update({str(n): 1 for n in range(3, 40)})
+    cache = ResearchCache(ttl_by_kind={kind: 600.0 for kind in ResearchCacheKind}, max_entries=20)
+    provider.http_client.search.side_effect = lambda cql, limit, start, expand: [
+        {"id": pid, "version": {"number": v}} for pid, v in list(versions.items())[:limit]
+    ]
+    provider.http_client.get_page_if_modified.side_effect = lambda pid, etag: ({"id": pid, "version": {"number": 1}}, None)
+    settings = ResearchCacheSettings(prewarm_enabled=True, prewarm_cache_fraction=0.25)
+
+    report = ConfluenceSpacePrewarmer(provider, cache, settings, architecture_page_id="99").sync_once()
+
+    assert report.listed == 5
+    assert cache.peek(ResearchCacheKind.PAGE, "confluence:99") is not None
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock
+
+import httpx
+
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_http_client import JiraHttpClient
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_rate_limiter import JiraRateLimiter
+
+
+class FakeClock:
+    """Time only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: FakeClock, **kwargs) -> JiraRateLimiter:
+    return JiraRateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_bucket_paces_requests_after_the_burst():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate_per_second=2.0, burst=2)
+
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+    assert limiter.metrics().waited_seconds == 1.0
+
+
+def test_throttled_response_pauses_every_caller_and_halves_the_rate():
+    clock = FakeClock()
+    limiter = _limiter(clock, rate_per_second=10.0, burst=5)
+
+    delay = limiter.observe(httpx.Response(429, headers={"Retry-After": "3", "X-RateLimit-Remaining": "0"}))
+    waited = limiter.acquire()
+
+    assert delay == 3.0
+    assert waited == 3.0
+    metrics = limiter.metrics()
+    assert (metrics.throttled, metrics.rate_per_second, metrics.remaining) == (1, 5.0, 0)
+
+
+def test_near_limit_slows_down_and_successes_recover():
+    limiter = _limiter(FakeClock(), rate_per_second=10.0)
+
+    limiter.observe(httpx.Response(200, headers={"X-RateLimit-NearLimit": "true"}))
+    assert limiter.metrics().rate_per_second == 7.5
+    for _ in range(10):
+        limiter.observe(httpx.Response(200))
+    assert limiter.metrics().rate_per_second == 10.0
+
+
+def test_client_resends_throttled_requests_after_retry_after():
+    clock = FakeClock()
+    responses = iter([httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={"ok": True})])
+    settings = MagicMock(base_url="https://jira.example", auth_mode=None)
+    client = JiraHttpClient(settings, rate_limiter=_limiter(clock))
+    client._client = httpx.Client(transport=httpx.MockTransport(lambda request: next(responses)))
+
+    response = client.get("rest/api/3/myself")
+
+    assert response.json() == {"ok": True}
+    assert clock.sleeps == [2.0]
+    metrics = client.rate_limit_metrics()
+    assert (metrics.requests, metrics.throttled, metrics.retries) == (2, 1, 1)
+
+
+def test_client_gives_up_when_retry_after_exceeds_the_limit():
+    clock = FakeClock()
+    settings = MagicMock(base_url="https://jira.example", auth_mode=None)
+    client = JiraHttpClient(settings, rate_limiter=_limiter(clock), max_retry_after_seconds=30)
+    client._client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(429, headers={"Retry-After": "120"})))
+
+    assert client.get("rest/api/3/myself").status_code == 429
+    assert clock.sleeps == []
@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import MagicMock
+
+from software_factory_poc.application.core.domain.entities.task import TaskDescription
+from software_factory_poc.infrastructure.configuration.jira_settings import JiraSettings
+from software_factory_poc.infrastructure.providers.tracker.clients.jira_http_client import JiraHttpClient
+from software_factory_poc.infrastructure.providers.tracker.jira_issue_cache import JiraIssueCache
+from software_factory_poc.infrastructure.providers.tracker.jira_provider_impl import JiraProviderImpl
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_description_patcher import (
+    JiraAdfDescriptionPatcher,
+)
+
+
+def _doc(*nodes):
+    return {"version": 1, "type": "doc", "content": list(nodes)}
+
+
+def _paragraph(text):
+    return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
+
+
+def _code(text, language="yaml"):
+    return {"type": "codeBlock", "attrs": {"language": language}, "content": [{"type": "text", "text": text}]}
+
+
+class TestJiraAdfDescriptionPatcher(unittest.TestCase):
+
+    def test_replaces_only_the_yaml_code_block(self):
+        intro, snippet = _paragraph("Build the service."), _code("print('hi')", language="python")
+        document = _doc(intro, snippet, _code("version: '1.0'"))
+
+        patched, changed = JiraAdfDescriptionPatcher.patch(document, "version: '2.0'")
+
+        self.assertTrue(changed)
+        self.assertIs(patched["content"][0], intro)
+        self.assertIs(patched["content"][1], snippet)
+        self.assertEqual(patched["content"][2], _code("version: '2.0'"))
+        self.assertEqual(document["content"][2], _code("version: '1.0'"))
+
+    def test_unchanged_block_is_reported(self):
+        document = _doc(_paragraph("Text"), _code("a: 1"))
+
+        patched, changed = JiraAdfDescriptionPatcher.patch(document, "a: 1")
+
+        self.assertFalse(changed)
+        self.assertIs(patched, document)
+
+    def test_replaces_hand_written_fence_paragraph(self):
+        document = _doc(_paragraph("Text"), _paragraph("{code:yaml}a: 1{code}"))
+
+        patched, _ = JiraAdfDescriptionPatcher.patch(document, "a: 2")
+
+        self.assertEqual(patched["content"], [_paragraph("Text"), _code("a: 2")])
+
+    def test_appends_block_when_none_exists(self):
+        patched, changed = JiraAdfDescriptionPatcher.patch(_doc(_paragraph("Text")), "a: 1")
+
+        self.assertTrue(changed)
+        self.assertEqual(patched["content"][-1], _code("a: 1"))
+
+
+class TestJiraProviderDescriptionPatching(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MagicMock(spec=JiraHttpClient)
+        self.provider = JiraProviderImpl(self.client, MagicMock(spec=JiraSettings))
+        self.enterContext(JiraIssueCache.run_scope())
+        issue = {"key": "KAN-1", "fields": {"description": _doc(_paragraph("Build it."), _code("a: 1"))}}
+        self.provider.issues.put(issue)
+
+    def test_patches_the_document_read_last(self):
+        self.provider.update_task_description("KAN-1", TaskDescription(raw_content="", config={"a": 2}))
+
+        self.client.get.assert_not_called()
+        payload = self.client.put.call_args[0][1]["fields"]["description"]
+        self.assertEqual(payload["content"], [_paragraph("Build it."), _code("a: 2")])
+
+    def test_skips_write_when_config_is_unchanged(self):
+        self.provider.update_task_description("KAN-1", TaskDescription(raw_content="", config={"a": 1}))
+
+        self.client.put.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_adf_description_patcher import (
+    JiraAdfDescriptionPatcher,
+)
+from software_factory_poc.infrastructure.providers.tracker.mappers.jira_description_mapper import JiraDescriptionMapper
+
+
+def _text(text):
+    return {"type": "text", "text": text}
+
+
+def _paragraph(*inlines):
+    return {"type": "paragraph", "content": list(inlines)}
+
+
+def _code(text, language="yaml"):
+    return {"type": "codeBlock", "attrs": {"language": language}, "content": [_text(text)]}
+
+
+def _panel(*nodes):
+    return {"type": "panel", "attrs": {"panelType": "info"}, "content": list(nodes)}
+
+
+class TestJiraAdfTextWalker(unittest.TestCase):
+
+    def setUp(self):
+        self.mapper = JiraDescriptionMapper()
+
+    def test_nested_blocks_are_kept_and_config_comes_from_the_code_block(self):
+        document = {"type": "doc", "content": [
+            _paragraph(_text("Build the service"), {"type": "hardBreak"}, _text("for "), {"type": "mention", "attrs": {"text": "@ana"}}),
+            {"type": "bulletList", "content": [{"type": "listItem", "content": [_paragraph(_text("Item one"))]}]},
+            {"type": "table", "content": [{"type": "tableRow", "content": [{"type": "tableCell", "content": [_paragraph(_text("Cell"))]}]}]},
+            _panel(_code("version: '1.0'\ntarget:\n  gitlab_project_id: 7")),
+        ]}
+
+        description = self.mapper.to_domain(document)
+
+        self.assertEqual(description.raw_content, "Build the service\nfor @ana\n\nItem one\n\nCell")
+        self.assertEqual(description.config, {"version": "1.0", "target": {"gitlab_project_id": 7}})
+
+    def test_plain_text_fence_falls_back_to_the_pattern(self):
+        document = {"type": "doc", "content": [_paragraph(_text("Text")), _paragraph(_text("```yaml\na: 1\n```"))]}
+
+        description = self.mapper.to_domain(document)
+
+        self.assertEqual((description.raw_content, description.config), ("Text", {"a": 1}))
+
+    def test_patcher_replaces_the_nested_block_the_mapper_reads(self):
+        document = {"type": "doc", "content": [_paragraph(_text("Text")), _panel(_code("a: 1"))]}
+
+        patched, changed = JiraAdfDescriptionPatcher.patch(document, "a: 2")
+
+        self.assertTrue(changed)
+        self.assertIs(patched["content"][0], document["content"][0])
+        self.assertEqual(self.mapper.to_domain(patched).config, {"a": 2})
+        self.assertEqual(len(patched["content"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
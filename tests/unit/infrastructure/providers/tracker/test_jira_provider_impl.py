@@ -1,8 +1,17 @@
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from software_factory_poc.application.core.agents.common.config.task_status import TaskStatus
 from software_factory_poc.application.core.agents.common.exceptions.provider_error import ProviderError
+from software_factory_poc.application.core.agents.reporter.config.tracker_operation_kind import TrackerOperationKind
+from software_factory_poc.application.core.agents.reporter.dtos.tracker_operation_dto import TrackerOperationDTO
+from software_factory_poc.application.core.agents.reporter.tracker_channel import TrackerChannel
+from software_factory_poc.application.core.agents.reporter.tracker_outbox import TrackerOutbox
+from software_factory_poc.application.core.domain.entities.task import TaskDescription
+from software_factory_poc.infrastructure.providers.tracker.dtos.jira_status_enum import JiraStatus
+from software_factory_poc.infrastructure.providers.tracker.jira_issue_cache import JiraIssueCache
 from software_factory_poc.infrastructure.providers.tracker.jira_provider_impl import JiraProviderImpl
 
 
@@ -91,3 +100,214 @@ def test_get_task_mapping_success(mock_client, mock_settings):
     assert task.project_key == "POC" # This line verifies the mapping fix
     assert task.description is not None
 
+
+
+def _issue(key):
+    return {
+        "id": "1", "key": key,
+        "fields": {"summary": f"Scaffold {key}", "project": {"key": "KAN"}, "status": {"name": "To Do"}},
+    }
+
+
+def _response(json_data=None, status_code=200):
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = json_data or {}
+    if status_code >= 400:
+        request = httpx.Request("POST", "https://jira/rest/api/3/search/jql")
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "error", request=request, response=httpx.Response(status_code, request=request)
+        )
+    return response
+
+
+def test_get_tasks_fetches_all_keys_with_one_search(mock_client, mock_settings):
+    mock_client.post.return_value = _response({"issues": [_issue("KAN-1"), _issue("KAN-2")], "isLast": True})
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    tasks = provider.get_tasks(["KAN-1", "KAN-2"])
+
+    assert [task.key for task in tasks] == ["KAN-1", "KAN-2"]
+    path, payload = mock_client.post.call_args.args
+    assert path == "rest/api/3/search/jql"
+    assert payload["jql"] == "key in (KAN-1, KAN-2)"
+    mock_client.get.assert_not_called()
+
+
+def test_get_tasks_skips_unknown_keys_when_jira_rejects_the_query(mock_client, mock_settings):
+    mock_client.post.return_value = _response(status_code=400)
+    mock_client.get.side_effect = [_response(_issue("KAN-1")), _response(status_code=404)]
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    tasks = provider.get_tasks(["KAN-1", "KAN-404"])
+
+    assert [task.key for task in tasks] == ["KAN-1"]
+
+
+def test_search_task_ids_follows_page_tokens_up_to_the_limit(mock_client, mock_settings):
+    mock_client.post.side_effect = [
+        _response({"issues": [_issue("KAN-1"), _issue("KAN-2")], "nextPageToken": "p2", "isLast": False}),
+        _response({"issues": [_issue("KAN-3")], "isLast": True}),
+    ]
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    keys = provider.search_task_ids("project = KAN", limit=3)
+
+    assert keys == ["KAN-1", "KAN-2", "KAN-3"]
+    assert mock_client.post.call_args_list[1].args[1]["nextPageToken"] == "p2"
+    assert mock_client.post.call_args_list[1].args[1]["maxResults"] == 1
+
+
+def test_search_task_versions_reads_only_the_updated_field(mock_client, mock_settings):
+    issue = {"key": "KAN-1", "fields": {"updated": "2024-05-01T10:00:00.000+0000"}}
+    mock_client.post.return_value = _response({"issues": [issue], "isLast": True})
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    versions = provider.search_task_versions("project = KAN", limit=10, page_size=5)
+
+    assert versions == {"KAN-1": "2024-05-01T10:00:00.000+0000"}
+    payload = mock_client.post.call_args.args[1]
+    assert payload["fields"] == ["updated"]
+    assert payload["maxResults"] == 5
+
+
+def _transition_issue_response():
+    return _response({
+        "fields": {"project": {"key": "KAN"}, "issuetype": {"name": "Task"}, "status": {"name": "To Do"}},
+        "transitions": [{"id": "21", "name": "Start", "to": {"name": "In Progress"}}],
+    })
+
+
+def test_transitions_are_cached_per_project_issue_type_and_status(mock_client, mock_settings):
+    mock_client.get.return_value = _transition_issue_response()
+    mock_client.post.return_value = _response()
+    provider = JiraProviderImpl(mock_client, mock_settings)
+    provider.transition_issue("KAN-1", "Start")
+    mock_client.get.reset_mock()
+
+    # Another issue known to be in the same workflow state: no transitions request
+    provider.transitions.remember("KAN-2", "KAN", "Task", "To Do")
+    provider.transition_issue("KAN-2", "Start")
+
+    mock_client.get.assert_not_called()
+    assert mock_client.post.call_args.args == ("rest/api/3/issue/KAN-2/transitions", {"transition": {"id": "21"}})
+
+
+def test_rejected_cached_transition_is_refreshed_and_retried(mock_client, mock_settings):
+    mock_client.get.return_value = _transition_issue_response()
+    provider = JiraProviderImpl(mock_client, mock_settings)
+    provider.transitions.put("KAN-1", "KAN", "Task", "To Do", [{"id": "99", "name": "Start", "to": {"name": "Doing"}}])
+    mock_client.post.side_effect = [_response(status_code=400), _response()]
+
+    provider.transition_issue("KAN-1", "Start")
+
+    assert [call.args[1]["transition"]["id"] for call in mock_client.post.call_args_list] == ["99", "21"]
+    mock_client.get.assert_called_once()
+
+
+def test_issue_reads_are_projected_and_cached(mock_client, mock_settings):
+    mock_client.get.return_value = _response(_issue("KAN-1"))
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    with JiraIssueCache.run_scope():
+        provider.get_task("KAN-1")
+        provider.append_issue_description("KAN-1", "Merge request opened")
+
+    mock_client.get.assert_called_once_with(
+        "rest/api/3/issue/KAN-1?fields=summary,status,project,issuetype,description"
+    )
+
+
+def test_issue_cache_does_not_outlive_the_run(mock_client, mock_settings):
+    mock_client.get.return_value = _response(_issue("KAN-1"))
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    with JiraIssueCache.run_scope():
+        provider.get_task("KAN-1")
+    with JiraIssueCache.run_scope():
+        provider.get_task("KAN-1")
+    provider.get_task("KAN-1")
+    provider.get_task("KAN-1")
+
+    assert mock_client.get.call_count == 4
+
+
+def test_own_writes_update_the_cached_issue(mock_client, mock_settings):
+    mock_client.get.side_effect = [_response(_issue("KAN-1")), _transition_issue_response()]
+    mock_client.post.return_value = _response()
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    with JiraIssueCache.run_scope():
+        provider.get_task("KAN-1")
+        provider.append_issue_description("KAN-1", "Done")
+        provider.transition_issue("KAN-1", "Start")
+        task = provider.get_task("KAN-1")
+        description = provider.get_issue("KAN-1")["fields"]["description"]
+
+    assert task.status == "In Progress"
+    assert description["content"][-1]["content"][0]["text"] == "\nDone"
+    assert mock_client.get.call_count == 2
+
+
+def test_writes_delivered_through_the_channel_update_the_run_cache(mock_client, mock_settings):
+    mock_client.get.return_value = _response(_issue("KAN-1"))
+    mock_client.put.return_value = _response()
+    provider = JiraProviderImpl(mock_client, mock_settings)
+    channel = TrackerChannel(TrackerOutbox(provider), lanes=1, max_pending=10)
+    description = TaskDescription(raw_content="Scaffold", config={"version": "1.0"})
+
+    with JiraIssueCache.run_scope():
+        provider.get_task("KAN-1")
+        channel.post([TrackerOperationDTO(kind=TrackerOperationKind.DESCRIPTION, task_id="KAN-1", payload=description)])
+        assert channel.flush("KAN-1", timeout=2)
+        stored = provider.get_issue("KAN-1")["fields"]["description"]
+
+    assert stored == mock_client.put.call_args.args[1]["fields"]["description"]
+    mock_client.get.assert_called_once()
+    channel.close()
+
+
+def test_bulk_transitions_fetch_each_workflow_state_once(mock_client, mock_settings):
+    state = {"project": {"key": "KAN"}, "issuetype": {"name": "Task"}, "status": {"name": "To Do"}}
+    search = _response({"issues": [{"key": f"KAN-{n}", "fields": state} for n in (1, 2, 3)], "isLast": True})
+    mock_client.post.side_effect = lambda path, payload: search if path.endswith("search/jql") else _response()
+    mock_client.get.return_value = _response({
+        "fields": state, "transitions": [{"id": "21", "name": "Start", "to": {"name": JiraStatus.IN_PROGRESS.value}}],
+    })
+    provider = JiraProviderImpl(mock_client, mock_settings)
+
+    results = provider.transition_statuses({f"KAN-{n}": TaskStatus.IN_PROGRESS for n in (1, 2, 3)})
+
+    assert [(r.task_id, r.succeeded) for r in results] == [("KAN-1", True), ("KAN-2", True), ("KAN-3", True)]
+    mock_client.get.assert_called_once()
+    transition_posts = [c for c in mock_client.post.call_args_list if c.args[0].endswith("/transitions")]
+    assert len(transition_posts) == 3
+
+
+def test_bulk_comments_report_failures_per_issue(mock_client, mock_settings):
+    def add_comment(issue_key, body):
+        if issue_key == "KAN-2":
+            raise ValueError("boom")
+        return {}
+
+    provider = JiraProviderImpl(mock_client, mock_settings)
+    provider.add_comment = add_comment
+
+    results = provider.add_comments({"KAN-1": "a", "KAN-2": "b"})
+
+    assert results[0].succeeded is True
+    assert (results[1].task_id, results[1].succeeded, results[1].error) == ("KAN-2", False, "ValueError: boom")
+
+
+def test_errors_are_classified_by_status_code(mock_client, mock_settings):
+    provider = JiraProviderImpl(mock_client, mock_settings)
+    request = httpx.Request("GET", "https://jira/rest/api/3/issue/KAN-1")
+    throttled = httpx.HTTPStatusError("error 4290", request=request, response=httpx.Response(429, request=request))
+    missing = httpx.HTTPStatusError("error 500 in text", request=request, response=httpx.Response(404, request=request))
+
+    with pytest.raises(ProviderError) as retryable:
+        provider._handle_error(throttled, "get_issue(KAN-1)")
+    with pytest.raises(ProviderError) as final:
+        provider._handle_error(missing, "get_issue(KAN-1)")
+
+    assert (retryable.value.retryable, retryable.value.status_code) == (True, 429)
+    assert (final.value.retryable, final.value.status_code) == (False, 404)
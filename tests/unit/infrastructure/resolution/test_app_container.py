@@ -0,0 +1,110 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from software_factory_poc.application.core.agents.common.tools.null_flow_checkpoint_store import NullFlowCheckpointStore
+from software_factory_poc.infrastructure.checkpoints.sqlite_flow_checkpoint_store import SqliteFlowCheckpointStore
+from software_factory_poc.infrastructure.resolution.app_container import AppContainer
+from software_factory_poc.infrastructure.resolution.provider_resolver import ProviderResolver
+
+RESOLVER_MODULE = "software_factory_poc.infrastructure.resolution.provider_resolver"
+
+
+def _resolver(**kwargs) -> ProviderResolver:
+    return ProviderResolver(MagicMock(), app_config=MagicMock(), settings=MagicMock(), **kwargs)
+
+
+def _app_config() -> MagicMock:
+    app_config = MagicMock()
+    app_config.checkpoints.enabled = False
+    return app_config
+
+
+def _container() -> AppContainer:
+    return AppContainer(settings=MagicMock(), app_config=_app_config(), scaffolding_config=MagicMock())
+
+
+def test_shared_resolver_builds_each_gateway_once():
+    resolver = _resolver(shared=True)
+    with patch.object(resolver, "_build_tracker", side_effect=lambda: object()) as build:
+        assert resolver.resolve_tracker() is resolver.resolve_tracker()
+    assert build.call_count == 1
+
+
+def test_default_resolver_builds_fresh_gateways():
+    resolver = _resolver()
+    with patch.object(resolver, "_build_tracker", side_effect=lambda: object()) as build:
+        assert resolver.resolve_tracker() is not resolver.resolve_tracker()
+    assert build.call_count == 2
+
+
+def test_llm_gateway_is_only_shared_with_a_background_loop():
+    without_loop = _resolver(shared=True)
+    with_loop = _resolver(shared=True, event_loop=MagicMock())
+    with patch(f"{RESOLVER_MODULE}.LlmProviderFactory.build_providers", return_value={}), \
+            patch(f"{RESOLVER_MODULE}.CompositeLlmGateway", side_effect=lambda *a, **k: object()):
+        assert without_loop.resolve_llm_gateway() is not without_loop.resolve_llm_gateway()
+        assert with_loop.resolve_llm_gateway() is with_loop.resolve_llm_gateway()
+
+
+def test_injected_settings_are_not_rebuilt():
+    with patch(f"{RESOLVER_MODULE}.Settings") as settings_cls:
+        _resolver()
+    settings_cls.assert_not_called()
+
+
+def test_container_reuses_use_cases_and_resolver():
+    container = _container()
+    try:
+        assert container.scaffolding_usecase() is container.scaffolding_usecase()
+        assert container.scaffolding_usecase().resolver is container.resolver
+        assert container.resolver.shared
+        assert container.resolver.event_loop is container.event_loop
+    finally:
+        container.close()
+
+
+def test_container_loads_configuration_once_under_concurrency():
+    container = AppContainer(settings=MagicMock(), app_config=_app_config())
+    with patch("software_factory_poc.infrastructure.resolution.app_container.ScaffoldingConfigLoader.load_config",
+               return_value=MagicMock()) as load_config:
+        threads = [threading.Thread(target=container.scaffolding_usecase) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert load_config.call_count == 1
+    container.close()
+
+
+def test_warm_up_builds_every_gateway():
+    container = _container()
+    resolver = MagicMock()
+    container._instances["resolver"] = resolver
+    with patch("software_factory_poc.infrastructure.resolution.app_container.CreateScaffoldingUseCase"):
+        elapsed_ms = container.warm_up()
+
+    assert elapsed_ms >= 0
+    resolver.resolve_tracker.assert_called_once()
+    resolver.resolve_vcs.assert_called_once()
+    resolver.resolve_research.assert_called_once()
+    resolver.resolve_llm_gateway.assert_called_once()
+    container.close()
+
+
+def test_checkpoint_store_is_shared_with_the_resolver(tmp_path):
+    app_config = MagicMock()
+    app_config.checkpoints.enabled = True
+    app_config.checkpoints.db_path = tmp_path / "checkpoints.sqlite3"
+    app_config.checkpoints.ttl_seconds = 60.0
+    container = AppContainer(settings=MagicMock(), app_config=app_config, scaffolding_config=MagicMock())
+    try:
+        assert isinstance(container.checkpoint_store, SqliteFlowCheckpointStore)
+        assert container.resolver.resolve_checkpoint_store() is container.checkpoint_store
+    finally:
+        container.close()
+
+
+def test_disabled_checkpoints_use_the_null_store():
+    container = _container()
+    assert isinstance(container.resolver.resolve_checkpoint_store(), NullFlowCheckpointStore)
+    container.close()
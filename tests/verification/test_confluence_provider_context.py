@@ -17,6 +17,11 @@ class TestConfluenceProviderContext(unittest.TestCase):
         # Mock HttpClient
         self.provider = ConfluenceProviderImpl(self.mock_settings)
         self.provider.http_client = MagicMock()
+        # Children are listed without bodies; the bodies come from get_pages
+        self.provider.http_client.get_pages.side_effect = lambda ids: [
+            next(page for page in self.provider.http_client.get_all_child_pages.return_value if page["id"] == page_id)
+            for page_id in ids
+        ]
         # Force space key for consistency
         self.provider.space_key = "DDS"
 
@@ -28,7 +33,7 @@ class TestConfluenceProviderContext(unittest.TestCase):
         ]
         
         # 2. Setup Children Fetch
-        self.provider.http_client.get_child_pages.return_value = [
+        self.provider.http_client.get_all_child_pages.return_value = [
             {
                 "id": "doc-1", 
                 "title": "Architecture", 
@@ -99,7 +104,7 @@ class TestConfluenceProviderContext(unittest.TestCase):
         ]
         
         # 3. Setup Children Fetch
-        self.provider.http_client.get_child_pages.return_value = [
+        self.provider.http_client.get_all_child_pages.return_value = [
             {
                 "id": "doc-A", 
                 "title": "Doc A", 
@@ -146,7 +151,7 @@ class TestConfluenceProviderContext(unittest.TestCase):
         ]
         
         # 3. Setup Children
-        self.provider.http_client.get_child_pages.return_value = [
+        self.provider.http_client.get_all_child_pages.return_value = [
             {"id": "d1", "title": "T1", "body": "...", "_links": {}, "space": {}}
         ]
 
@@ -172,7 +177,7 @@ class TestConfluenceProviderContext(unittest.TestCase):
             ]
         ]
         
-        self.provider.http_client.get_child_pages.return_value = [
+        self.provider.http_client.get_all_child_pages.return_value = [
              {"id": "d1", "title": "Doc1", "body": "...", "_links": {}, "space": {}}
         ]
         
@@ -201,7 +206,7 @@ class TestConfluenceProviderContext(unittest.TestCase):
             ]
         ]
         
-        self.provider.http_client.get_child_pages.return_value = []
+        self.provider.http_client.get_all_child_pages.return_value = []
         
         # 3. Execute
         ctx = self.provider.get_project_context("shopping-cart")
@@ -96,7 +96,7 @@ class TestFullFlowVerification(unittest.TestCase):
         provider.http_client.search.side_effect = search_side_effect
 
         # Call 3: GET CHILDREN of FOLDER_200
-        provider.http_client.get_child_pages.return_value = [
+        provider.http_client.get_all_child_pages.return_value = [
             {
                 "id": "1001", 
                 "title": "Requisitos Funcionales", 
@@ -112,6 +112,7 @@ class TestFullFlowVerification(unittest.TestCase):
                 "space": {"key": "DDS"}
             }
         ]
+        provider.http_client.get_pages.return_value = provider.http_client.get_all_child_pages.return_value
 
         # 3. Execution
         context = provider.get_project_context("shopping-cart")